@@ -0,0 +1,249 @@
+"""
+Client back office API endpoints.
+
+This module exposes the stored contact submissions to internal tools:
+listing, detail, update and delete. Routes are only registered when an
+admin API key is configured, and every call must send it as a bearer
+token. Reads support sparse fieldsets and conditional requests.
+"""
+
+import hmac
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.responses import (
+    PydanticJSONResponse,
+    body_etag,
+    encode_rows,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.models.client import Client
+from app.repositories.client_repository import ClientRepository
+from app.schemas.client import ClientPage, ClientResponse, ClientUpdate
+
+# Fields a caller may select; the id is always returned
+FIELDS = tuple(ClientResponse.model_fields)
+
+# Listings leave the unbounded TEXT column out unless it is asked for
+DEFAULT_LIST_FIELDS = tuple(name for name in FIELDS if name != "message")
+
+MAX_PAGE_SIZE = 10_000
+
+# Let clients keep responses but revalidate them with If-None-Match
+CACHE_HEADERS = {"Cache-Control": "private, no-cache"}
+
+bearer = HTTPBearer(auto_error=False)
+
+
+def require_admin_api_key(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer),
+) -> None:
+    """
+    Check the bearer token against the admin API key.
+
+    Args:
+        credentials: Bearer credentials sent by the caller
+
+    Raises:
+        HTTPException: 401 if the token is missing or does not match
+    """
+    key = settings.admin_api_key
+    if (
+        not key
+        or credentials is None
+        or not hmac.compare_digest(credentials.credentials.encode(), key.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing API key",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(
+    prefix="/clients",
+    tags=["Clients"],
+    dependencies=[Depends(require_admin_api_key)],
+)
+
+
+def parse_fields(fields: Optional[str], default: Sequence[str]) -> List[str]:
+    """
+    Resolve a ``fields`` query parameter.
+
+    Args:
+        fields: Comma-separated field names, or None
+        default: Fields returned when none are requested
+
+    Returns:
+        Requested fields in schema order, always including ``id``
+
+    Raises:
+        HTTPException: 400 if a field does not exist
+    """
+    if fields is None:
+        return list(default)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return [name for name in FIELDS if name in requested or name == "id"]
+
+
+def _select(client: Client, fields: Sequence[str]) -> Dict[str, Any]:
+    """Pick the requested fields of a client."""
+    return {name: getattr(client, name) for name in fields}
+
+
+async def _get_client(repo: ClientRepository, client_id: int) -> Client:
+    """Look up a client or fail with a 404."""
+    client = await repo.get_by_id_async(client_id)
+    if client is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+        )
+    return client
+
+
+@router.get("/", response_model=ClientPage)
+async def list_clients(
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated fields to return; all but message by default",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    List clients, newest first.
+
+    Only the selected columns are read, as plain rows without ORM
+    instances. The page is encoded once and its tag is a hash of those
+    bytes; when it matches the caller's ``If-None-Match``, a 304 is
+    returned instead of the body.
+
+    Args:
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+        fields: Fields to return
+        if_none_match: Entity tag of the caller's copy
+        db: Database session dependency
+
+    Returns:
+        Page of clients, or 304 Not Modified
+
+    Raises:
+        HTTPException: 400 for unknown fields
+    """
+    selected = parse_fields(fields, DEFAULT_LIST_FIELDS)
+    repo = ClientRepository(db)
+    rows = await repo.get_rows_async(selected, skip, limit)
+    total = await repo.count_async()
+
+    body = encode_rows(selected, rows, total=total, skip=skip, limit=limit)
+    etag = body_etag(body)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, CACHE_HEADERS)
+
+    return Response(
+        body, media_type="application/json", headers={**CACHE_HEADERS, "ETag": etag}
+    )
+
+
+@router.get("/{client_id}")
+async def get_client(
+    client_id: int,
+    fields: Optional[str] = Query(
+        default=None, description="Comma-separated fields to return; all by default"
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Get one client.
+
+    Args:
+        client_id: Client ID
+        fields: Fields to return
+        if_none_match: Entity tag of the caller's copy
+        db: Database session dependency
+
+    Returns:
+        Client fields, or 304 Not Modified
+
+    Raises:
+        HTTPException: 400 for unknown fields, 404 if the client does not exist
+    """
+    selected = parse_fields(fields, FIELDS)
+    client = await _get_client(ClientRepository(db), client_id)
+
+    data = _select(client, selected)
+    etag = make_etag(tuple(data.items()))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, CACHE_HEADERS)
+    return PydanticJSONResponse(data, headers={**CACHE_HEADERS, "ETag": etag})
+
+
+@router.patch("/{client_id}", response_model=ClientResponse)
+async def update_client(
+    client_id: int,
+    client_data: ClientUpdate,
+    db: AsyncSession = Depends(get_async_db),
+) -> PydanticJSONResponse:
+    """
+    Update some fields of a client.
+
+    Args:
+        client_id: Client ID
+        client_data: Fields to change
+        db: Database session dependency
+
+    Returns:
+        Updated client
+
+    Raises:
+        HTTPException: 404 if the client does not exist
+    """
+    client = await ClientRepository(db).update_async(client_id, client_data)
+    if client is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+        )
+    return PydanticJSONResponse(ClientResponse.model_validate(client))
+
+
+@router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_client(
+    client_id: int,
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Delete a client.
+
+    Args:
+        client_id: Client ID
+        db: Database session dependency
+
+    Returns:
+        Empty 204 response
+
+    Raises:
+        HTTPException: 404 if the client does not exist
+    """
+    if not await ClientRepository(db).delete_async(client_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Client not found"
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
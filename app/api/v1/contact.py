@@ -5,6 +5,7 @@ This module provides contact form functionality for
 landing page integration.
 """
 
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -12,10 +13,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_async_db
+from app.core.deadline import DeadlineExceeded
+from app.core.logger import get_logger
+from app.core.responses import PydanticJSONResponse
 from app.repositories.client_repository import ClientRepository
-from app.schemas.client import ClientCreate, ContactForm, ContactResponse
+from app.schemas.client import (
+    ClientCreate,
+    ContactForm,
+    ContactResponse,
+    ContactSubmissionData,
+)
 from app.services.mailgun import mailgun_service
 
+logger = get_logger(__name__)
+
 router = APIRouter(prefix="/contact", tags=["Contact"])
 
 
@@ -23,7 +34,7 @@ router = APIRouter(prefix="/contact", tags=["Contact"])
 async def submit_contact_form(
     contact_data: ContactForm,
     db: AsyncSession = Depends(get_async_db),
-) -> ContactResponse:
+) -> PydanticJSONResponse:
     """
     Submit contact form from landing page.
 
@@ -39,6 +50,8 @@ async def submit_contact_form(
 
     Raises:
         HTTPException: If email service is not configured or operation fails
+        DeadlineExceeded: If the request deadline leaves no time to send the
+            notification (answered with a 503 by the timeout middleware)
 
     Example:
         POST /api/v1/contact/
@@ -64,7 +77,14 @@ async def submit_contact_form(
                 detail="Admin email not configured",
             )
 
-        print(f"🔍 Contact data received: {contact_data}")
+        logger.info(
+            "Contact form received",
+            extra={
+                "email": contact_data.email,
+                "product_type": contact_data.product_type,
+                "message_length": len(contact_data.message),
+            },
+        )
 
         # Save to database using Repository Pattern
         # client_repo = ClientRepository(db)
@@ -79,10 +99,12 @@ async def submit_contact_form(
         # )
 
         # client = await client_repo.create_async(client_create)
-        # print(f"✅ Client saved to database with ID: {client.id}")
+        # logger.info("Client saved to database", extra={"client_id": client.id})
 
-        # Send contact form email notification
-        email_success = mailgun_service.send_contact_form_email(
+        # Send contact form email notification; the Mailgun client blocks,
+        # so it runs in a thread with its timeout bounded by the deadline
+        email_success = await asyncio.to_thread(
+            mailgun_service.send_contact_form_email,
             full_name=contact_data.full_name,
             email=contact_data.email,
             phone=contact_data.phone,
@@ -94,29 +116,27 @@ async def submit_contact_form(
         )
 
         if not email_success:
-            print("⚠️ Warning: Failed to send contact email, but data was saved")
+            logger.warning("Failed to send contact email, but data was saved")
             # We don't fail the request if email fails, as data is saved
 
-        return ContactResponse(
-            success=True,
-            message="Mensaje enviado exitosamente. Te responderemos pronto.",
-            data={
-                # "id": client.id,
-                "full_name": contact_data.full_name,
-                "email": contact_data.email,
-                "phone": contact_data.phone,
-                "company": contact_data.company,
-                "product_type": contact_data.product_type,
-                "quantity": contact_data.quantity,
-                "message": contact_data.message,
-                "timestamp": datetime.now().isoformat(),
-            },
+        # Returning the response directly skips FastAPI's second validation
+        # of the response model; the body is encoded straight to bytes
+        return PydanticJSONResponse(
+            ContactResponse(
+                success=True,
+                message="Mensaje enviado exitosamente. Te responderemos pronto.",
+                data=ContactSubmissionData.from_form(contact_data, datetime.now()),
+            )
         )
 
-    except HTTPException:
+    except (HTTPException, DeadlineExceeded):
         raise
     except Exception as e:
-        print(f"❌ Error processing contact form: {str(e)}")
+        logger.error(
+            "Error processing contact form",
+            exc_info=e,
+            extra={"exception_type": type(e).__name__},
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing contact form: {str(e)}",
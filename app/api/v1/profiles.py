@@ -0,0 +1,105 @@
+"""
+Profile download endpoints.
+
+This module lists and serves the request profiles captured by the
+profiling middleware. Routes are only registered when profiling is
+enabled, and every call must send the profiling secret.
+"""
+
+import hmac
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.core.config import settings
+from app.core.profiling import Profile, profile_store
+
+
+def require_profiling_secret(
+    x_profile: Optional[str] = Header(default=None),
+) -> None:
+    """
+    Check the ``X-Profile`` header against the profiling secret.
+
+    Args:
+        x_profile: Secret sent by the caller
+
+    Raises:
+        HTTPException: 404 if no secret is configured or it does not match,
+            so the routes are indistinguishable from missing ones
+    """
+    secret = settings.profiling_secret
+    if not secret or not x_profile or not hmac.compare_digest(x_profile, secret):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["Admin"],
+    include_in_schema=False,
+    dependencies=[Depends(require_profiling_secret)],
+)
+
+
+def _get_profile(profile_id: int) -> Profile:
+    """Look up a profile or fail with a 404."""
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found"
+        )
+    return profile
+
+
+@router.get("/")
+async def list_profiles() -> List[Dict[str, Any]]:
+    """
+    List the profiles in the ring buffer, newest first.
+
+    Returns:
+        Profile summaries
+    """
+    return [profile.summary() for profile in profile_store.recent()]
+
+
+@router.get("/{profile_id}.collapsed")
+async def download_collapsed(profile_id: int) -> PlainTextResponse:
+    """
+    Download a profile as collapsed stacks.
+
+    Args:
+        profile_id: Profile identifier from ``X-Profile-Id``
+
+    Returns:
+        Collapsed stack text, one stack per line
+    """
+    profile = _get_profile(profile_id)
+    return PlainTextResponse(
+        profile.to_collapsed(),
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{profile_id}.txt"'
+        },
+    )
+
+
+@router.get("/{profile_id}.speedscope.json")
+async def download_speedscope(profile_id: int) -> JSONResponse:
+    """
+    Download a profile for https://www.speedscope.app.
+
+    Args:
+        profile_id: Profile identifier from ``X-Profile-Id``
+
+    Returns:
+        Speedscope JSON document
+    """
+    profile = _get_profile(profile_id)
+    return JSONResponse(
+        profile.to_speedscope(),
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="profile-{profile_id}.speedscope.json"'
+            )
+        },
+    )
@@ -0,0 +1,128 @@
+"""
+Submission statistics endpoints.
+
+This module serves submission counts for marketing dashboards from the
+``client_daily_stats`` rollup, so a query costs one row per day and
+group instead of a scan of the client table. Routes are registered with
+the clients API and require the same admin API key.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.clients import require_admin_api_key
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.logger import get_logger
+from app.repositories.stats_repository import (
+    GROUP_BY_FIELDS,
+    RollupConflict,
+    StatsRepository,
+)
+from app.schemas.stats import SubmissionCount, SubmissionStats
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    prefix="/stats",
+    tags=["Stats"],
+    dependencies=[Depends(require_admin_api_key)],
+)
+
+# Encoded responses by (from, to, group_by); dashboards poll the same
+# ranges, and counts a few seconds old are fine
+submissions_cache = TTLCache(ttl=settings.stats_cache_ttl)
+
+
+@router.get("/submissions", response_model=SubmissionStats)
+async def submission_stats(
+    start: Optional[date] = Query(
+        default=None, alias="from", description="First day; 30 days before 'to'"
+    ),
+    end: Optional[date] = Query(
+        default=None, alias="to", description="Last day, inclusive; today"
+    ),
+    group_by: str = Query(
+        default="day",
+        description="Comma-separated fields among day, product_type and company",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """
+    Count submissions per group over a date range.
+
+    Clients created since the last rollup are counted first, a few
+    batches at most; a bigger backlog is left to ``python -m
+    app.jobs.rollup``. If that fails, the answer comes from what is
+    already rolled up.
+
+    Args:
+        start: First day of the range
+        end: Last day of the range
+        group_by: Fields to group by
+        db: Database session dependency
+
+    Returns:
+        Submission counts, cached for ``stats_cache_ttl`` seconds
+
+    Raises:
+        HTTPException: 400 for an invalid range or grouping
+    """
+    end = end or date.today()
+    start = start or end - timedelta(days=29)
+    if start > end or (end - start).days >= settings.stats_max_days:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"'from' must be before 'to' and at most "
+            f"{settings.stats_max_days} days earlier",
+        )
+    requested = {name.strip() for name in group_by.split(",") if name.strip()}
+    if not requested or not requested.issubset(GROUP_BY_FIELDS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"group_by must be among: {', '.join(GROUP_BY_FIELDS)}",
+        )
+    fields = [name for name in GROUP_BY_FIELDS if name in requested]
+
+    key = (start, end, tuple(fields))
+    body = submissions_cache.get(key)
+    if body is None:
+        repo = StatsRepository(db)
+        try:
+            await repo.catch_up_async(
+                batch_size=settings.stats_rollup_batch_size,
+                settle_seconds=settings.stats_rollup_settle_seconds,
+                max_batches=settings.stats_rollup_batches_per_request,
+            )
+        except RollupConflict:
+            # Another worker is rolling up; answer from what is counted
+            logger.info("Stats rollup already running elsewhere")
+        except Exception:
+            # The rollup is best effort here; the job will catch up later
+            logger.warning("Stats rollup failed", exc_info=True)
+            await db.rollback()
+        rows = await repo.submissions_async(start, end, fields)
+        stats = SubmissionStats.model_validate(
+            {
+                "from": start,
+                "to": end,
+                "group_by": fields,
+                "results": [SubmissionCount(**row) for row in rows],
+            }
+        )
+        # Groups without a company or product type keep them as null
+        ungrouped = set(GROUP_BY_FIELDS) - requested
+        body = stats.model_dump_json(
+            by_alias=True, exclude={"results": {"__all__": ungrouped}}
+        ).encode()
+        submissions_cache.set(key, body)
+
+    return Response(
+        body,
+        media_type="application/json",
+        headers={"Cache-Control": f"private, max-age={int(settings.stats_cache_ttl)}"},
+    )
@@ -5,8 +5,10 @@ This package contains core functionality including configuration,
 database setup, and shared utilities.
 """
 
+from typing import Any
+
 from app.core.config import settings
-from app.core.database import Base, async_engine, engine, get_async_db, get_db
+from app.core.database import Base, get_async_db, get_db
 
 __all__ = [
     "settings",
@@ -17,3 +19,11 @@ __all__ = [
     "get_async_db",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve the database engines lazily (see ``app.core.database``)."""
+    if name in ("engine", "async_engine"):
+        from app.core import database
+
+        return getattr(database, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,127 @@
+"""
+Adaptive admission control.
+
+This module limits how many requests a worker processes at once. The
+limit follows observed latency with AIMD (additive increase,
+multiplicative decrease). It grows by about one slot per ``limit``
+fast responses while the limit is actually in use, and shrinks by a
+factor when responses get slower than the latency target or fail with
+an overload status. Requests over the limit are rejected right away
+instead of being queued behind slow MySQL or Mailgun calls.
+"""
+
+import time
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit that adapts to latency.
+
+    All methods are called from the event loop of a single worker, so no
+    locking is needed.
+
+    Example:
+        >>> if not limiter.try_acquire():
+        ...     return reject()
+        >>> started = time.monotonic()
+        >>> ...
+        >>> limiter.release(time.monotonic() - started, overloaded=False)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        latency_target: float = 2.0,
+        backoff: float = 0.9,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Concurrency allowed before any feedback
+            min_limit: Lowest limit the backoff may reach
+            max_limit: Highest limit the increase may reach
+            latency_target: Seconds above which a response counts as slow
+            backoff: Factor applied to the limit on a slow response
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """Number of requests currently allowed at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted requests still running."""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """
+        Admit a request if the limit allows it.
+
+        Returns:
+            True if admitted; the caller must then call ``release``
+        """
+        if self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """
+        Record the outcome of an admitted request and adapt the limit.
+
+        A decrease happens at most once per ``latency_target``, so one
+        burst of slow responses from the same stall backs off once
+        instead of once per response.
+
+        Args:
+            latency: Seconds the request took
+            overloaded: Whether it failed in a way that signals overload
+        """
+        in_use = self._in_flight
+        self._in_flight -= 1
+        if overloaded or latency > self.latency_target:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.latency_target:
+                self._last_decrease = now
+                self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        elif in_use * 2 >= self.limit:
+            # Only grow while the limit is being used, not while idle
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+
+# Global limiter for the contact endpoint
+contact_limiter = AIMDLimiter(
+    initial_limit=settings.admission_initial_limit,
+    min_limit=settings.admission_min_limit,
+    max_limit=settings.admission_max_limit,
+    latency_target=settings.admission_latency_target,
+    backoff=settings.admission_backoff,
+)
+
+admission_concurrency_limit = registry.gauge(
+    "admission_concurrency_limit",
+    "Current adaptive concurrency limit per worker",
+    multiprocess_mode="all",
+)
+admission_concurrency_limit.set_function(lambda: contact_limiter.limit)
+admission_in_flight = registry.gauge(
+    "admission_in_flight", "Requests admitted by the limiter and still running"
+)
+admission_in_flight.set_function(lambda: contact_limiter.in_flight)
+admission_rejected_total = registry.counter(
+    "admission_rejected_total", "Requests rejected by the concurrency limiter"
+)
@@ -0,0 +1,73 @@
+"""
+In-process response cache.
+
+This module provides a small time-based cache for responses that are
+expensive to compute and may be a little stale, such as dashboard
+queries. Entries live in the worker's memory only.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Mapping whose entries expire a fixed time after they were stored.
+
+    The oldest entries are evicted first once ``maxsize`` is reached.
+    The cache is meant for a single event loop and is not thread safe.
+
+    Example:
+        >>> cache = TTLCache(ttl=30)
+        >>> cache.set(("2024-01-01", "2024-01-31"), body)
+        >>> cache.get(("2024-01-01", "2024-01-31"))
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Most entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a fresh entry.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Stored value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key: Entry key
+            value: Value to store
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
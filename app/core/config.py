@@ -22,6 +22,242 @@ class Settings(BaseSettings):
     # Server settings
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, description="Server port")
+    server_workers: Optional[int] = Field(
+        default=None,
+        description="Worker processes for python -m app.server (default: one per CPU)",
+    )
+    server_backlog: int = Field(
+        default=2048, description="Maximum pending connections on the listen socket"
+    )
+    server_keepalive: int = Field(
+        default=5, description="Seconds idle keep-alive connections are kept open"
+    )
+    server_max_requests: int = Field(
+        default=10000,
+        description="Requests after which a worker is recycled (0 disables)",
+    )
+    server_max_requests_jitter: int = Field(
+        default=1000,
+        description="Random extra requests per worker, so recycling is staggered",
+    )
+    server_graceful_timeout: int = Field(
+        default=30, description="Seconds workers get to finish requests on shutdown"
+    )
+    server_worker_timeout: int = Field(
+        default=60, description="Seconds before a silent worker is killed and replaced"
+    )
+
+    # HTTP caching settings
+    cache_policies: dict[str, str] = Field(
+        default={"/": "public, max-age=300", "/health": "public, max-age=10"},
+        description="Cache-Control per path ('prefix*' matches prefixes); "
+        "other paths are sent with no-cache headers",
+    )
+
+    # Response compression settings
+    compression_enabled: bool = Field(
+        default=True, description="Compress responses with brotli or gzip"
+    )
+    compression_min_size: int = Field(
+        default=1024, description="Smallest response body in bytes to compress"
+    )
+    compression_gzip_level: int = Field(
+        default=6, description="gzip compression level (1-9)"
+    )
+    compression_brotli_quality: int = Field(
+        default=4, description="Brotli compression quality (0-11)"
+    )
+
+    # Logging settings
+    log_level: str = Field(default="INFO", description="Application log level")
+    log_json: bool = Field(default=True, description="Emit logs as JSON records")
+    log_sample_rates: dict[str, float] = Field(
+        default_factory=dict,
+        description="Fraction of records kept per level, e.g. {'DEBUG': 0.1}",
+    )
+    log_redact_fields: list[str] = Field(
+        default=["full_name", "email", "phone", "message", "admin_email"],
+        description="Log record fields redacted as PII",
+    )
+
+    # Metrics settings
+    metrics_enabled: bool = Field(
+        default=True, description="Record request metrics and expose /metrics"
+    )
+    metrics_multiprocess_dir: Optional[str] = Field(
+        default=None,
+        description="Directory shared by workers to aggregate metrics across processes",
+    )
+    metrics_flush_interval: float = Field(
+        default=5.0, description="Seconds between worker metric snapshots"
+    )
+
+    # Tracing settings
+    tracing_sample_rate: float = Field(
+        default=0.0,
+        description="Fraction of new traces to record (0 to 1); incoming "
+        "traceparent headers keep their own sampling decision",
+    )
+    tracing_export_path: Optional[str] = Field(
+        default=None,
+        description="JSON-lines file finished spans are appended to; "
+        "tracing is off when unset",
+    )
+
+    # Profiling settings
+    profiling_enabled: bool = Field(
+        default=False,
+        description="Install the request profiler and the profile download routes",
+    )
+    profiling_secret: Optional[str] = Field(
+        default=None,
+        description="X-Profile header value that profiles a request; also "
+        "required to download profiles",
+    )
+    profiling_sample_rate: float = Field(
+        default=0.0, description="Fraction of requests profiled without the header"
+    )
+    profiling_interval_ms: float = Field(
+        default=5.0, description="Milliseconds between stack samples"
+    )
+    profiling_buffer_size: int = Field(
+        default=20, description="Number of recent profiles kept in memory"
+    )
+
+    # Submission statistics settings
+    stats_rollup_batch_size: int = Field(
+        default=5000, description="Clients counted per rollup transaction"
+    )
+    stats_rollup_settle_seconds: float = Field(
+        default=5.0,
+        description="Minimum client age before the rollup counts it, so rows "
+        "committing out of id order are not skipped",
+    )
+    stats_rollup_batches_per_request: int = Field(
+        default=4,
+        description="Rollup batches the stats endpoint runs before answering; "
+        "bigger backlogs are left to the rollup job",
+    )
+    stats_cache_ttl: float = Field(
+        default=30.0, description="Seconds stats responses are cached per worker"
+    )
+    stats_max_days: int = Field(
+        default=731, description="Longest date range of one stats query"
+    )
+
+    # Retention settings
+    retention_days: int = Field(
+        default=730, description="Age in days after which clients are archived"
+    )
+    retention_batch_size: int = Field(
+        default=1000, description="Clients archived and deleted per transaction"
+    )
+    retention_sleep_seconds: float = Field(
+        default=0.5,
+        description="Pause between retention batches, so replication and purge "
+        "keep up",
+    )
+    retention_archive_dir: str = Field(
+        default="archive/clients",
+        description="Directory for the compressed NDJSON archives of deleted clients",
+    )
+
+    # Admin API settings
+    admin_api_key: Optional[str] = Field(
+        default=None,
+        description="Bearer token of the /api/v1/clients back office API; "
+        "the routes are not registered when unset",
+    )
+
+    # Warm-up settings
+    warmup_enabled: bool = Field(
+        default=False,
+        description="Warm up connections and schemas at startup and Lambda init",
+    )
+    warmup_db_connections: int = Field(
+        default=2, description="Pooled database connections opened during warm-up"
+    )
+    warmup_timeout: float = Field(
+        default=3.0, description="Seconds each warm-up step may take before it fails"
+    )
+
+    # Request deadline settings
+    request_timeout: float = Field(
+        default=10.0,
+        description="Seconds a request may run before it is cancelled with a 504",
+    )
+    deadline_min_budget: float = Field(
+        default=0.05,
+        description="Seconds a database or email call needs at least; with less "
+        "time left the request fails fast with a 503",
+    )
+
+    # Request body limits
+    max_body_size: int = Field(
+        default=1_048_576,
+        description="Largest request body in bytes on routes without their own limit",
+    )
+    body_size_limits: dict[str, int] = Field(
+        default={},
+        description="Request body limit in bytes per path ('prefix*' matches "
+        "prefixes); overrides the limits derived from request models",
+    )
+
+    # Validation settings
+    phone_default_country_code: Optional[str] = Field(
+        default="52",
+        description="Country calling code assumed for phone numbers without "
+        "one when deriving their E.164 form (None to leave them without one)",
+    )
+    email_validation_cache_size: int = Field(
+        default=1024, description="Recently validated email addresses to remember"
+    )
+
+    # Admission control settings
+    admission_enabled: bool = Field(
+        default=True, description="Shed load on admission_paths above the limit"
+    )
+    admission_paths: list[str] = Field(
+        default=["/api/v1/contact/"],
+        description="Paths guarded by the adaptive concurrency limit "
+        "('prefix*' matches prefixes)",
+    )
+    admission_initial_limit: int = Field(
+        default=20, description="Concurrent requests per worker before feedback"
+    )
+    admission_min_limit: int = Field(
+        default=2, description="Lowest concurrency limit per worker"
+    )
+    admission_max_limit: int = Field(
+        default=200, description="Highest concurrency limit per worker"
+    )
+    admission_latency_target: float = Field(
+        default=2.0,
+        description="Seconds above which a response shrinks the concurrency limit",
+    )
+    admission_backoff: float = Field(
+        default=0.9, description="Factor applied to the limit on slow responses"
+    )
+    admission_retry_after: int = Field(
+        default=1, description="Retry-After seconds sent with rejected requests"
+    )
+
+    # Shutdown settings
+    shutdown_timeout: float = Field(
+        default=25.0,
+        description="Seconds to drain in-flight requests and background tasks "
+        "on shutdown; keep below server_graceful_timeout",
+    )
+
+    # Lambda keep-warm settings
+    keep_warm_max_concurrency: int = Field(
+        default=10, description="Upper bound on containers a keep-warm ping may warm"
+    )
+    keep_warm_delay_ms: int = Field(
+        default=75,
+        description="Milliseconds fanned-out keep-warm invocations stay busy, "
+        "so they land on separate containers",
+    )
 
     # AWS settings - These are automatically provided by Lambda runtime
     aws_region: str = Field(
@@ -40,6 +276,9 @@ class Settings(BaseSettings):
     mailgun_base_url: str = Field(
         default="https://api.mailgun.net/v3", description="Mailgun base URL"
     )
+    mailgun_timeout: float = Field(
+        default=10.0, description="Mailgun API timeout in seconds, capped by deadline"
+    )
     admin_email: Optional[str] = Field(
         default=None, description="Admin email for contact form notifications"
     )
@@ -59,6 +298,16 @@ class Settings(BaseSettings):
     database_echo: bool = Field(
         default=False, description="Enable SQLAlchemy echo (SQL logging)"
     )
+    db_retry_max_attempts: int = Field(
+        default=3,
+        description="Attempts for transactions hitting deadlocks or lock wait timeouts",
+    )
+    db_retry_base_delay: float = Field(
+        default=0.05, description="Initial transaction retry backoff in seconds"
+    )
+    db_retry_max_delay: float = Field(
+        default=1.0, description="Maximum transaction retry backoff in seconds"
+    )
 
     # CORS settings
     allowed_origins: list[str] = Field(
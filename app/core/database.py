@@ -5,10 +5,17 @@ This module provides database connection setup, session management,
 and base model classes using SQLAlchemy.
 """
 
-from typing import AsyncGenerator, Generator
-
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import threading
+from typing import Any, AsyncGenerator, Callable, Dict, Generator
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -50,37 +57,86 @@ def get_async_database_url() -> str:
     )
 
 
-# Create synchronous engine
-engine = create_engine(
-    get_database_url(),
-    echo=settings.database_echo,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+def _create_engine() -> Engine:
+    """Create the synchronous engine; imports the PyMySQL driver."""
+    return create_engine(
+        get_database_url(),
+        echo=settings.database_echo,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
 
-# Create synchronous session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
 
-# Create asynchronous engine
-async_engine = create_async_engine(
-    get_async_database_url(),
-    echo=settings.database_echo,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+def _create_session_factory() -> sessionmaker:
+    """Create the synchronous session factory."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=_lazy("engine"),
+    )
 
-# Create asynchronous session factory
-AsyncSessionLocal = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+def _create_async_engine() -> AsyncEngine:
+    """Create the asynchronous engine; imports the aiomysql driver."""
+    return create_async_engine(
+        get_async_database_url(),
+        echo=settings.database_echo,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+
+
+def _create_async_session_factory() -> async_sessionmaker:
+    """Create the asynchronous session factory."""
+    return async_sessionmaker(
+        _lazy("async_engine"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+# Engines and session factories are created on first access, so importing
+# this module (e.g. for ``Base``) does not load the MySQL drivers. Routes
+# that never touch the database keep them out of the Lambda cold start.
+_LAZY_ATTRIBUTES: Dict[str, Callable[[], Any]] = {
+    "engine": _create_engine,
+    "SessionLocal": _create_session_factory,
+    "async_engine": _create_async_engine,
+    "AsyncSessionLocal": _create_async_session_factory,
+}
+_lazy_lock = threading.RLock()
+
+engine: Engine
+SessionLocal: sessionmaker
+async_engine: AsyncEngine
+AsyncSessionLocal: async_sessionmaker
+
+
+def _lazy(name: str) -> Any:
+    """
+    Get a lazily created module attribute, creating it on first use.
+
+    Args:
+        name: Attribute name from ``_LAZY_ATTRIBUTES``
+
+    Returns:
+        The engine or session factory
+    """
+    namespace = globals()
+    if name not in namespace:
+        with _lazy_lock:
+            if name not in namespace:
+                namespace[name] = _LAZY_ATTRIBUTES[name]()
+    return namespace[name]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``engine``, ``async_engine`` and session factories lazily."""
+    if name in _LAZY_ATTRIBUTES:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -95,7 +151,7 @@ def get_db() -> Generator[Session, None, None]:
         def get_items(db: Session = Depends(get_db)):
             return db.query(Item).all()
     """
-    db = SessionLocal()
+    db = _lazy("SessionLocal")()
     try:
         yield db
     finally:
@@ -115,7 +171,7 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Item))
             return result.scalars().all()
     """
-    async with AsyncSessionLocal() as session:
+    async with _lazy("AsyncSessionLocal")() as session:
         try:
             yield session
         finally:
@@ -129,7 +185,7 @@ async def create_tables() -> None:
     This should be called on application startup in development.
     In production, use Alembic migrations instead.
     """
-    async with async_engine.begin() as conn:
+    async with _lazy("async_engine").begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
@@ -139,6 +195,19 @@ async def drop_tables() -> None:
 
     WARNING: This will delete all data. Use with caution.
     """
-    async with async_engine.begin() as conn:
+    async with _lazy("async_engine").begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+
+async def dispose_engines() -> None:
+    """
+    Close the connection pools of the engines that were created.
+
+    Engines that were never used are left uncreated. The sync engine's
+    pool is closed in a thread since its drivers block.
+    """
+    namespace = globals()
+    if "async_engine" in namespace:
+        await namespace["async_engine"].dispose()
+    if "engine" in namespace:
+        await asyncio.to_thread(namespace["engine"].dispose)
@@ -0,0 +1,96 @@
+"""
+Per-request deadlines.
+
+The timeout middleware stores an absolute deadline for each request in a
+context variable. Code that waits on MySQL or Mailgun reads the time left
+from here, so a slow dependency cannot outlive the request that is
+waiting for it. Context variables are copied into ``asyncio.to_thread``
+and Starlette's threadpool, so blocking calls see the deadline too.
+"""
+
+import time
+from contextvars import ContextVar, Token
+from typing import Optional
+
+from app.core.config import settings
+
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the request deadline leaves no time for an operation."""
+
+
+def set_deadline(seconds: float) -> Token[Optional[float]]:
+    """
+    Set the deadline of the current request.
+
+    Args:
+        seconds: Time the request may still take
+
+    Returns:
+        Token to restore the previous deadline with ``reset_deadline``
+    """
+    return _deadline.set(time.monotonic() + seconds)
+
+
+def reset_deadline(token: Token[Optional[float]]) -> None:
+    """
+    Restore the deadline that was active before ``set_deadline``.
+
+    Args:
+        token: Token returned by ``set_deadline``
+    """
+    _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the time left until the deadline.
+
+    Returns:
+        Seconds left (negative once passed), or None without a deadline
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline(minimum: Optional[float] = None) -> Optional[float]:
+    """
+    Make sure enough time is left to start an operation.
+
+    Args:
+        minimum: Seconds the operation needs at least
+            (``deadline_min_budget`` by default)
+
+    Returns:
+        Seconds left, or None without a deadline
+
+    Raises:
+        DeadlineExceeded: If less than ``minimum`` seconds are left
+    """
+    left = remaining()
+    if minimum is None:
+        minimum = settings.deadline_min_budget
+    if left is not None and left < minimum:
+        raise DeadlineExceeded(f"{max(left, 0) * 1000:.0f}ms left before deadline")
+    return left
+
+
+def bounded_timeout(default: float) -> float:
+    """
+    Cap a timeout by the time left until the deadline.
+
+    Args:
+        default: Timeout to use when the deadline is further away
+
+    Returns:
+        The smaller of ``default`` and the time left
+
+    Raises:
+        DeadlineExceeded: If too little time is left to start the call
+    """
+    left = check_deadline()
+    return default if left is None else min(default, left)
@@ -0,0 +1,128 @@
+"""
+Lambda keep-warm pings.
+
+A scheduled EventBridge rule invokes the function every few minutes so
+containers stay initialized. Those pings are answered here, before Mangum
+or FastAPI see them. A ping may ask for several containers to be kept
+warm, in which case the receiving container invokes the function that
+many times concurrently.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+WARMER_KEY = "warmer"
+FANNED_OUT_KEY = "fanned_out"
+
+# Import time of this module, i.e. when the container was initialized
+_container_started = time.monotonic()
+
+
+def is_keep_warm_event(event: Any) -> bool:
+    """
+    Check whether a Lambda event is a keep-warm ping.
+
+    Both ``{"warmer": true, ...}`` inputs and bare EventBridge scheduled
+    events are recognized.
+
+    Args:
+        event: Lambda event
+
+    Returns:
+        True if the event should be answered without running the app
+    """
+    if not isinstance(event, dict):
+        return False
+    if event.get(WARMER_KEY) is True:
+        return True
+    return (
+        event.get("source") == "aws.events"
+        and event.get("detail-type") == "Scheduled Event"
+    )
+
+
+@lru_cache(maxsize=1)
+def _lambda_client() -> Any:
+    """Create the Lambda client once; boto3 is only imported for fan-out."""
+    import boto3  # type: ignore[import-untyped]
+
+    return boto3.client("lambda", region_name=settings.aws_region)
+
+
+def fan_out(function_name: str, count: int) -> int:
+    """
+    Invoke the function concurrently so that other containers stay warm.
+
+    Invocations are synchronous and each receiver stays busy for
+    ``keep_warm_delay_ms``, so Lambda has to route them to distinct
+    containers instead of reusing one.
+
+    Args:
+        function_name: Name or ARN of this function
+        count: Number of invocations
+
+    Returns:
+        Number of invocations that succeeded
+    """
+    client = _lambda_client()
+    payload = json.dumps({WARMER_KEY: True, FANNED_OUT_KEY: True}).encode()
+
+    def invoke(_: int) -> bool:
+        try:
+            client.invoke(
+                FunctionName=function_name,
+                InvocationType="RequestResponse",
+                Payload=payload,
+            )
+            return True
+        except Exception as e:
+            logger.warning("Keep-warm invocation failed", extra={"error": str(e)})
+            return False
+
+    with ThreadPoolExecutor(max_workers=count) as pool:
+        return sum(pool.map(invoke, range(count)))
+
+
+def handle_keep_warm(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Answer a keep-warm ping.
+
+    Args:
+        event: Keep-warm event, optionally with ``concurrency``
+        context: Lambda context
+
+    Returns:
+        Summary with the number of extra containers invoked
+    """
+    invoked = 0
+    if event.get(FANNED_OUT_KEY):
+        # Stay busy so that the concurrent pings land on other containers
+        time.sleep(settings.keep_warm_delay_ms / 1000)
+    else:
+        concurrency = min(
+            int(event.get("concurrency") or 1), settings.keep_warm_max_concurrency
+        )
+        if concurrency > 1:
+            function_name = (
+                getattr(context, "invoked_function_arn", None) or context.function_name
+            )
+            invoked = fan_out(function_name, concurrency - 1)
+
+    container_age = time.monotonic() - _container_started
+    logger.debug(
+        "Keep-warm ping handled",
+        extra={"invoked": invoked, "container_age_s": round(container_age, 3)},
+    )
+    return {
+        "warmed": True,
+        "invoked": invoked,
+        "container_age_s": round(container_age, 3),
+    }
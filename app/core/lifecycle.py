@@ -0,0 +1,191 @@
+"""
+Graceful shutdown and draining.
+
+This module tracks in-flight requests and background tasks so that a
+shutdown can stop taking new work, let running work finish up to a
+deadline, flush buffered writes and only then dispose the connection
+pools. Whatever could not finish in time is cancelled and reported.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Coroutine, Dict, List, Optional, Set
+
+# How often the drain loop re-checks the in-flight request count
+_POLL_INTERVAL = 0.05
+
+
+@dataclass
+class DrainReport:
+    """
+    Result of a shutdown drain.
+
+    Attributes:
+        duration_ms: Time spent draining and releasing resources
+        dropped_requests: Requests still running when the deadline passed
+        cancelled_tasks: Names of background tasks cancelled at the deadline
+        closed: Resources that were flushed, disposed or closed
+        errors: Error message of each resource that failed to close
+    """
+
+    duration_ms: float = 0.0
+    dropped_requests: int = 0
+    cancelled_tasks: List[str] = field(default_factory=list)
+    closed: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def clean(self) -> bool:
+        """Whether everything finished and closed without losing work."""
+        return not (self.dropped_requests or self.cancelled_tasks or self.errors)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to a dictionary for structured logging.
+
+        Returns:
+            Report fields
+        """
+        return asdict(self)
+
+
+class Lifecycle:
+    """
+    In-flight work registry for the running process.
+
+    Example:
+        >>> lifecycle.spawn(send_notification(client), name="notify")
+        >>> report = await lifecycle.drain(timeout=25)
+    """
+
+    def __init__(self) -> None:
+        """Initialize an accepting lifecycle with no work in flight."""
+        self.accepting = True
+        self._in_flight = 0
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently being processed."""
+        return self._in_flight
+
+    @property
+    def background_tasks(self) -> int:
+        """Number of background tasks still running."""
+        return len(self._tasks)
+
+    def request_started(self) -> None:
+        """Record that a request started."""
+        self._in_flight += 1
+
+    def request_finished(self) -> None:
+        """Record that a request finished."""
+        self._in_flight -= 1
+
+    def spawn(
+        self, coro: Coroutine[Any, Any, Any], name: Optional[str] = None
+    ) -> "asyncio.Task[Any]":
+        """
+        Run a coroutine in the background and keep track of it.
+
+        Args:
+            coro: Coroutine to run
+            name: Task name used in the drain report
+
+        Returns:
+            The created task
+        """
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def drain(self, timeout: float) -> DrainReport:
+        """
+        Stop accepting work and wait for in-flight work to finish.
+
+        Args:
+            timeout: Seconds to wait before cancelling what is left
+
+        Returns:
+            Report of the requests and tasks that did not finish
+        """
+        self.accepting = False
+        report = DrainReport()
+        deadline = time.monotonic() + timeout
+
+        while self._in_flight > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(_POLL_INTERVAL)
+        report.dropped_requests = max(self._in_flight, 0)
+
+        pending = set(self._tasks)
+        if pending:
+            remaining = max(deadline - time.monotonic(), 0)
+            _, pending = await asyncio.wait(pending, timeout=remaining)
+        for task in pending:
+            task.cancel()
+            report.cancelled_tasks.append(task.get_name())
+        if pending:
+            await asyncio.wait(pending, timeout=1.0)
+        return report
+
+    def reset(self) -> None:
+        """Accept work again; used when the app is started in the same process."""
+        self.accepting = True
+        self._in_flight = 0
+        self._tasks.clear()
+
+
+async def shutdown(timeout: float) -> DrainReport:
+    """
+    Run the full shutdown sequence.
+
+    Draining comes first so that no request loses its connection pool or
+    HTTP session mid-flight. Then metrics and spans are flushed, the
+    database pools disposed and the Mailgun session closed. A failing step is reported
+    and does not stop the steps after it.
+
+    Args:
+        timeout: Seconds to wait for in-flight requests and tasks
+
+    Returns:
+        Drain report including the resources that were released
+    """
+    started = time.perf_counter()
+    report = await lifecycle.drain(timeout)
+
+    from app.core.database import dispose_engines
+    from app.core.metrics import registry
+    from app.core.tracing import tracer
+    from app.services.mailgun import mailgun_service
+
+    async def flush_metrics() -> None:
+        if registry.multiprocess_dir:
+            await asyncio.to_thread(registry.write_snapshot)
+
+    async def close_mailgun() -> None:
+        await asyncio.to_thread(mailgun_service.close)
+
+    async def flush_spans() -> None:
+        await asyncio.to_thread(tracer.shutdown)
+
+    steps = (
+        ("metrics", flush_metrics),
+        ("tracing", flush_spans),
+        ("database", dispose_engines),
+        ("mailgun", close_mailgun),
+    )
+    for name, step in steps:
+        try:
+            await step()
+            report.closed.append(name)
+        except Exception as e:
+            report.errors[name] = str(e)
+
+    report.duration_ms = (time.perf_counter() - started) * 1000
+    return report
+
+
+# Global lifecycle instance
+lifecycle = Lifecycle()
@@ -0,0 +1,272 @@
+"""
+Structured, non-blocking logging.
+
+This module configures the ``app`` logger hierarchy to emit JSON records
+through a ``QueueHandler``. Callers only enqueue records; redaction, JSON
+encoding and the actual write to stdout happen on a ``QueueListener``
+thread, so the event loop never blocks on I/O. High-volume lines can be
+sampled per level or per record, and PII fields are redacted.
+"""
+
+import atexit
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.config import settings
+
+LOGGER_NAME = "app"
+
+# Attributes every LogRecord has; anything else was passed through ``extra``
+_RECORD_ATTRIBUTES = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "sample_rate"}
+
+_EMAIL_PATTERN = re.compile(r"([A-Za-z0-9._%+-])[A-Za-z0-9._%+-]*(@[A-Za-z0-9.-]+)")
+
+REDACTED = "[REDACTED]"
+
+
+def mask_email(value: str) -> str:
+    """
+    Mask the local part of every email address in a string.
+
+    Args:
+        value: Text that may contain email addresses
+
+    Returns:
+        Text with addresses like ``j***@example.com``
+    """
+    return _EMAIL_PATTERN.sub(r"\1***\2", value)
+
+
+class RedactingFilter(logging.Filter):
+    """
+    Redact PII from log records.
+
+    Values of ``extra`` fields whose name is in the redaction list are
+    replaced (emails keep their domain for debugging), and email addresses
+    inside the rendered message and traceback are masked. Database errors
+    such as a duplicate-key ``IntegrityError`` quote the offending value,
+    so tracebacks can carry addresses too.
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            fields: Names of fields to redact (case-insensitive)
+        """
+        super().__init__()
+        self.fields = frozenset(field.lower() for field in fields)
+
+    def redact(self, key: str, value: Any) -> Any:
+        """
+        Redact a single value, recursing into containers.
+
+        Args:
+            key: Field name the value is stored under
+            value: Value to redact
+
+        Returns:
+            Redacted value
+        """
+        if isinstance(value, dict):
+            return {k: self.redact(str(k), v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self.redact(key, item) for item in value]
+        if key.lower() in self.fields and value is not None:
+            if "email" in key.lower() and isinstance(value, str):
+                return mask_email(value)
+            return REDACTED
+        return value
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Redact a record in place; never drops records."""
+        for key, value in list(vars(record).items()):
+            if key not in _RECORD_ATTRIBUTES:
+                setattr(record, key, self.redact(key, value))
+        if isinstance(record.msg, str) and "@" in record.msg:
+            record.msg = mask_email(record.msg)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if record.exc_text and "@" in record.exc_text:
+            record.exc_text = mask_email(record.exc_text)
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Drop a fraction of records for high-volume levels.
+
+    Rates are configured per level name. A single call site can also set
+    its own rate with ``extra={"sample_rate": 0.1}``. Warnings and errors
+    are never sampled unless explicitly configured.
+    """
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            rates: Mapping of level name to the fraction of records to keep
+        """
+        super().__init__()
+        self.rates = {name.upper(): rate for name, rate in (rates or {}).items()}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Keep a record with the configured probability."""
+        rate = getattr(record, "sample_rate", None)
+        if rate is None:
+            rate = self.rates.get(record.levelname, 1.0)
+        return rate >= 1.0 or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            JSON string with timestamp, level, logger, message and extras
+        """
+        payload: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Queue handler that defers formatting to the listener thread.
+
+    The stock ``QueueHandler`` formats every record before enqueueing it.
+    Here only the cheap parts run in the caller: message arguments are
+    merged and tracebacks rendered, since both reference live objects.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for enqueueing without formatting it."""
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_output_handler: Optional[logging.Handler] = None
+
+
+def _build_output_handler() -> logging.Handler:
+    """Build the handler that performs the actual write."""
+    handler = logging.StreamHandler(sys.stdout)
+    if settings.log_json:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        )
+    handler.addFilter(RedactingFilter(settings.log_redact_fields))
+    return handler
+
+
+def setup_logging() -> logging.Logger:
+    """
+    Configure the ``app`` logger with a queue handler and listener thread.
+
+    Safe to call multiple times; the listener is (re)started if needed.
+
+    Returns:
+        The configured ``app`` logger
+    """
+    global _listener, _queue_handler, _output_handler
+
+    logger = logging.getLogger(LOGGER_NAME)
+    with _lock:
+        if _listener is not None:
+            return logger
+
+        if _output_handler is None:
+            _output_handler = _build_output_handler()
+            atexit.register(shutdown_logging)
+        logger.removeHandler(_output_handler)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = NonBlockingQueueHandler(log_queue)
+        _queue_handler.addFilter(SamplingFilter(settings.log_sample_rates))
+        _listener = QueueListener(
+            log_queue, _output_handler, respect_handler_level=True
+        )
+        _listener.start()
+
+        logger.addHandler(_queue_handler)
+        logger.setLevel(settings.log_level.upper())
+        logger.propagate = False
+    return logger
+
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the listener thread.
+
+    Records logged afterwards are written synchronously, so messages
+    emitted late during shutdown are not lost.
+    """
+    global _listener, _queue_handler
+
+    logger = logging.getLogger(LOGGER_NAME)
+    with _lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        if _queue_handler is not None:
+            logger.removeHandler(_queue_handler)
+        if _output_handler is not None:
+            logger.addHandler(_output_handler)
+        _listener = None
+        _queue_handler = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger inside the ``app`` hierarchy.
+
+    Args:
+        name: Module name, usually ``__name__``
+
+    Returns:
+        Logger that propagates to the configured ``app`` logger
+    """
+    if name != LOGGER_NAME and not name.startswith(f"{LOGGER_NAME}."):
+        name = f"{LOGGER_NAME}.{name}"
+    return logging.getLogger(name)
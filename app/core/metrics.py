@@ -0,0 +1,628 @@
+"""
+In-process metrics registry with Prometheus text exposition.
+
+Recording is lock-free: every thread writes to its own shard of each
+metric, and shards are only combined when ``/metrics`` is scraped. Under
+multi-worker servers each process periodically writes a snapshot to a
+shared directory and the scrape merges the snapshots of all workers.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Metric(ABC):
+    """Base class for metrics with per-thread shards."""
+
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        """
+        Initialize the metric.
+
+        Args:
+            name: Metric name in Prometheus format
+            documentation: Help text
+            labelnames: Names of the labels, in the order values are passed
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict[LabelValues, Any]] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[LabelValues, Any]:
+        """Get the calling thread's shard, creating it on first use."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: Dict[LabelValues, Any] = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _shard_copies(self) -> List[Dict[LabelValues, Any]]:
+        """Copy every shard; ``dict.copy`` is atomic under the GIL."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.clear()
+
+    @abstractmethod
+    def collect(self) -> Dict[LabelValues, Any]:
+        """
+        Aggregate shards into a single value per label set.
+
+        Returns:
+            Mapping of label values to the aggregated value
+        """
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """
+        Increment the counter.
+
+        Args:
+            labels: Label values matching ``labelnames``
+            amount: Non-negative increment
+        """
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def collect(self) -> Dict[LabelValues, float]:
+        """Sum the counter across shards."""
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._shard_copies():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+
+class Gauge(_Metric):
+    """
+    Gauge that can go up and down.
+
+    ``inc``/``dec`` are sharded and summed at scrape time. ``set`` and
+    ``set_function`` store an absolute value that is added on top.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        multiprocess_mode: str = "sum",
+    ) -> None:
+        """
+        Initialize the gauge.
+
+        Args:
+            name: Metric name in Prometheus format
+            documentation: Help text
+            labelnames: Names of the labels
+            multiprocess_mode: ``sum`` to add worker values together or
+                ``all`` to keep one series per worker with a ``pid`` label
+        """
+        super().__init__(name, documentation, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+        self._values: Dict[LabelValues, float] = {}
+        self._functions: Dict[LabelValues, Callable[[], float]] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) - amount
+
+    def set(self, value: float, labels: LabelValues = ()) -> None:
+        """Set the absolute value of the gauge."""
+        self._values[labels] = value
+
+    def set_function(self, func: Callable[[], float], labels: LabelValues = ()) -> None:
+        """Compute the gauge value with a callback at scrape time."""
+        self._functions[labels] = func
+
+    def reset(self) -> None:
+        """Clear all recorded values and callbacks."""
+        super().reset()
+        self._values.clear()
+        self._functions.clear()
+
+    def collect(self) -> Dict[LabelValues, float]:
+        """Combine sharded deltas, absolute values and callbacks."""
+        totals: Dict[LabelValues, float] = dict(self._values)
+        for labels, func in list(self._functions.items()):
+            totals[labels] = totals.get(labels, 0.0) + float(func())
+        for shard in self._shard_copies():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+
+class Histogram(_Metric):
+    """
+    Histogram with fixed buckets.
+
+    Each label set is stored as a flat list: one count per bucket (the
+    last one is ``+Inf``), followed by the sum and the total count.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name: Metric name in Prometheus format
+            documentation: Help text
+            labelnames: Names of the labels
+            buckets: Sorted upper bounds of the buckets, excluding ``+Inf``
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._width = len(self.buckets) + 1
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        """
+        Record an observation.
+
+        Args:
+            value: Observed value, e.g. a duration in seconds
+            labels: Label values matching ``labelnames``
+        """
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            cell = shard[labels] = [0] * self._width + [0.0, 0]
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def time(self, labels: LabelValues = ()) -> "_Timer":
+        """
+        Time a block of code.
+
+        Args:
+            labels: Label values matching ``labelnames``
+
+        Returns:
+            Context manager observing the elapsed seconds
+        """
+        return _Timer(self, labels)
+
+    def collect(self) -> Dict[LabelValues, List[float]]:
+        """Sum bucket counts, sums and totals across shards."""
+        totals: Dict[LabelValues, List[float]] = {}
+        for shard in self._shard_copies():
+            for labels, cell in shard.items():
+                cell = list(cell)
+                current = totals.get(labels)
+                if current is None:
+                    totals[labels] = cell
+                else:
+                    totals[labels] = [a + b for a, b in zip(current, cell)]
+        return totals
+
+
+class _Timer:
+    """Context manager that observes elapsed time into a histogram."""
+
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: LabelValues) -> None:
+        self.histogram = histogram
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, self.labels)
+
+
+class MetricsRegistry:
+    """
+    Registry of metrics with Prometheus text rendering.
+
+    Design Patterns:
+        - Registry Pattern: Metrics are created once and looked up by name
+    """
+
+    def __init__(self, multiprocess_dir: Optional[str] = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            multiprocess_dir: Directory shared by all workers for snapshots
+        """
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self.multiprocess_dir = multiprocess_dir
+
+    def _register(self, metric: _Metric) -> Any:
+        """Register a metric, returning the existing one on name clashes."""
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create or get a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        multiprocess_mode: str = "sum",
+    ) -> Gauge:
+        """Create or get a gauge."""
+        return self._register(Gauge(name, documentation, labelnames, multiprocess_mode))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create or get a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Clear the values of every registered metric."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Aggregate every metric of this process.
+
+        Returns:
+            JSON-serializable snapshot keyed by metric name
+        """
+        metrics = {}
+        for metric in list(self._metrics.values()):
+            entry: Dict[str, Any] = {
+                "kind": metric.kind,
+                "help": metric.documentation,
+                "labelnames": list(metric.labelnames),
+                "values": [[list(k), v] for k, v in metric.collect().items()],
+            }
+            if isinstance(metric, Histogram):
+                entry["buckets"] = list(metric.buckets)
+            if isinstance(metric, Gauge):
+                entry["multiprocess_mode"] = metric.multiprocess_mode
+            metrics[metric.name] = entry
+        return {"pid": os.getpid(), "metrics": metrics}
+
+    def write_snapshot(self) -> Optional[str]:
+        """
+        Write this worker's snapshot to the multiprocess directory.
+
+        Returns:
+            Path of the written file, or None outside multiprocess mode
+        """
+        if not self.multiprocess_dir:
+            return None
+        os.makedirs(self.multiprocess_dir, exist_ok=True)
+        path = os.path.join(self.multiprocess_dir, f"metrics_{os.getpid()}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+        return path
+
+    def _load_snapshots(self) -> List[Dict[str, Any]]:
+        """Load the snapshots of every worker, including this one."""
+        self.write_snapshot()
+        snapshots = []
+        for filename in sorted(os.listdir(self.multiprocess_dir or ".")):
+            if not (filename.startswith("metrics_") and filename.endswith(".json")):
+                continue
+            path = os.path.join(self.multiprocess_dir or ".", filename)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    snapshots.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return snapshots
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        In multiprocess mode the snapshots of all workers are merged:
+        counters and histograms are summed, gauges are summed or kept per
+        worker depending on their mode, and gauges of dead workers are
+        ignored.
+
+        Returns:
+            Prometheus exposition text
+        """
+        if self.multiprocess_dir:
+            snapshots = self._load_snapshots()
+        else:
+            snapshots = [self.snapshot()]
+        return render_prometheus(merge_snapshots(snapshots))
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a worker process is still running."""
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-worker snapshots into a single snapshot.
+
+    Args:
+        snapshots: Snapshots produced by ``MetricsRegistry.snapshot``
+
+    Returns:
+        Merged metrics keyed by name, with values keyed by label tuple
+    """
+    merged: Dict[str, Any] = {}
+    for snapshot in snapshots:
+        pid = snapshot.get("pid", 0)
+        alive = _pid_alive(pid)
+        for name, entry in snapshot["metrics"].items():
+            target = merged.setdefault(
+                name, {**entry, "labelnames": list(entry["labelnames"]), "values": {}}
+            )
+            per_worker = entry.get("multiprocess_mode") == "all"
+            if entry["kind"] == "gauge" and not alive:
+                continue
+            if per_worker and "pid" not in target["labelnames"]:
+                target["labelnames"].append("pid")
+            for labels, value in entry["values"]:
+                key = tuple(labels) + ((str(pid),) if per_worker else ())
+                current = target["values"].get(key)
+                if current is None:
+                    target["values"][key] = value
+                elif isinstance(value, list):
+                    target["values"][key] = [a + b for a, b in zip(current, value)]
+                else:
+                    target["values"][key] = current + value
+    return merged
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return f"{value:.1f}"
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Format a label set as ``{a="b",...}``."""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def render_prometheus(metrics: Dict[str, Any]) -> str:
+    """
+    Render merged metrics in the Prometheus text format.
+
+    Args:
+        metrics: Output of ``merge_snapshots``
+
+    Returns:
+        Prometheus exposition text
+    """
+    lines: List[str] = []
+    for name in sorted(metrics):
+        entry = metrics[name]
+        labelnames = entry["labelnames"]
+        lines.append(f"# HELP {name} {entry['help']}")
+        lines.append(f"# TYPE {name} {entry['kind']}")
+        for labels, value in sorted(entry["values"].items()):
+            if entry["kind"] != "histogram":
+                lines.append(
+                    f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}"
+                )
+                continue
+            cumulative = 0
+            bounds = list(entry["buckets"]) + [math.inf]
+            for bound, count in zip(bounds, value[: len(bounds)]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{name}_bucket{_format_labels(labelnames, labels, le)} "
+                    f"{_format_value(cumulative)}"
+                )
+            lines.append(
+                f"{name}_sum{_format_labels(labelnames, labels)} "
+                f"{_format_value(value[-2])}"
+            )
+            lines.append(
+                f"{name}_count{_format_labels(labelnames, labels)} "
+                f"{_format_value(value[-1])}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def observe_duration(
+    histogram: Histogram, labels: Optional[LabelValues] = None
+) -> Callable:
+    """
+    Decorate a sync or async function to record its duration.
+
+    Args:
+        histogram: Histogram receiving the duration in seconds
+        labels: Label values for every observation (defaults to the
+            decorated function's name)
+
+    Returns:
+        Decorator preserving the wrapped function's signature
+
+    Example:
+        >>> timed = observe_duration(repository_call_duration_seconds)
+        >>> @timed
+        ... async def get_by_id_async(self, client_id): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        observed = (func.__name__,) if labels is None else labels
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - started, observed)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started, observed)
+
+        return sync_wrapper
+
+    return decorator
+
+
+async def flush_periodically(registry: "MetricsRegistry", interval: float) -> None:
+    """
+    Write the worker snapshot at a fixed interval until cancelled.
+
+    Args:
+        registry: Registry to flush
+        interval: Seconds between snapshots
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await asyncio.to_thread(registry.write_snapshot)
+
+
+# Global metrics registry
+registry = MetricsRegistry(multiprocess_dir=settings.metrics_multiprocess_dir)
+
+# Application metrics
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "Total HTTP requests by method, route and status code",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds by method and route",
+    ("method", "route"),
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed"
+)
+mailgun_requests_total = registry.counter(
+    "mailgun_requests_total",
+    "Mailgun API calls by operation and outcome",
+    ("operation", "outcome"),
+)
+mailgun_request_duration_seconds = registry.histogram(
+    "mailgun_request_duration_seconds",
+    "Mailgun API call latency in seconds by operation and outcome",
+    ("operation", "outcome"),
+)
+repository_call_duration_seconds = registry.histogram(
+    "repository_call_duration_seconds",
+    "Repository call latency in seconds by method",
+    ("method",),
+)
+db_transaction_retries_total = registry.counter(
+    "db_transaction_retries_total",
+    "Transaction retries on deadlocks and lock wait timeouts by outcome",
+    ("operation", "outcome"),
+)
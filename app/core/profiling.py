@@ -0,0 +1,229 @@
+"""
+On-demand request profiling.
+
+A sampling profiler captures the call stacks of the event loop thread
+while a selected request runs. Captured profiles are kept in a bounded
+ring buffer and can be exported as collapsed stacks (for flamegraph.pl
+and similar tools) or in the speedscope format.
+
+The event loop interleaves requests, so samples taken during a profiled
+request may include frames of other requests handled at the same time.
+Code run in the threadpool is not sampled.
+"""
+
+import itertools
+import os
+import sys
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+Stack = str
+
+
+def _frame_name(frame: FrameType) -> str:
+    """Name a frame as ``module.py:qualified_name``."""
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+
+
+def _collapse(frame: Optional[FrameType]) -> Stack:
+    """Render a stack root first, separated by semicolons."""
+    names: List[str] = []
+    while frame is not None:
+        names.append(_frame_name(frame))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """
+    Sample the call stack of one thread from a background thread.
+
+    Example:
+        >>> sampler = StackSampler(threading.get_ident(), interval=0.005)
+        >>> sampler.start()
+        >>> ...
+        >>> samples = sampler.stop()
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        """
+        Initialize the sampler.
+
+        Args:
+            thread_id: Identifier of the thread to sample
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[Stack] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def _run(self) -> None:
+        """Take samples until stopped."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[_collapse(frame)] += 1
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> Counter[Stack]:
+        """
+        Stop sampling.
+
+        Returns:
+            Number of samples per collapsed stack
+        """
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+
+@dataclass
+class Profile:
+    """
+    Samples captured during one request.
+
+    Attributes:
+        id: Identifier used to download the profile
+        method: HTTP method
+        path: Request path
+        started_at: Unix timestamp of the request start
+        duration_ms: Request duration
+        interval_ms: Sampling interval
+        samples: Number of samples per collapsed stack
+    """
+
+    id: int
+    method: str
+    path: str
+    started_at: float
+    duration_ms: float
+    interval_ms: float
+    samples: Counter[Stack] = field(default_factory=Counter)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Describe the profile without its samples.
+
+        Returns:
+            Profile metadata and sample count
+        """
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "samples": sum(self.samples.values()),
+        }
+
+    def to_collapsed(self) -> str:
+        """
+        Export in the collapsed stack format.
+
+        Returns:
+            One ``frame;frame;frame count`` line per distinct stack
+        """
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+    def to_speedscope(self) -> Dict[str, Any]:
+        """
+        Export in the speedscope file format.
+
+        Returns:
+            Speedscope document with one sampled profile
+        """
+        frames: Dict[str, int] = {}
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        for stack, count in self.samples.items():
+            samples.append(
+                [frames.setdefault(name, len(frames)) for name in stack.split(";")]
+            )
+            weights.append(count * self.interval_ms)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": f"{self.method} {self.path}",
+            "exporter": settings.app_name,
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": f"{self.method} {self.path}",
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+
+class ProfileStore:
+    """Ring buffer keeping the most recent profiles."""
+
+    def __init__(self, capacity: int = 20) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            capacity: Number of profiles kept before the oldest is dropped
+        """
+        self._profiles: Deque[Profile] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        """Reserve an identifier for a new profile."""
+        return next(self._ids)
+
+    def add(self, profile: Profile) -> None:
+        """
+        Store a profile, dropping the oldest one when full.
+
+        Args:
+            profile: Captured profile
+        """
+        self._profiles.append(profile)
+
+    def get(self, profile_id: int) -> Optional[Profile]:
+        """
+        Look up a profile.
+
+        Args:
+            profile_id: Profile identifier
+
+        Returns:
+            The profile, or None if unknown or already dropped
+        """
+        for profile in self._profiles:
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def recent(self) -> List[Profile]:
+        """
+        Get the stored profiles.
+
+        Returns:
+            Profiles, newest first
+        """
+        return list(reversed(self._profiles))
+
+
+# Global profile store
+profile_store = ProfileStore(capacity=settings.profiling_buffer_size)
@@ -0,0 +1,210 @@
+"""
+Transaction retry helpers.
+
+This module provides a decorator that re-executes repository operations
+when MySQL reports a transient locking error, such as an InnoDB deadlock
+or a lock wait timeout, instead of surfacing it as a server error.
+"""
+
+import asyncio
+import functools
+import inspect
+import random
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from sqlalchemy.exc import DBAPIError
+
+from app.core.config import settings
+from app.core.metrics import db_transaction_retries_total
+
+# MySQL error codes that are safe to retry once the transaction is rolled back
+MYSQL_LOCK_WAIT_TIMEOUT = 1205
+MYSQL_DEADLOCK = 1213
+RETRYABLE_MYSQL_ERRORS = frozenset({MYSQL_LOCK_WAIT_TIMEOUT, MYSQL_DEADLOCK})
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class RetryMetrics:
+    """
+    Counters for transaction retries.
+
+    Counters are keyed by operation name and track how many retries were
+    attempted, how many operations eventually succeeded after retrying and
+    how many gave up once all attempts were exhausted. Values are recorded
+    in the ``db_transaction_retries_total`` metric exposed on ``/metrics``.
+    """
+
+    OUTCOMES = ("retries", "recovered", "exhausted")
+
+    def record(self, operation: str, outcome: str) -> None:
+        """
+        Increment a counter for an operation.
+
+        Args:
+            operation: Name of the retried operation
+            outcome: One of ``retries``, ``recovered`` or ``exhausted``
+        """
+        db_transaction_retries_total.inc((operation, outcome))
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get a copy of the current counters.
+
+        Returns:
+            Mapping of operation name to outcome counters
+        """
+        counters: Dict[str, Dict[str, int]] = {}
+        values = db_transaction_retries_total.collect()
+        for (operation, outcome), value in values.items():
+            counters.setdefault(operation, dict.fromkeys(self.OUTCOMES, 0))
+            counters[operation][outcome] = int(value)
+        return counters
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        db_transaction_retries_total.reset()
+
+
+# Global retry metrics instance
+retry_metrics = RetryMetrics()
+
+
+def get_mysql_error_code(exc: BaseException) -> Optional[int]:
+    """
+    Extract the MySQL error code from a database exception.
+
+    Args:
+        exc: Exception raised by SQLAlchemy or the DBAPI driver
+
+    Returns:
+        Numeric MySQL error code or None if it cannot be determined
+    """
+    orig = exc.orig if isinstance(exc, DBAPIError) else exc
+    args = getattr(orig, "args", None)
+    if args and isinstance(args[0], int):
+        return args[0]
+    return None
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    Check whether an exception is a transient locking error.
+
+    Args:
+        exc: Exception to inspect
+
+    Returns:
+        True if the operation can be retried after a rollback
+    """
+    return (
+        isinstance(exc, DBAPIError)
+        and get_mysql_error_code(exc) in RETRYABLE_MYSQL_ERRORS
+    )
+
+
+def compute_backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Compute a jittered exponential backoff delay.
+
+    Uses "full jitter": a random delay between zero and the capped
+    exponential backoff, which spreads out competing writers.
+
+    Args:
+        attempt: Zero-based number of the failed attempt
+        base_delay: Delay in seconds for the first retry
+        max_delay: Upper bound for the delay in seconds
+
+    Returns:
+        Delay in seconds before the next attempt
+    """
+    return random.uniform(0, min(max_delay, base_delay * (2**attempt)))
+
+
+def retry_on_deadlock(
+    operation: Optional[str] = None,
+    max_attempts: Optional[int] = None,
+    base_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+) -> Callable[[F], F]:
+    """
+    Retry a repository method on MySQL deadlocks and lock wait timeouts.
+
+    The decorated method must belong to an object exposing its SQLAlchemy
+    session as ``self.db``. The session is rolled back before each retry,
+    so the whole method is re-executed inside a fresh transaction. Only
+    apply it to operations that are safe to run again from the start.
+
+    Args:
+        operation: Metric name for the operation (defaults to qualified name)
+        max_attempts: Total attempts including the first one
+        base_delay: Initial backoff delay in seconds
+        max_delay: Maximum backoff delay in seconds
+
+    Returns:
+        Decorator for sync or async repository methods
+
+    Example:
+        >>> class Repo:
+        ...     @retry_on_deadlock()
+        ...     async def update_async(self, ...): ...
+    """
+
+    def decorator(func: F) -> F:
+        name = operation or func.__qualname__
+
+        def _limits() -> tuple[int, float, float]:
+            return (
+                max(1, max_attempts or settings.db_retry_max_attempts),
+                settings.db_retry_base_delay if base_delay is None else base_delay,
+                settings.db_retry_max_delay if max_delay is None else max_delay,
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                attempts, base, cap = _limits()
+                for attempt in range(attempts):
+                    try:
+                        result = await func(self, *args, **kwargs)
+                    except DBAPIError as exc:
+                        if not is_retryable_error(exc):
+                            raise
+                        await self.db.rollback()
+                        if attempt + 1 >= attempts:
+                            retry_metrics.record(name, "exhausted")
+                            raise
+                        retry_metrics.record(name, "retries")
+                        await asyncio.sleep(compute_backoff(attempt, base, cap))
+                    else:
+                        if attempt:
+                            retry_metrics.record(name, "recovered")
+                        return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def sync_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            attempts, base, cap = _limits()
+            for attempt in range(attempts):
+                try:
+                    result = func(self, *args, **kwargs)
+                except DBAPIError as exc:
+                    if not is_retryable_error(exc):
+                        raise
+                    self.db.rollback()
+                    if attempt + 1 >= attempts:
+                        retry_metrics.record(name, "exhausted")
+                        raise
+                    retry_metrics.record(name, "retries")
+                    time.sleep(compute_backoff(attempt, base, cap))
+                else:
+                    if attempt:
+                        retry_metrics.record(name, "recovered")
+                    return result
+
+        return sync_wrapper  # type: ignore[return-value]
+
+    return decorator
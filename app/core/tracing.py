@@ -0,0 +1,374 @@
+"""
+Lightweight request tracing.
+
+Spans are opened around each request, each repository call and each
+Mailgun HTTP call, and linked through a context variable into traces.
+Trace context is read from and sent on as W3C ``traceparent`` headers.
+Finished spans go to pluggable exporters: a JSON-lines file written from
+a background thread, or an in-memory list for tests.
+
+Sampling is decided once per trace, at the root span. Child spans of an
+unsampled trace, or outside any trace, cost one context variable lookup
+and return a shared no-op span.
+"""
+
+import functools
+import inspect
+import json
+import queue
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from app.core.config import settings
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_SAMPLED_FLAG = 0x01
+
+
+@dataclass
+class Span:
+    """
+    A timed operation within a trace.
+
+    Attributes:
+        name: Operation name, e.g. ``repository.get_by_email_async``
+        trace_id: 32 hex digit trace ID shared by all spans of a trace
+        span_id: 16 hex digit ID of this span
+        parent_id: ID of the parent span, None for a root span
+        start_ns: Start time in nanoseconds since the epoch
+        duration_ms: Duration, set when the span ends
+        attributes: Extra key/value details
+        error: Exception type name if the operation failed
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_ns: int = 0
+    duration_ms: float = 0.0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value naming this span as parent."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Add a detail to the span.
+
+        Args:
+            key: Attribute name
+            value: JSON-serializable value
+        """
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    """Stand-in for spans that are not sampled; its own context manager."""
+
+    traceparent = None
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C ``traceparent`` header.
+
+    Args:
+        header: Header value
+
+    Returns:
+        Trace ID, parent span ID and sampled flag, or None if invalid
+    """
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if match is None:
+        return None
+    trace_id, span_id, flags = match.groups()
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & _SAMPLED_FLAG)
+
+
+class SpanExporter(ABC):
+    """Destination for finished spans."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """
+        Receive a finished span; must not block the event loop.
+
+        Args:
+            span: Finished span
+        """
+
+    def shutdown(self) -> None:
+        """Flush buffered spans and release resources."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keep finished spans in a list, for tests."""
+
+    def __init__(self) -> None:
+        """Initialize an empty exporter."""
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        """Store the span."""
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        """Forget all stored spans."""
+        self.spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """
+    Append finished spans to a file, one JSON object per line.
+
+    Spans are queued and written by a daemon thread, which is started on
+    the first export.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            path: File to append to
+        """
+        self.path = path
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Queue the span for writing."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._write_loop, name="span-exporter", daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put(span)
+
+    def _write_loop(self) -> None:
+        """Write queued spans until the shutdown sentinel arrives."""
+        with open(self.path, "a", encoding="utf-8") as output:
+            while True:
+                span = self._queue.get()
+                if span is None:
+                    return
+                output.write(json.dumps(asdict(span), default=str) + "\n")
+                if self._queue.empty():
+                    output.flush()
+
+    def shutdown(self) -> None:
+        """Write the queued spans and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+class Tracer:
+    """
+    Create spans and hand finished ones to exporters.
+
+    Example:
+        >>> with tracer.span("mailgun.post", {"operation": "send_email"}) as span:
+        ...     headers = {"traceparent": span.traceparent}
+    """
+
+    def __init__(
+        self, sample_rate: float = 0.0, exporters: Sequence[SpanExporter] = ()
+    ) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            sample_rate: Fraction of new traces to record (0 to 1)
+            exporters: Destinations for finished spans
+        """
+        self.sample_rate = sample_rate
+        self.exporters: List[SpanExporter] = list(exporters)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any span can be recorded at all."""
+        return bool(self.exporters)
+
+    def start_trace(
+        self, name: str, traceparent: Optional[str] = None
+    ) -> ContextManager[Any]:
+        """
+        Open a root span, continuing the caller's trace if one is given.
+
+        A valid ``traceparent`` keeps its trace ID and sampling decision;
+        otherwise a new trace is sampled at ``sample_rate``.
+
+        Args:
+            name: Span name
+            traceparent: Incoming W3C ``traceparent`` header
+
+        Returns:
+            Context manager yielding the span, or a no-op span if the trace
+            is not sampled
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        parent = parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+            sampled = random.random() < self.sample_rate
+        if not sampled:
+            return _NOOP_SPAN
+        return self._record(name, trace_id, parent_id, {})
+
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Any]:
+        """
+        Open a child span of the current span.
+
+        Outside a sampled trace this is a context variable lookup that
+        returns the shared no-op span.
+
+        Args:
+            name: Span name
+            attributes: Initial attributes
+
+        Returns:
+            Context manager yielding the span, or a no-op span outside a
+            sampled trace
+        """
+        parent = _current_span.get()
+        if parent is None:
+            return _NOOP_SPAN
+        return self._record(
+            name, parent.trace_id, parent.span_id, dict(attributes or {})
+        )
+
+    @contextmanager
+    def _record(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ) -> Iterator[Span]:
+        """Time a sampled span, make it current and export it."""
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            _current_span.reset(token)
+            for exporter in self.exporters:
+                exporter.export(span)
+
+    def shutdown(self) -> None:
+        """Flush and close all exporters."""
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+def traced(prefix: str) -> Callable[[Callable], Callable]:
+    """
+    Decorate a sync or async function to run inside a child span.
+
+    Args:
+        prefix: Span name prefix; the function name is appended
+
+    Returns:
+        Decorator preserving the wrapped function's signature
+
+    Example:
+        >>> @traced("repository")
+        ... async def get_by_id_async(self, client_id): ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        name = f"{prefix}.{func.__name__}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with tracer.span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with tracer.span(name):
+                return func(*args, **kwargs)
+
+        return sync_wrapper
+
+    return decorator
+
+
+# Global tracer
+tracer = Tracer(
+    sample_rate=settings.tracing_sample_rate,
+    exporters=(
+        [JsonLinesExporter(settings.tracing_export_path)]
+        if settings.tracing_export_path
+        else []
+    ),
+)
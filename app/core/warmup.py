@@ -0,0 +1,219 @@
+"""
+Application warm-up routines.
+
+This module pre-pays the one-time costs that would otherwise land on the
+first request after a deploy or a Lambda cold start: opening pooled
+database connections, establishing the Mailgun keep-alive connection and
+building the Pydantic validators and serializers used by the contact form.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+
+# Valid contact form payload used to build the validators and serializers
+WARMUP_FORM = {
+    "full_name": "Warm Up",
+    "email": "warmup@example.com",
+    "phone": "+52 123 456 7890",
+    "company": "Zititex",
+    "product_type": "Textiles",
+    "quantity": "100",
+    "message": "Warm-up request for the contact form validators.",
+}
+
+
+@dataclass
+class WarmupReport:
+    """
+    Result of a warm-up run.
+
+    Attributes:
+        total_ms: Wall-clock duration of the whole warm-up in milliseconds
+        steps: Duration of each successful step in milliseconds
+        errors: Error message of each failed step
+        skipped: Steps that had nothing to do (e.g. service not configured)
+    """
+
+    total_ms: float = 0.0
+    steps: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """
+        Build a one-line human readable summary.
+
+        Returns:
+            Summary with total and per-step durations
+        """
+        parts = [f"{name}={ms:.1f}ms" for name, ms in self.steps.items()]
+        parts += [f"{name}=failed" for name in self.errors]
+        parts += [f"{name}=skipped" for name in self.skipped]
+        return f"{self.total_ms:.1f}ms ({', '.join(parts) or 'nothing to do'})"
+
+
+def is_lambda_runtime() -> bool:
+    """
+    Check whether the code is running inside AWS Lambda.
+
+    Returns:
+        True if the Lambda runtime environment variables are present
+    """
+    return "AWS_LAMBDA_FUNCTION_NAME" in os.environ
+
+
+def warm_up_schemas() -> None:
+    """
+    Exercise contact form validation and serialization once.
+
+    Pydantic builds validators and serializers lazily, so running the
+    example payload through them moves that cost out of the first request.
+    """
+    from app.schemas.client import ContactForm, ContactResponse, ContactSubmissionData
+
+    form = ContactForm.model_validate_json(
+        ContactForm.model_validate(WARMUP_FORM).model_dump_json()
+    )
+    response = ContactResponse(
+        success=True,
+        message="warm-up",
+        data=ContactSubmissionData.from_form(form, datetime.now()),
+    )
+    response.model_dump_json()
+
+
+async def warm_up_database(connections: int) -> int:
+    """
+    Open pooled async database connections ahead of time.
+
+    Connections are checked out concurrently so the pool ends up holding
+    that many established connections once they are returned.
+
+    Args:
+        connections: Number of connections to open
+
+    Returns:
+        Number of connections that were opened
+    """
+    from app.core.database import async_engine
+
+    size = getattr(async_engine.pool, "size", None)
+    if callable(size):
+        connections = min(connections, size())
+    if connections <= 0:
+        return 0
+
+    async def open_connection() -> AsyncConnection:
+        conn = await async_engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    tasks = [asyncio.create_task(open_connection()) for _ in range(connections)]
+    try:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Also runs when the warm-up times out, so no connection is leaked
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None:
+                await task.result().close()
+    for task in tasks:
+        error = task.exception()
+        if error is not None:
+            raise error
+    return connections
+
+
+async def warm_up_mailgun() -> bool:
+    """
+    Establish the Mailgun keep-alive connection without blocking the loop.
+
+    Returns:
+        True if the connection was established
+    """
+    from app.services.mailgun import mailgun_service
+
+    return await asyncio.to_thread(mailgun_service.warm_up)
+
+
+async def warm_up(
+    db_connections: Optional[int] = None, timeout: Optional[float] = None
+) -> WarmupReport:
+    """
+    Run all warm-up steps concurrently.
+
+    Failures are recorded in the report instead of being raised, so a
+    missing database or email configuration never prevents startup. Each
+    step is abandoned after ``timeout`` seconds, so an unreachable
+    dependency cannot overrun the Lambda init window.
+
+    Args:
+        db_connections: Connections to pre-open (defaults to settings)
+        timeout: Seconds each step may take (defaults to settings)
+
+    Returns:
+        Report with total and per-step durations
+    """
+    report = WarmupReport()
+    started = time.perf_counter()
+    connections = (
+        settings.warmup_db_connections if db_connections is None else db_connections
+    )
+    step_timeout = settings.warmup_timeout if timeout is None else timeout
+
+    async def run_step(name: str, step: Callable[[], Awaitable[object]]) -> None:
+        step_started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(step(), step_timeout)
+        except asyncio.TimeoutError:
+            report.errors[name] = f"timed out after {step_timeout:g}s"
+        except Exception as e:
+            report.errors[name] = str(e)
+        else:
+            if result is False or result == 0:
+                report.skipped.append(name)
+            else:
+                report.steps[name] = (time.perf_counter() - step_started) * 1000
+
+    async def schemas() -> bool:
+        warm_up_schemas()
+        return True
+
+    await asyncio.gather(
+        run_step("schemas", schemas),
+        run_step("database", lambda: warm_up_database(connections)),
+        run_step("mailgun", warm_up_mailgun),
+    )
+
+    report.total_ms = (time.perf_counter() - started) * 1000
+    return report
+
+
+def warm_up_sync(
+    db_connections: Optional[int] = None, timeout: Optional[float] = None
+) -> WarmupReport:
+    """
+    Run the warm-up from synchronous code, such as Lambda module init.
+
+    The default event loop is reused because Mangum runs every invocation
+    on it, so pooled async connections opened here stay usable.
+
+    Args:
+        db_connections: Connections to pre-open (defaults to settings)
+        timeout: Seconds each step may take (defaults to settings)
+
+    Returns:
+        Report with total and per-step durations
+    """
+    loop = asyncio.get_event_loop()
+    return loop.run_until_complete(warm_up(db_connections, timeout))
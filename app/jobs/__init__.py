@@ -0,0 +1,6 @@
+"""
+Maintenance jobs package.
+
+This package contains batch jobs run outside the request path, from
+cron or a scheduled task, with ``python -m app.jobs.<job>``.
+"""
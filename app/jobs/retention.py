@@ -0,0 +1,280 @@
+"""
+Client retention job.
+
+Archives clients older than ``retention_days`` to gzip-compressed NDJSON
+files and deletes them, a small batch at a time in primary-key order.
+Each batch deletes its rows and advances a checkpoint in one short
+transaction, then pauses, so locks stay brief and an interrupted run
+resumes where it stopped. Only clients already counted by the stats
+rollup are deleted, so dashboards keep their history.
+
+Usage:
+    python -m app.jobs.retention --dry-run
+    python -m app.jobs.retention --days 365 --batch-size 500
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from pydantic_core import to_json
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logger import get_logger, setup_logging, shutdown_logging
+from app.models.client import Client
+from app.models.stats import RollupWatermark
+from app.repositories.stats_repository import (
+    ROLLUP_NAME,
+    RollupConflict,
+    StatsRepository,
+    ensure_watermark,
+)
+
+logger = get_logger(__name__)
+
+CHECKPOINT_NAME = "client_retention"
+
+
+@dataclass
+class RetentionReport:
+    """
+    Result of a retention run.
+
+    Attributes:
+        batches: Batches archived, or found on a dry run
+        clients: Clients archived and deleted, or found on a dry run
+        last_id: Highest client id handled
+        archives: Archive files written
+    """
+
+    batches: int = 0
+    clients: int = 0
+    last_id: int = 0
+    archives: List[Path] = field(default_factory=list)
+
+
+def _watermark(session: Session, name: str) -> Optional[int]:
+    """Read a watermark, or None if it was never set."""
+    return session.scalar(
+        select(RollupWatermark.last_id).where(RollupWatermark.name == name)
+    )
+
+
+def _next_batch(
+    session: Session, after_id: int, upto_id: int, cutoff: Any, batch_size: int
+) -> Sequence[Any]:
+    """Select the next expired clients by id, walking the primary key."""
+    table = Client.__table__
+    return (
+        session.execute(
+            select(table)
+            .where(
+                table.c.id > after_id,
+                table.c.id <= upto_id,
+                table.c.created_at < cutoff,
+            )
+            .order_by(table.c.id)
+            .limit(batch_size)
+        )
+        .mappings()
+        .all()
+    )
+
+
+def write_archive(directory: Path, rows: Sequence[Any]) -> Path:
+    """
+    Write clients to a gzip-compressed NDJSON file, one client per line.
+
+    The file is named after its id range and written under a temporary
+    name first, so a rerun of the same batch replaces it and a crash
+    never leaves a truncated archive.
+
+    Args:
+        directory: Archive directory, created if missing
+        rows: Client rows ordered by id
+
+    Returns:
+        Path of the archive
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"clients-{rows[0]['id']:010d}-{rows[-1]['id']:010d}.ndjson.gz"
+    partial = path.with_name(path.name + ".part")
+    with gzip.open(partial, "wb") as archive:
+        archive.writelines(to_json(dict(row)) + b"\n" for row in rows)
+    os.replace(partial, path)
+    return path
+
+
+def purge_expired_clients(
+    session: Session,
+    archive_dir: Path,
+    days: int,
+    batch_size: int = 1000,
+    sleep_seconds: float = 0.5,
+    max_batches: Optional[int] = None,
+    dry_run: bool = False,
+    settle_seconds: float = 5.0,
+) -> RetentionReport:
+    """
+    Archive and delete clients created more than ``days`` days ago.
+
+    Ids are assumed to follow creation order: each run resumes after the
+    checkpoint and never looks below it again. A real run stops at the
+    stats rollup watermark; a dry run previews up to where that
+    watermark would be once ``main`` has caught the rollup up.
+
+    Args:
+        session: Synchronous session
+        archive_dir: Directory for the archives
+        days: Minimum client age, by the database clock
+        batch_size: Clients per batch
+        sleep_seconds: Pause after each batch
+        max_batches: Stop after this many batches, None to finish
+        dry_run: Only count what would be archived; write nothing
+        settle_seconds: Client age the stats rollup waits for, bounding
+            a dry run
+
+    Returns:
+        Report of the run
+
+    Raises:
+        RollupConflict: If another run moved the checkpoint meanwhile
+    """
+    now = session.execute(select(func.now())).scalar_one()
+    cutoff = now - timedelta(days=days)
+    counted = _watermark(session, ROLLUP_NAME) or 0
+    if dry_run:
+        checkpoint = _watermark(session, CHECKPOINT_NAME) or 0
+        settled = session.scalar(
+            select(func.max(Client.id)).where(
+                Client.created_at <= now - timedelta(seconds=settle_seconds)
+            )
+        )
+        counted = max(counted, settled or 0)
+    else:
+        checkpoint = ensure_watermark(session, CHECKPOINT_NAME)
+        session.commit()
+
+    report = RetentionReport(last_id=checkpoint)
+    while max_batches is None or report.batches < max_batches:
+        rows = _next_batch(session, report.last_id, counted, cutoff, batch_size)
+        if not rows:
+            break
+        first_id, last_id = rows[0]["id"], rows[-1]["id"]
+        report.batches += 1
+        report.clients += len(rows)
+
+        if dry_run:
+            logger.info(
+                "Would archive clients",
+                extra={"first_id": first_id, "last_id": last_id, "clients": len(rows)},
+            )
+            report.last_id = last_id
+            continue
+
+        path = write_archive(archive_dir, rows)
+        session.execute(
+            delete(Client).where(Client.id.in_([row["id"] for row in rows]))
+        )
+        moved = session.execute(
+            update(RollupWatermark)
+            .where(RollupWatermark.name == CHECKPOINT_NAME)
+            .where(RollupWatermark.last_id == report.last_id)
+            .values(last_id=last_id)
+        )
+        if moved.rowcount != 1:
+            session.rollback()
+            raise RollupConflict(f"Retention checkpoint moved past {report.last_id}")
+        session.commit()
+        report.last_id = last_id
+        report.archives.append(path)
+        logger.info(
+            "Archived clients",
+            extra={"first_id": first_id, "last_id": last_id, "path": str(path)},
+        )
+
+        if len(rows) < batch_size:
+            break
+        time.sleep(sleep_seconds)
+
+    session.rollback()
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the retention job.
+
+    The stats rollup is caught up first, so expired clients are counted
+    before they are deleted.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``
+
+    Returns:
+        Exit status: 0 on success, 1 if another run holds the checkpoint
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--days", type=int, default=settings.retention_days)
+    parser.add_argument("--batch-size", type=int, default=settings.retention_batch_size)
+    parser.add_argument(
+        "--sleep-seconds", type=float, default=settings.retention_sleep_seconds
+    )
+    parser.add_argument(
+        "--archive-dir", type=Path, default=Path(settings.retention_archive_dir)
+    )
+    parser.add_argument("--max-batches", type=int, help="Stop after this many")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report what would be archived"
+    )
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    from app.core.database import SessionLocal
+
+    try:
+        with SessionLocal() as session:
+            if not args.dry_run:
+                StatsRepository(session).catch_up(
+                    settings.stats_rollup_batch_size,
+                    settings.stats_rollup_settle_seconds,
+                )
+            report = purge_expired_clients(
+                session,
+                args.archive_dir,
+                args.days,
+                args.batch_size,
+                args.sleep_seconds,
+                args.max_batches,
+                args.dry_run,
+                settings.stats_rollup_settle_seconds,
+            )
+        logger.info(
+            "Retention finished",
+            extra={
+                "batches": report.batches,
+                "clients": report.clients,
+                "last_id": report.last_id,
+                "dry_run": args.dry_run,
+            },
+        )
+        return 0
+    except RollupConflict:
+        logger.warning("Retention or stats rollup is already running elsewhere")
+        return 1
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Submission statistics rollup job.
+
+Counts every client created since the last run into the
+``client_daily_stats`` rollup. The stats endpoint also rolls up a few
+batches before answering; run this job on a schedule so a backlog never
+builds up in the request path.
+
+Usage:
+    python -m app.jobs.rollup
+    python -m app.jobs.rollup --batch-size 10000 --max-batches 50
+"""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+from app.core.config import settings
+from app.core.logger import get_logger, setup_logging, shutdown_logging
+from app.repositories.stats_repository import RollupConflict, StatsRepository
+
+logger = get_logger(__name__)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the rollup until it has caught up.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``
+
+    Returns:
+        Exit status: 0 on success, 1 if another run holds the watermark
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.stats_rollup_batch_size
+    )
+    parser.add_argument(
+        "--settle-seconds", type=float, default=settings.stats_rollup_settle_seconds
+    )
+    parser.add_argument("--max-batches", type=int, help="Stop after this many")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    from app.core.database import SessionLocal
+
+    try:
+        with SessionLocal() as session:
+            counted = StatsRepository(session).catch_up(
+                args.batch_size, args.settle_seconds, args.max_batches
+            )
+        logger.info("Stats rollup finished", extra={"clients": counted})
+        return 0
+    except RollupConflict:
+        logger.warning("Stats rollup is already running elsewhere")
+        return 1
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
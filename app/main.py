@@ -5,15 +5,36 @@ This module creates and configures the FastAPI application with
 all necessary middleware, CORS, and route registration.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from mangum import Mangum
+from fastapi.responses import JSONResponse, Response
+
 from app.api.v1 import contact
 from app.core.config import settings
+from app.core.keepwarm import handle_keep_warm, is_keep_warm_event
+from app.core.lifecycle import lifecycle, shutdown
+from app.core.logger import get_logger, setup_logging, shutdown_logging
+from app.core.metrics import CONTENT_TYPE_LATEST, flush_periodically, registry
+from app.core.responses import PydanticJSONResponse
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.body_limit import BodySizeLimitMiddleware, json_body_limit
+from app.middleware.cache import CacheControlMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.drain import DrainMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.timeout import TimeoutMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.schemas.client import ContactForm
+
+if TYPE_CHECKING:
+    from mangum import Mangum
+
+logger = get_logger(__name__)
 
 
 @asynccontextmanager
@@ -22,33 +43,66 @@ async def lifespan(app: FastAPI) -> Any:
     Application lifespan manager.
 
     Handles startup and shutdown events for the application,
-    including database table creation in development mode.
+    including database table creation in development mode. Shutdown
+    drains in-flight work before the connection pools are disposed.
     """
     # Startup
-    print("🚀 Starting Zititex API...")
+    setup_logging()
+    lifecycle.reset()
+    logger.info("Starting Zititex API")
 
     # Import models to ensure they're registered with SQLAlchemy
     from app.models import Client  # noqa: F401
 
     # Create database tables in development mode
     if settings.debug:
-        print("🔧 Debug mode: Creating database tables if they don't exist...")
+        logger.info("Debug mode: creating database tables if they don't exist")
         from app.core.database import create_tables
 
         try:
             await create_tables()
-            print("✅ Database tables ready")
+            logger.info("Database tables ready")
         except Exception as e:
-            print(f"⚠️ Warning: Could not create tables: {e}")
-            print("   This is normal if database is not configured yet")
+            logger.warning(
+                "Could not create tables; this is normal if the database "
+                "is not configured yet",
+                extra={"error": str(e)},
+            )
+
+    if settings.warmup_enabled:
+        from app.core.warmup import warm_up
+
+        report = await warm_up()
+        logger.info(
+            "Warm-up completed",
+            extra={"duration_ms": round(report.total_ms, 2), "steps": report.steps},
+        )
+        for step, error in report.errors.items():
+            logger.warning("Warm-up step failed", extra={"step": step, "error": error})
 
-    print("✅ Application started successfully")
+    metrics_flusher = None
+    if settings.metrics_enabled and registry.multiprocess_dir:
+        metrics_flusher = asyncio.create_task(
+            flush_periodically(registry, settings.metrics_flush_interval)
+        )
+
+    logger.info("Application started successfully")
 
     yield
 
     # Shutdown
-    print("👋 Shutting down Zititex API...")
-    print("✅ Application shutdown complete")
+    logger.info("Shutting down Zititex API")
+    if metrics_flusher is not None:
+        metrics_flusher.cancel()
+    drain_report = await shutdown(settings.shutdown_timeout)
+    if drain_report.clean:
+        logger.info("Application shutdown complete", extra=drain_report.as_dict())
+    else:
+        logger.warning(
+            "Application shutdown dropped work or failed to close resources",
+            extra=drain_report.as_dict(),
+        )
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -66,9 +120,66 @@ def create_app() -> FastAPI:
         docs_url="/docs",  # Siempre habilitado
         redoc_url="/redoc",  # Siempre habilitado
         lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
     )
 
-    # Add CORS middleware
+    # Add Cache-Control middleware (no-cache unless a route policy applies)
+    app.add_middleware(CacheControlMiddleware, policies=settings.cache_policies)
+
+    # Add response compression middleware
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_min_size,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+        )
+
+    # Give every request a deadline that database and email calls respect
+    app.add_middleware(TimeoutMiddleware, timeout=settings.request_timeout)
+
+    # Shed load on slow routes before their requests pile up
+    if settings.admission_enabled:
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            paths=settings.admission_paths,
+            retry_after=settings.admission_retry_after,
+        )
+
+    # Reject oversized bodies before they are buffered and parsed
+    app.add_middleware(
+        BodySizeLimitMiddleware,
+        limits={
+            "/api/v1/contact/": json_body_limit(ContactForm),
+            **settings.body_size_limits,
+        },
+        default_limit=settings.max_body_size,
+    )
+
+    # Track in-flight requests and turn new ones away while shutting down
+    app.add_middleware(DrainMiddleware)
+
+    # Profile requests on demand; not installed at all unless enabled
+    if settings.profiling_enabled:
+        app.add_middleware(
+            ProfilingMiddleware,
+            secret=settings.profiling_secret,
+            sample_rate=settings.profiling_sample_rate,
+            interval=settings.profiling_interval_ms / 1000,
+            exclude_paths=["/api/v1/admin/profiles"],
+        )
+
+    # Open the root span of each request (no-op unless tracing is configured)
+    app.add_middleware(TracingMiddleware)
+
+    # Add request metrics middleware (just inside CORS, so it times the whole
+    # stack)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
+    # Add CORS middleware last, so it is outermost: preflights are answered
+    # before any limit applies, and 413, 503 and 504 responses sent by the
+    # middleware above still carry CORS headers
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.allowed_origins,
@@ -77,27 +188,21 @@ def create_app() -> FastAPI:
         allow_headers=settings.allowed_headers,
     )
 
-    # Add no-cache middleware
-    @app.middleware("http")
-    async def add_no_cache_headers(request: Request, call_next):
-        """Add headers to prevent caching."""
-        response = await call_next(request)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
-
     # Global exception handler
     @app.exception_handler(Exception)
     async def global_exception_handler(
         request: Request, exc: Exception
     ) -> JSONResponse:
         """Global exception handler."""
-        print(f"❌ Global exception handler caught: {exc}")
-        print(f"❌ Exception type: {type(exc).__name__}")
-        import traceback
-
-        print(f"❌ Traceback: {traceback.format_exc()}")
+        logger.error(
+            "Unhandled exception",
+            exc_info=exc,
+            extra={
+                "path": request.url.path,
+                "method": request.method,
+                "exception_type": type(exc).__name__,
+            },
+        )
 
         return JSONResponse(
             status_code=500,
@@ -112,6 +217,15 @@ def create_app() -> FastAPI:
 
     # Include API routes
     app.include_router(contact.router, prefix="/api/v1")
+    if settings.admin_api_key:
+        from app.api.v1 import clients, stats
+
+        app.include_router(clients.router, prefix="/api/v1")
+        app.include_router(stats.router, prefix="/api/v1")
+    if settings.profiling_enabled:
+        from app.api.v1 import profiles
+
+        app.include_router(profiles.router, prefix="/api/v1")
 
     # Health check endpoint
     @app.get("/health")
@@ -123,6 +237,16 @@ def create_app() -> FastAPI:
             "version": settings.app_version,
         }
 
+    # Metrics endpoint
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics() -> Response:
+            """Prometheus metrics endpoint."""
+            # Multiprocess mode reads worker snapshots from disk
+            content = await asyncio.to_thread(registry.render)
+            return Response(content=content, media_type=CONTENT_TYPE_LATEST)
+
     # Root endpoint
     @app.get("/")
     async def root() -> dict[str, Any]:
@@ -137,8 +261,52 @@ def create_app() -> FastAPI:
     return app
 
 
+# Configure logging before anything else is logged (Lambda skips lifespan)
+setup_logging()
+
 # Create the application instance
 app = create_app()
 
-# Create Mangum handler for AWS Lambda
-handler = Mangum(app, lifespan="off")
+_mangum: Optional["Mangum"] = None
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    AWS Lambda entry point.
+
+    Keep-warm pings are answered directly, without going through Mangum
+    and the ASGI stack. Mangum is only needed on Lambda, so it is imported
+    and created on the first real invocation instead of whenever
+    ``app.main`` is imported.
+
+    Args:
+        event: API Gateway event
+        context: Lambda context
+
+    Returns:
+        API Gateway response
+    """
+    global _mangum
+    if is_keep_warm_event(event):
+        return handle_keep_warm(event, context)
+    if _mangum is None:
+        from mangum import Mangum
+
+        _mangum = Mangum(app, lifespan="off")
+    return _mangum(event, context)
+
+
+# Lambda runs lifespan="off", so warm up during init instead
+if settings.warmup_enabled:
+    from app.core.warmup import is_lambda_runtime, warm_up_sync
+
+    if is_lambda_runtime():
+        _warmup_report = warm_up_sync()
+        logger.info(
+            "Lambda init warm-up completed",
+            extra={
+                "duration_ms": round(_warmup_report.total_ms, 2),
+                "steps": _warmup_report.steps,
+                "errors": _warmup_report.errors,
+            },
+        )
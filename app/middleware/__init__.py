@@ -0,0 +1,30 @@
+"""
+ASGI middleware package.
+
+This package contains pure ASGI middleware that wraps the FastAPI
+application for cross-cutting concerns such as metrics, caching
+headers, compression, request deadlines, body size limits, load
+shedding, tracing, profiling and shutdown draining.
+"""
+
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.body_limit import BodySizeLimitMiddleware
+from app.middleware.cache import CacheControlMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.drain import DrainMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.timeout import TimeoutMiddleware
+from app.middleware.tracing import TracingMiddleware
+
+__all__ = [
+    "AdmissionControlMiddleware",
+    "BodySizeLimitMiddleware",
+    "CacheControlMiddleware",
+    "CompressionMiddleware",
+    "DrainMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "TimeoutMiddleware",
+    "TracingMiddleware",
+]
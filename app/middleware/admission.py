@@ -0,0 +1,112 @@
+"""
+Admission control middleware.
+
+This module sheds load on selected routes as a pure ASGI middleware.
+Requests over the adaptive concurrency limit of ``app.core.admission``
+are rejected before any body is read or parsed.
+"""
+
+import time
+from typing import Iterable, List, Optional, Set
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.admission import AIMDLimiter, admission_rejected_total
+from app.core.admission import contact_limiter as default_limiter
+from app.middleware.timeout import send_json_error
+
+# Statuses that mean the app or a dependency is overloaded
+OVERLOAD_STATUSES = frozenset({503, 504})
+
+
+class AdmissionControlMiddleware:
+    """
+    Reject requests above the adaptive concurrency limit.
+
+    Rejected requests get a 503 with ``Retry-After`` right away instead of
+    waiting in a queue. Admitted requests report their latency, and
+    whether they ended with an overload status, back to the limiter.
+    Paths match exactly, or as a prefix when they end with ``*``; other
+    paths, and ``OPTIONS`` preflights on any path, pass through.
+
+    Example:
+        >>> app.add_middleware(
+        ...     AdmissionControlMiddleware, paths=["/api/v1/contact/"]
+        ... )
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str] = (),
+        limiter: Optional[AIMDLimiter] = None,
+        retry_after: int = 1,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            paths: Guarded paths (or ``prefix*``)
+            limiter: Concurrency limiter (the contact limiter by default)
+            retry_after: Seconds sent in the ``Retry-After`` header
+        """
+        self.app = app
+        self.limiter = limiter or default_limiter
+        self.retry_after = str(retry_after).encode("latin-1")
+        self._exact: Set[str] = set()
+        self._prefixes: List[str] = []
+        for path in paths:
+            if path.endswith("*"):
+                self._prefixes.append(path[:-1])
+            else:
+                self._exact.add(path)
+
+    def guards(self, path: str) -> bool:
+        """
+        Check whether a path is subject to admission control.
+
+        Args:
+            path: Request path
+
+        Returns:
+            True if requests to the path go through the limiter
+        """
+        return path in self._exact or any(map(path.startswith, self._prefixes))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not self.guards(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not self.limiter.try_acquire():
+            admission_rejected_total.inc()
+            await send_json_error(
+                send,
+                503,
+                "Server is busy, please retry",
+                [(b"retry-after", self.retry_after)],
+            )
+            return
+
+        status_code = 500
+        started = time.monotonic()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.limiter.release(
+                time.monotonic() - started,
+                overloaded=status_code in OVERLOAD_STATUSES,
+            )
@@ -0,0 +1,188 @@
+"""
+Request body size middleware.
+
+This module caps request bodies per route as a pure ASGI middleware. The
+body is counted while it streams in, so an oversized request is rejected
+with a 413 before it is buffered, JSON-decoded or validated.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middleware.timeout import send_json_error
+
+# Longest JSON encoding of one character (a ``\uXXXX`` escape)
+_MAX_ESCAPED_CHAR = 6
+
+# Room for braces, commas, quotes and pretty-printing whitespace
+_JSON_SLACK = 1024
+
+
+def json_body_limit(model: Type[BaseModel], unbounded_field_length: int = 2048) -> int:
+    """
+    Compute an upper bound on the JSON body of any valid model instance.
+
+    Every field's ``max_length`` is counted as if each character needed
+    a ``\\uXXXX`` escape, so no valid body is ever above the bound. A
+    body above it must hold an oversized field and can be rejected
+    without parsing it.
+
+    Args:
+        model: Request body model
+        unbounded_field_length: Length assumed for fields without a
+            ``max_length`` (2048 is Pydantic's limit for emails)
+
+    Returns:
+        Maximum body size in bytes
+
+    Example:
+        >>> json_body_limit(ContactForm)
+        28857
+    """
+    size = _JSON_SLACK
+    for name, field in model.model_fields.items():
+        lengths = [getattr(item, "max_length", None) for item in field.metadata]
+        max_length = next(
+            (length for length in lengths if length is not None),
+            unbounded_field_length,
+        )
+        # "name": "value",
+        size += len(name) + 6 + max_length * _MAX_ESCAPED_CHAR
+    return size
+
+
+class _BodyTooLarge(HTTPException):
+    """
+    Raised from ``receive`` once the body exceeds the route limit.
+
+    It is an ``HTTPException`` so that the app's exception handling turns
+    it into a 413 even where the body is read inside a ``try`` block, as
+    FastAPI does when parsing request bodies.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """
+        Initialize the exception.
+
+        Args:
+            limit: Body size limit in bytes
+        """
+        super().__init__(
+            status_code=413,
+            detail=f"Request body exceeds {limit} bytes",
+            headers={"Connection": "close"},
+        )
+
+
+class BodySizeLimitMiddleware:
+    """
+    Reject request bodies above a per-route size limit.
+
+    A ``Content-Length`` above the limit is rejected before any of the
+    body is read. Otherwise the body is counted as it arrives, which also
+    covers chunked uploads, and reading stops at the first chunk over the
+    limit. Limits match the path exactly, or as a prefix when the key ends
+    with ``*``; other paths get ``default_limit``.
+
+    Example:
+        >>> app.add_middleware(
+        ...     BodySizeLimitMiddleware,
+        ...     limits={"/api/v1/contact/": json_body_limit(ContactForm)},
+        ...     default_limit=1_048_576,
+        ... )
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limits: Optional[Mapping[str, int]] = None,
+        default_limit: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            limits: Mapping of path (or ``prefix*``) to maximum body bytes
+            default_limit: Limit for other paths (None for no limit)
+        """
+        self.app = app
+        self.default_limit = default_limit
+        self._exact: Dict[str, int] = {}
+        self._prefixes: List[Tuple[str, int]] = []
+        for path, limit in (limits or {}).items():
+            if path.endswith("*"):
+                self._prefixes.append((path[:-1], limit))
+            else:
+                self._exact[path] = limit
+        self._prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+
+    def limit_for(self, path: str) -> Optional[int]:
+        """
+        Resolve the body size limit of a request path.
+
+        Args:
+            path: Request path
+
+        Returns:
+            Maximum body size in bytes, or None without a limit
+        """
+        limit = self._exact.get(path)
+        if limit is not None:
+            return limit
+        for prefix, prefix_limit in self._prefixes:
+            if path.startswith(prefix):
+                return prefix_limit
+        return self.default_limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        limit = self.limit_for(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > limit:
+                    await self._reject(send, limit)
+                    return
+                break
+
+        max_bytes = limit
+        received = 0
+        response_started = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    raise _BodyTooLarge(max_bytes)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except _BodyTooLarge:
+            if response_started:
+                raise
+            await self._reject(send, limit)
+
+    async def _reject(self, send: Send, limit: int) -> None:
+        """Send the 413 response."""
+        await send_json_error(
+            send,
+            413,
+            f"Request body exceeds {limit} bytes",
+            [(b"connection", b"close")],
+        )
@@ -0,0 +1,98 @@
+"""
+Cache-Control headers middleware.
+
+This module sets caching headers as a pure ASGI middleware. Headers are
+injected into the ``http.response.start`` message, so responses are never
+buffered or re-wrapped and streaming responses pass straight through.
+"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+RawHeaders = List[Tuple[bytes, bytes]]
+
+NO_CACHE_HEADERS: RawHeaders = [
+    (b"cache-control", b"no-cache, no-store, must-revalidate"),
+    (b"pragma", b"no-cache"),
+    (b"expires", b"0"),
+]
+
+
+class CacheControlMiddleware:
+    """
+    Apply a per-route Cache-Control policy.
+
+    The policy table maps paths to a Cache-Control value. Keys match the
+    request path exactly, or as a prefix when they end with ``*``; the
+    longest prefix wins. Unmatched paths get the no-cache headers. Route
+    policies only apply to 2xx and 3xx responses; errors always get the
+    no-cache headers so an outage is never cached. A Cache-Control header
+    set by the endpoint itself is left untouched.
+
+    Example:
+        >>> app.add_middleware(
+        ...     CacheControlMiddleware,
+        ...     policies={"/health": "public, max-age=10"},
+        ... )
+    """
+
+    def __init__(
+        self, app: ASGIApp, policies: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            policies: Mapping of path (or ``prefix*``) to Cache-Control value
+        """
+        self.app = app
+        self._exact: Dict[str, RawHeaders] = {}
+        self._prefixes: List[Tuple[str, RawHeaders]] = []
+        for path, value in (policies or {}).items():
+            headers = [(b"cache-control", value.encode("latin-1"))]
+            if path.endswith("*"):
+                self._prefixes.append((path[:-1], headers))
+            else:
+                self._exact[path] = headers
+        self._prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+
+    def headers_for(self, path: str) -> RawHeaders:
+        """
+        Resolve the caching headers for a request path.
+
+        Args:
+            path: Request path
+
+        Returns:
+            Raw headers to add to the response
+        """
+        headers = self._exact.get(path)
+        if headers is not None:
+            return headers
+        for prefix, prefix_headers in self._prefixes:
+            if path.startswith(prefix):
+                return prefix_headers
+        return NO_CACHE_HEADERS
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cache_headers = self.headers_for(scope["path"])
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                if not any(name.lower() == b"cache-control" for name, _ in headers):
+                    if 200 <= message["status"] < 400:
+                        headers.extend(cache_headers)
+                    else:
+                        headers.extend(NO_CACHE_HEADERS)
+                    message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,259 @@
+"""
+Response compression middleware.
+
+This module negotiates brotli or gzip compression as a pure ASGI
+middleware. Small bodies and already-compressed content types are sent
+as-is, and streaming responses are compressed and flushed chunk by chunk
+instead of being buffered.
+"""
+
+import zlib
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+# Content types that are already compressed or do not compress well
+INCOMPRESSIBLE_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-bzip2",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+    "application/pdf",
+    "application/octet-stream",
+)
+
+
+def parse_accept_encoding(value: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into codings and q-values.
+
+    Args:
+        value: Header value, e.g. ``"gzip, br;q=0.9, *;q=0"``
+
+    Returns:
+        Mapping of lowercase coding to quality
+    """
+    codings: Dict[str, float] = {}
+    for part in value.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[coding.strip().lower()] = quality
+    return codings
+
+
+class _Encoder:
+    """Incremental encoder wrapping gzip or brotli."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor: Any = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk, returning whatever output is ready."""
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so the client can decode it now."""
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        """Flush the remaining compressed output."""
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip.
+
+    The encoding is chosen from the request's Accept-Encoding, preferring
+    brotli when it is installed. Complete bodies shorter than
+    ``minimum_size`` are left alone. For streaming responses the headers
+    are sent before the body is known, so they are compressed
+    incrementally unless a Content-Length below the minimum was declared.
+
+    Example:
+        >>> app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        excluded_types: Iterable[str] = INCOMPRESSIBLE_TYPES,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            minimum_size: Smallest body size in bytes worth compressing
+            gzip_level: zlib compression level (1-9)
+            brotli_quality: Brotli quality (0-11)
+            excluded_types: Content type prefixes that are never compressed
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_types = tuple(excluded_types)
+
+    def select_encoding(self, accept_encoding: str) -> Optional[str]:
+        """
+        Pick the best supported encoding for a request.
+
+        Args:
+            accept_encoding: Accept-Encoding request header
+
+        Returns:
+            ``br``, ``gzip`` or None if neither is acceptable
+        """
+        if not accept_encoding:
+            return None
+        codings = parse_accept_encoding(accept_encoding)
+        wildcard = codings.get("*", 0.0)
+        candidates = ("br", "gzip") if brotli is not None else ("gzip",)
+        best: Optional[Tuple[float, str]] = None
+        for coding in candidates:
+            quality = codings.get(coding, wildcard)
+            if quality > 0 and (best is None or quality > best[0]):
+                best = (quality, coding)
+        return best[1] if best else None
+
+    def is_compressible(self, headers: Headers) -> bool:
+        """
+        Check whether a response may be compressed based on its headers.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            True if the content type and encoding allow compression
+        """
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(self.excluded_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = self.select_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request state machine deciding whether and how to compress."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        """Intercept response messages."""
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message.get("headers", []))
+            status = message["status"]
+            declared = headers.get("content-length")
+            self.passthrough = (
+                status < 200
+                or status in (204, 304)
+                or not self.middleware.is_compressible(headers)
+                or (
+                    declared is not None
+                    and int(declared) < self.middleware.minimum_size
+                )
+            )
+            if self.passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self.encoder = _Encoder(
+                self.encoding,
+                self.middleware.gzip_level,
+                self.middleware.brotli_quality,
+            )
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+                await self._send({**start, "headers": headers.raw})
+            else:
+                compressed = self.encoder.compress(body) + self.encoder.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self._send({**start, "headers": headers.raw})
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+        assert self.encoder is not None
+        if more_body:
+            if not body:
+                return
+            chunk = self.encoder.flush(body)
+        else:
+            chunk = self.encoder.compress(body) + self.encoder.finish()
+        await self._send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
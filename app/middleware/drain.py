@@ -0,0 +1,71 @@
+"""
+Shutdown draining middleware.
+
+This module counts in-flight requests for the shutdown drain and turns
+away new requests once draining has started, as a pure ASGI middleware.
+"""
+
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.lifecycle import Lifecycle
+from app.core.lifecycle import lifecycle as default_lifecycle
+
+DRAINING_BODY = b'{"success":false,"message":"Server is shutting down"}'
+
+
+class DrainMiddleware:
+    """
+    Track in-flight requests and reject new ones while draining.
+
+    Rejected requests get a 503 with ``Retry-After`` and
+    ``Connection: close``, so clients and load balancers retry on another
+    instance instead of reusing the connection.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        lifecycle: Optional[Lifecycle] = None,
+        retry_after: int = 1,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            lifecycle: Lifecycle to report to (the global one by default)
+            retry_after: Seconds sent in the ``Retry-After`` header
+        """
+        self.app = app
+        self.lifecycle = lifecycle or default_lifecycle
+        self.retry_after = str(retry_after).encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.lifecycle.accepting:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 503,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(DRAINING_BODY)).encode()),
+                        (b"retry-after", self.retry_after),
+                        (b"connection", b"close"),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": DRAINING_BODY})
+            return
+
+        self.lifecycle.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.lifecycle.request_finished()
@@ -0,0 +1,83 @@
+"""
+Request metrics middleware.
+
+This module records per-route latency, status codes and in-flight
+requests as a pure ASGI middleware.
+"""
+
+import time
+from typing import Any, Callable, Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Record HTTP request metrics.
+
+    Routes are labelled with their path template (e.g. ``/api/v1/contact/``)
+    rather than the raw path, so label cardinality stays bounded. Requests
+    that match no route share a single ``<unmatched>`` label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+        """
+        self.app = app
+        self._route_paths: Dict[Callable[..., Any], str] = {}
+
+    def _route_label(self, scope: Scope) -> str:
+        """Resolve the path template of the route that handled a request."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            router = scope.get("router") or getattr(scope.get("app"), "router", None)
+            for route in getattr(router, "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = getattr(route, "path", UNMATCHED_ROUTE)
+                    break
+            else:
+                path = UNMATCHED_ROUTE
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            method = scope["method"]
+            route = self._route_label(scope)
+            http_request_duration_seconds.observe(
+                time.perf_counter() - started, (method, route)
+            )
+            http_requests_total.inc((method, route, str(status_code)))
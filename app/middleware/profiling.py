@@ -0,0 +1,119 @@
+"""
+Request profiling middleware.
+
+This module profiles selected requests with the sampling profiler of
+``app.core.profiling`` as a pure ASGI middleware. It is only added to the
+app when profiling is enabled, so it costs nothing otherwise.
+"""
+
+import asyncio
+import hmac
+import random
+import threading
+import time
+from typing import Optional, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiling import Profile, ProfileStore, StackSampler
+from app.core.profiling import profile_store as default_store
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+
+
+class ProfilingMiddleware:
+    """
+    Profile requests that send the secret header or are sampled.
+
+    A request is profiled when its ``X-Profile`` header matches
+    ``secret`` or, independently, with probability ``sample_rate``. The
+    response of a profiled request carries an ``X-Profile-Id`` header
+    naming the stored profile. Requests under ``exclude_paths``, such as
+    the profile download routes, are never profiled, so browsing the
+    ring buffer does not push profiles out of it.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        secret: Optional[str] = None,
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        store: Optional[ProfileStore] = None,
+        exclude_paths: Sequence[str] = (),
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            secret: Header value that triggers profiling (None disables it)
+            sample_rate: Fraction of other requests to profile
+            interval: Seconds between stack samples
+            store: Where profiles are kept (the global store by default)
+            exclude_paths: Path prefixes that are never profiled
+        """
+        self.app = app
+        self.secret = secret.encode("latin-1") if secret else None
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.store = store or default_store
+        self.exclude_paths = tuple(exclude_paths)
+
+    def wants_profile(self, scope: Scope) -> bool:
+        """
+        Decide whether to profile a request.
+
+        Args:
+            scope: ASGI scope
+
+        Returns:
+            True if the secret header matches or the request is sampled,
+            and the path is not excluded
+        """
+        if scope["path"].startswith(self.exclude_paths):
+            return False
+        if self.secret is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    if hmac.compare_digest(value, self.secret):
+                        return True
+                    break
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http" or not self.wants_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self.store.next_id()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_ID_HEADER, str(profile_id).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(threading.get_ident(), self.interval)
+        started_at = time.time()
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Joining the sampler may take up to one interval
+            samples = await asyncio.to_thread(sampler.stop)
+            self.store.add(
+                Profile(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    started_at=started_at,
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    interval_ms=self.interval * 1000,
+                    samples=samples,
+                )
+            )
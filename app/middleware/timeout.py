@@ -0,0 +1,132 @@
+"""
+Request timeout middleware.
+
+This module gives every request a deadline as a pure ASGI middleware.
+The deadline is published through ``app.core.deadline`` so database and
+email calls can bound their own timeouts, and requests still running when
+it passes are cancelled and answered with a 504.
+"""
+
+import asyncio
+import json
+from typing import Iterable, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.deadline import DeadlineExceeded, reset_deadline, set_deadline
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def send_json_error(
+    send: Send,
+    status: int,
+    message: str,
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+) -> None:
+    """
+    Send a complete JSON error response.
+
+    Args:
+        send: ASGI send callable
+        status: HTTP status code
+        message: Error message for the ``message`` field
+        headers: Extra raw headers
+    """
+    body = json.dumps({"success": False, "message": message}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class TimeoutMiddleware:
+    """
+    Enforce a per-request deadline.
+
+    On Lambda the deadline is also capped by the invocation's remaining
+    time (minus ``lambda_margin``), so the app answers before the runtime
+    kills it. Requests that hit the deadline get a 504; requests that
+    fail fast because too little time was left to start a database or
+    email call (``DeadlineExceeded``) get a 503 with ``Retry-After``.
+    """
+
+    def __init__(
+        self, app: ASGIApp, timeout: float = 10.0, lambda_margin: float = 0.5
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            timeout: Seconds each request may take
+            lambda_margin: Seconds kept in reserve before the Lambda timeout
+        """
+        self.app = app
+        self.timeout = timeout
+        self.lambda_margin = lambda_margin
+
+    def budget(self, scope: Scope) -> float:
+        """
+        Compute the time a request may take.
+
+        Args:
+            scope: ASGI scope, with ``aws.context`` when served by Mangum
+
+        Returns:
+            Seconds until the request deadline
+        """
+        context = scope.get("aws.context")
+        if context is None:
+            return self.timeout
+        lambda_left = context.get_remaining_time_in_millis() / 1000
+        return min(self.timeout, lambda_left - self.lambda_margin)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        budget = self.budget(scope)
+        token = set_deadline(budget)
+        try:
+            async with asyncio.timeout(budget):
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            logger.warning(
+                "Request timed out",
+                extra={"path": scope["path"], "timeout_s": round(budget, 3)},
+            )
+            if response_started:
+                raise
+            await send_json_error(send, 504, "Request timed out")
+        except DeadlineExceeded as e:
+            logger.warning(
+                "Request deadline exceeded",
+                extra={"path": scope["path"], "error": str(e)},
+            )
+            if response_started:
+                raise
+            await send_json_error(
+                send, 503, "Request deadline exceeded", [(b"retry-after", b"1")]
+            )
+        finally:
+            reset_deadline(token)
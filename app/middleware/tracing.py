@@ -0,0 +1,63 @@
+"""
+Request tracing middleware.
+
+This module opens the root span of each request as a pure ASGI
+middleware, continuing the caller's trace when a W3C ``traceparent``
+header is sent.
+"""
+
+from typing import Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import Tracer
+from app.core.tracing import tracer as default_tracer
+
+
+class TracingMiddleware:
+    """
+    Trace each HTTP request.
+
+    The root span is named after the method and path and records the
+    matched route template and response status. Spans opened further
+    down, in the repository and the Mailgun service, become its children.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Optional[Tracer] = None) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            tracer: Tracer to record with (the global one by default)
+        """
+        self.app = app
+        self.tracer = tracer or default_tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        with self.tracer.start_trace(
+            f"{scope['method']} {scope['path']}", traceparent
+        ) as span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    span.set_attribute("http.route", getattr(route, "path", None))
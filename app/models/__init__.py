@@ -5,6 +5,6 @@ This package contains all SQLAlchemy ORM models for the application.
 """
 
 from app.models.client import Client
+from app.models.stats import ClientDailyStats, RollupWatermark
 
-__all__ = ["Client"]
-
+__all__ = ["Client", "ClientDailyStats", "RollupWatermark"]
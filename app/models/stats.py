@@ -0,0 +1,47 @@
+"""
+Submission statistics models.
+
+This module contains the rollup table of daily submission counts and
+the high-water marks of the batch jobs over the client table.
+"""
+
+from sqlalchemy import Column, Date, Integer, String
+
+from app.core.database import Base
+
+
+class ClientDailyStats(Base):
+    """
+    Number of client submissions per day, product type and company.
+
+    Missing product types and companies are stored as empty strings, so
+    they can be part of the primary key.
+
+    Attributes:
+        day: Day the submissions were created
+        product_type: Product type, or "" if none was given
+        company: Company, or "" if none was given
+        submissions: Number of submissions
+    """
+
+    __tablename__ = "client_daily_stats"
+
+    day = Column(Date, primary_key=True)
+    product_type = Column(String(50), primary_key=True, default="")
+    company = Column(String(255), primary_key=True, default="")
+    submissions = Column(Integer, nullable=False, default=0)
+
+
+class RollupWatermark(Base):
+    """
+    Progress of an incremental batch job over the client table.
+
+    Attributes:
+        name: Job name, e.g. ``client_daily_stats`` or ``client_retention``
+        last_id: Highest client id already processed
+    """
+
+    __tablename__ = "rollup_watermark"
+
+    name = Column(String(50), primary_key=True)
+    last_id = Column(Integer, nullable=False, default=0)
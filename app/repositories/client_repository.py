@@ -5,15 +5,102 @@ This module implements the Repository Pattern for Client entity operations,
 providing clean separation between business logic and data access.
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, cast
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, Select, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, load_only
 
+from app.core.deadline import check_deadline
+from app.core.metrics import observe_duration, repository_call_duration_seconds
+from app.core.retry import retry_on_deadlock
+from app.core.tracing import traced
 from app.models.client import Client
 from app.schemas.client import ClientCreate, ClientUpdate
 
+timed = observe_duration(repository_call_duration_seconds)
+trace = traced("repository")
+
+# MySQL optimizer hint that aborts a SELECT after the given milliseconds
+_MAX_EXECUTION_TIME = "/*+ MAX_EXECUTION_TIME({}) */"
+
+
+def _bounded(statement: Select) -> Select:
+    """
+    Limit a SELECT to the time left before the request deadline.
+
+    The limit is rounded down to 100ms steps so the number of distinct
+    statements in SQLAlchemy's compiled cache stays small. Other dialects
+    ignore the hint.
+
+    Args:
+        statement: Query to bound
+
+    Returns:
+        The query with a ``MAX_EXECUTION_TIME`` hint, or unchanged
+        without a deadline
+
+    Raises:
+        DeadlineExceeded: If too little time is left to run it
+    """
+    left = check_deadline()
+    if left is None:
+        return statement
+    milliseconds = max(int(left * 10) * 100, 100)
+    return statement.prefix_with(
+        _MAX_EXECUTION_TIME.format(milliseconds), dialect="mysql"
+    )
+
+
+# The unbounded TEXT column is left out of lookups and listings unless a
+# caller opts in; touching it on an instance then raises instead of
+# issuing one extra query per row
+_DEFER_MESSAGE = defer(getattr(Client, "message"), raiseload=True)
+
+
+def _paginate(statement: Select, skip: int, limit: int) -> Select:
+    """
+    Order a query newest first and cut one page out of it.
+
+    The id breaks ties between rows created in the same second, so pages
+    do not overlap or skip rows.
+
+    Args:
+        statement: Query over the client table
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Page query
+    """
+    return (
+        statement.order_by(Client.created_at.desc(), Client.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+def _columns(
+    statement: Select, fields: Optional[Sequence[str]], message: bool
+) -> Select:
+    """
+    Limit the columns loaded into ``Client`` instances.
+
+    Args:
+        statement: Query selecting ``Client``
+        fields: Column attributes to load, or None for all of them; the
+            primary key is always loaded
+        message: Load the message column when no fields are given
+
+    Returns:
+        Query with loader options applied
+    """
+    if fields is not None:
+        return statement.options(load_only(*(getattr(Client, name) for name in fields)))
+    if not message:
+        return statement.options(_DEFER_MESSAGE)
+    return statement
+
 
 class ClientRepository:
     """
@@ -26,6 +113,12 @@ class ClientRepository:
     Design Patterns:
         - Repository Pattern: Abstracts data access logic
         - Dependency Injection: Database session injected via constructor
+        - Retry: Write operations are re-run on MySQL deadlocks and
+          lock wait timeouts (see ``app.core.retry``)
+        - Metrics: Every call is timed in ``repository_call_duration_seconds``
+        - Tracing: Every call runs in a ``repository.<method>`` span
+        - Deadlines: Queries are capped at the time left in the request with
+          MySQL's ``MAX_EXECUTION_TIME`` (see ``app.core.deadline``)
 
     SOLID Principles:
         - Single Responsibility: Only handles Client data access
@@ -42,6 +135,9 @@ class ClientRepository:
         self.db = db
         self.is_async = isinstance(db, AsyncSession)
 
+    @trace
+    @timed
+    @retry_on_deadlock()
     async def create_async(self, client_data: ClientCreate) -> Client:
         """
         Create a new client record asynchronously.
@@ -56,12 +152,16 @@ class ClientRepository:
             >>> repo = ClientRepository(async_db)
             >>> client = await repo.create_async(ClientCreate(...))
         """
+        check_deadline()
         client = Client(**client_data.model_dump())
         self.db.add(client)
         await self.db.commit()
         await self.db.refresh(client)
         return client
 
+    @trace
+    @timed
+    @retry_on_deadlock()
     def create(self, client_data: ClientCreate) -> Client:
         """
         Create a new client record synchronously.
@@ -76,12 +176,15 @@ class ClientRepository:
             >>> repo = ClientRepository(db)
             >>> client = repo.create(ClientCreate(...))
         """
+        check_deadline()
         client = Client(**client_data.model_dump())
         self.db.add(client)
         self.db.commit()
         self.db.refresh(client)
         return client
 
+    @trace
+    @timed
     async def get_by_id_async(self, client_id: int) -> Optional[Client]:
         """
         Get client by ID asynchronously.
@@ -92,9 +195,13 @@ class ClientRepository:
         Returns:
             Client instance or None if not found
         """
-        result = await self.db.execute(select(Client).where(Client.id == client_id))
+        result = await self.db.execute(
+            _bounded(select(Client).where(Client.id == client_id))
+        )
         return result.scalar_one_or_none()
 
+    @trace
+    @timed
     def get_by_id(self, client_id: int) -> Optional[Client]:
         """
         Get client by ID synchronously.
@@ -105,37 +212,57 @@ class ClientRepository:
         Returns:
             Client instance or None if not found
         """
-        result = self.db.execute(select(Client).where(Client.id == client_id))
+        result = self.db.execute(_bounded(select(Client).where(Client.id == client_id)))
         return result.scalar_one_or_none()
 
-    async def get_by_email_async(self, email: str) -> Optional[Client]:
+    @trace
+    @timed
+    async def get_by_email_async(
+        self, email: str, include_message: bool = False
+    ) -> Optional[Client]:
         """
         Get client by email asynchronously.
 
         Args:
             email: Client email address
+            include_message: Also load the message column
 
         Returns:
             Client instance or None if not found
         """
-        result = await self.db.execute(select(Client).where(Client.email == email))
+        statement = select(Client).where(Client.email == email)
+        result = await self.db.execute(
+            _bounded(_columns(statement, None, include_message))
+        )
         return result.scalar_one_or_none()
 
-    def get_by_email(self, email: str) -> Optional[Client]:
+    @trace
+    @timed
+    def get_by_email(
+        self, email: str, include_message: bool = False
+    ) -> Optional[Client]:
         """
         Get client by email synchronously.
 
         Args:
             email: Client email address
+            include_message: Also load the message column
 
         Returns:
             Client instance or None if not found
         """
-        result = self.db.execute(select(Client).where(Client.email == email))
+        statement = select(Client).where(Client.email == email)
+        result = self.db.execute(_bounded(_columns(statement, None, include_message)))
         return result.scalar_one_or_none()
 
+    @trace
+    @timed
     async def get_all_async(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        include_message: bool = False,
     ) -> List[Client]:
         """
         Get all clients with pagination asynchronously.
@@ -143,31 +270,96 @@ class ClientRepository:
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            fields: Columns to load, or None for all but the message; the
+                others must not be accessed on the returned instances
+            include_message: Also load the message column when no fields
+                are given
 
         Returns:
             List of client instances
         """
-        result = await self.db.execute(
-            select(Client).offset(skip).limit(limit).order_by(Client.created_at.desc())
-        )
+        statement = _columns(select(Client), fields, include_message)
+        result = await self.db.execute(_bounded(_paginate(statement, skip, limit)))
         return list(result.scalars().all())
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Client]:
+    @trace
+    @timed
+    async def get_rows_async(
+        self, fields: Sequence[str], skip: int = 0, limit: int = 100
+    ) -> List[Row[Any]]:
+        """
+        Get one page of selected columns asynchronously, for read-only use.
+
+        Rows are plain named tuples; no ``Client`` instances are built or
+        tracked by the session.
+
+        Args:
+            fields: Column names, in the order of each row
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Rows of the selected columns, newest client first
+        """
+        session = cast(AsyncSession, self.db)
+        statement = select(*(getattr(Client, name) for name in fields))
+        result = await session.execute(_bounded(_paginate(statement, skip, limit)))
+        return list(result.all())
+
+    @trace
+    @timed
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+        include_message: bool = False,
+    ) -> List[Client]:
         """
         Get all clients with pagination synchronously.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            fields: Columns to load, or None for all but the message; the
+                others load lazily on access
+            include_message: Also load the message column when no fields
+                are given
 
         Returns:
             List of client instances
         """
-        result = self.db.execute(
-            select(Client).offset(skip).limit(limit).order_by(Client.created_at.desc())
-        )
+        statement = _columns(select(Client), fields, include_message)
+        result = self.db.execute(_bounded(_paginate(statement, skip, limit)))
         return list(result.scalars().all())
 
+    @trace
+    @timed
+    def get_rows(
+        self, fields: Sequence[str], skip: int = 0, limit: int = 100
+    ) -> List[Row[Any]]:
+        """
+        Get one page of selected columns synchronously, for read-only use.
+
+        Rows are plain named tuples; no ``Client`` instances are built or
+        tracked by the session.
+
+        Args:
+            fields: Column names, in the order of each row
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Rows of the selected columns, newest client first
+        """
+        session = cast(Session, self.db)
+        statement = select(*(getattr(Client, name) for name in fields))
+        result = session.execute(_bounded(_paginate(statement, skip, limit)))
+        return list(result.all())
+
+    @trace
+    @timed
+    @retry_on_deadlock()
     async def update_async(
         self, client_id: int, client_data: ClientUpdate
     ) -> Optional[Client]:
@@ -193,9 +385,10 @@ class ClientRepository:
         await self.db.refresh(client)
         return client
 
-    def update(
-        self, client_id: int, client_data: ClientUpdate
-    ) -> Optional[Client]:
+    @trace
+    @timed
+    @retry_on_deadlock()
+    def update(self, client_id: int, client_data: ClientUpdate) -> Optional[Client]:
         """
         Update client record synchronously.
 
@@ -218,6 +411,9 @@ class ClientRepository:
         self.db.refresh(client)
         return client
 
+    @trace
+    @timed
+    @retry_on_deadlock()
     async def delete_async(self, client_id: int) -> bool:
         """
         Delete client record asynchronously.
@@ -237,6 +433,9 @@ class ClientRepository:
         await self.db.commit()
         return True
 
+    @trace
+    @timed
+    @retry_on_deadlock()
     def delete(self, client_id: int) -> bool:
         """
         Delete client record synchronously.
@@ -255,6 +454,8 @@ class ClientRepository:
         self.db.commit()
         return True
 
+    @trace
+    @timed
     async def count_async(self) -> int:
         """
         Count total number of clients asynchronously.
@@ -262,9 +463,13 @@ class ClientRepository:
         Returns:
             Total count of clients
         """
-        result = await self.db.execute(select(Client))
-        return len(result.scalars().all())
+        result = await self.db.execute(
+            _bounded(select(func.count()).select_from(Client))
+        )
+        return result.scalar_one()
 
+    @trace
+    @timed
     def count(self) -> int:
         """
         Count total number of clients synchronously.
@@ -272,6 +477,5 @@ class ClientRepository:
         Returns:
             Total count of clients
         """
-        result = self.db.execute(select(func.count()).select_from(Client))
+        result = self.db.execute(_bounded(select(func.count()).select_from(Client)))
         return result.scalar()
-
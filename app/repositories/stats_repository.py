@@ -0,0 +1,317 @@
+"""
+Submission statistics repository.
+
+This module maintains the ``client_daily_stats`` rollup incrementally
+from a high-water mark on client ids, and answers dashboard queries
+from it instead of scanning the client table.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, cast
+
+from sqlalchemy import Date, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.metrics import observe_duration, repository_call_duration_seconds
+from app.core.retry import retry_on_deadlock
+from app.core.tracing import traced
+from app.models.client import Client
+from app.models.stats import ClientDailyStats, RollupWatermark
+
+timed = observe_duration(repository_call_duration_seconds)
+trace = traced("repository")
+
+ROLLUP_NAME = "client_daily_stats"
+
+# Dimensions submissions can be grouped by
+GROUP_BY_FIELDS = ("day", "product_type", "company")
+
+
+class RollupConflict(Exception):
+    """Another run advanced the watermark first; this batch was rolled back."""
+
+
+def _upsert_counts(session: Session, counts: List[Dict[str, Any]]) -> None:
+    """
+    Add submission counts to the rollup, creating missing rows.
+
+    Args:
+        session: Synchronous session inside the rollup transaction
+        counts: Rows with ``day``, ``product_type``, ``company`` and
+            ``submissions`` to add
+    """
+    table = ClientDailyStats.__table__
+    if session.get_bind().dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        mysql_statement = mysql_insert(table).values(counts)
+        session.execute(
+            mysql_statement.on_duplicate_key_update(
+                submissions=table.c.submissions + mysql_statement.inserted.submissions
+            )
+        )
+        return
+
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    sqlite_statement = sqlite_insert(table).values(counts)
+    session.execute(
+        sqlite_statement.on_conflict_do_update(
+            index_elements=[table.c.day, table.c.product_type, table.c.company],
+            set_={
+                "submissions": table.c.submissions
+                + sqlite_statement.excluded.submissions
+            },
+        )
+    )
+
+
+def ensure_watermark(session: Session, name: str) -> int:
+    """
+    Read a watermark, creating it at 0 if it does not exist yet.
+
+    The row is created with an insert that ignores duplicates, so
+    concurrent first runs do not fail on the primary key.
+
+    Args:
+        session: Synchronous session
+        name: Watermark name
+
+    Returns:
+        Current ``last_id`` of the watermark
+    """
+    statement = select(RollupWatermark.last_id).where(RollupWatermark.name == name)
+    last_id = session.scalar(statement)
+    if last_id is not None:
+        return last_id
+
+    table = RollupWatermark.__table__
+    if session.get_bind().dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+        session.execute(mysql_insert(table).values(name=name).prefix_with("IGNORE"))
+    else:
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        session.execute(sqlite_insert(table).values(name=name).on_conflict_do_nothing())
+    return session.execute(statement).scalar_one()
+
+
+def _roll_up_batch(session: Session, batch_size: int, settle_seconds: float) -> int:
+    """
+    Count the next batch of clients past the watermark, in one transaction.
+
+    Clients younger than ``settle_seconds`` are left for a later run: ids
+    are assigned at insert but rows commit in any order, so a young id
+    above the watermark may still have uncommitted neighbours below it.
+
+    Args:
+        session: Synchronous session
+        batch_size: Most clients counted
+        settle_seconds: Minimum client age, by the database clock
+
+    Returns:
+        Number of clients counted
+
+    Raises:
+        RollupConflict: If another run moved the watermark meanwhile
+    """
+    last_id = ensure_watermark(session, ROLLUP_NAME)
+    now = session.execute(select(func.now())).scalar_one()
+    cutoff = now - timedelta(seconds=settle_seconds)
+    batch = (
+        select(Client.id)
+        .where(Client.id > last_id, Client.created_at <= cutoff)
+        .order_by(Client.id)
+        .limit(batch_size)
+        .subquery()
+    )
+    upper = session.scalar(select(func.max(batch.c.id)))
+    if upper is None:
+        session.rollback()
+        return 0
+
+    day = func.date(Client.created_at, type_=Date)
+    product_type = func.coalesce(Client.product_type, "")
+    company = func.coalesce(Client.company, "")
+    groups = session.execute(
+        select(day, product_type, company, func.count())
+        .where(Client.id > last_id, Client.id <= upper)
+        .group_by(day, product_type, company)
+    ).all()
+    _upsert_counts(
+        session,
+        [
+            {"day": d, "product_type": p, "company": c, "submissions": n}
+            for d, p, c, n in groups
+        ],
+    )
+
+    # Compare-and-set, so two concurrent runs never count a batch twice
+    moved = session.execute(
+        update(RollupWatermark)
+        .where(RollupWatermark.name == ROLLUP_NAME)
+        .where(RollupWatermark.last_id == last_id)
+        .values(last_id=upper)
+    )
+    if moved.rowcount != 1:
+        session.rollback()
+        raise RollupConflict(f"Watermark moved past {last_id}")
+    session.commit()
+    return sum(n for _, _, _, n in groups)
+
+
+def _catch_up(
+    session: Session,
+    batch_size: int,
+    settle_seconds: float,
+    max_batches: Optional[int],
+) -> int:
+    """Roll up batches until caught up or ``max_batches`` were counted."""
+    counted = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        rows = _roll_up_batch(session, batch_size, settle_seconds)
+        counted += rows
+        batches += 1
+        if rows < batch_size:
+            break
+    return counted
+
+
+def _submissions_query(start: date, end: date, group_by: Sequence[str]) -> Any:
+    """Build the grouped query over the rollup."""
+    columns = [getattr(ClientDailyStats, name) for name in group_by]
+    return (
+        select(*columns, func.sum(ClientDailyStats.submissions))
+        .where(ClientDailyStats.day >= start, ClientDailyStats.day <= end)
+        .group_by(*columns)
+        .order_by(*columns)
+    )
+
+
+def _as_dicts(rows: Sequence[Any], group_by: Sequence[str]) -> List[Dict[str, Any]]:
+    """Name the columns of each result row; "" becomes None again."""
+    results = []
+    for row in rows:
+        result: Dict[str, Any] = {
+            name: (value if value != "" else None) for name, value in zip(group_by, row)
+        }
+        result["submissions"] = int(row[-1])
+        results.append(result)
+    return results
+
+
+class StatsRepository:
+    """
+    Repository for the submission statistics rollup.
+
+    The rollup is advanced in batches ordered by client id. Each batch
+    adds its counts and moves the watermark in one transaction, so the
+    rollup is exact however often it runs or is interrupted. Deleting or
+    editing clients later does not change counts already rolled up.
+    """
+
+    def __init__(self, db: Session | AsyncSession):
+        """
+        Initialize repository with database session.
+
+        Args:
+            db: SQLAlchemy session (sync or async)
+        """
+        self.db = db
+
+    @trace
+    @timed
+    @retry_on_deadlock()
+    async def catch_up_async(
+        self,
+        batch_size: int = 5000,
+        settle_seconds: float = 5.0,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        Roll up clients created since the last run asynchronously.
+
+        Args:
+            batch_size: Clients counted per transaction
+            settle_seconds: Minimum client age before it is counted
+            max_batches: Stop after this many batches, None to catch up
+
+        Returns:
+            Number of clients counted
+
+        Raises:
+            RollupConflict: If a concurrent run moved the watermark
+        """
+        session = cast(AsyncSession, self.db)
+        return await session.run_sync(
+            _catch_up, batch_size, settle_seconds, max_batches
+        )
+
+    @trace
+    @timed
+    @retry_on_deadlock()
+    def catch_up(
+        self,
+        batch_size: int = 5000,
+        settle_seconds: float = 5.0,
+        max_batches: Optional[int] = None,
+    ) -> int:
+        """
+        Roll up clients created since the last run synchronously.
+
+        Args:
+            batch_size: Clients counted per transaction
+            settle_seconds: Minimum client age before it is counted
+            max_batches: Stop after this many batches, None to catch up
+
+        Returns:
+            Number of clients counted
+
+        Raises:
+            RollupConflict: If a concurrent run moved the watermark
+        """
+        session = cast(Session, self.db)
+        return _catch_up(session, batch_size, settle_seconds, max_batches)
+
+    @trace
+    @timed
+    async def submissions_async(
+        self, start: date, end: date, group_by: Sequence[str] = ("day",)
+    ) -> List[Dict[str, Any]]:
+        """
+        Count submissions in a date range asynchronously.
+
+        Args:
+            start: First day, inclusive
+            end: Last day, inclusive
+            group_by: Fields from ``GROUP_BY_FIELDS`` to group by
+
+        Returns:
+            One dict per group with the group fields and ``submissions``
+        """
+        session = cast(AsyncSession, self.db)
+        result = await session.execute(_submissions_query(start, end, group_by))
+        return _as_dicts(result.all(), group_by)
+
+    @trace
+    @timed
+    def submissions(
+        self, start: date, end: date, group_by: Sequence[str] = ("day",)
+    ) -> List[Dict[str, Any]]:
+        """
+        Count submissions in a date range synchronously.
+
+        Args:
+            start: First day, inclusive
+            end: Last day, inclusive
+            group_by: Fields from ``GROUP_BY_FIELDS`` to group by
+
+        Returns:
+            One dict per group with the group fields and ``submissions``
+        """
+        session = cast(Session, self.db)
+        result = session.execute(_submissions_query(start, end, group_by))
+        return _as_dicts(result.all(), group_by)
@@ -7,17 +7,25 @@ and serialization.
 
 from app.schemas.client import (
     ClientCreate,
+    ClientPage,
     ClientResponse,
+    ClientResponseList,
     ClientUpdate,
     ContactForm,
     ContactResponse,
+    ContactSubmissionData,
 )
+from app.schemas.stats import SubmissionCount, SubmissionStats
 
 __all__ = [
     "ContactForm",
     "ContactResponse",
+    "ContactSubmissionData",
     "ClientCreate",
+    "ClientPage",
     "ClientResponse",
+    "ClientResponseList",
     "ClientUpdate",
+    "SubmissionCount",
+    "SubmissionStats",
 ]
-
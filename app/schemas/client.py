@@ -6,9 +6,19 @@ responses, and client data validation.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+
+from app.core.config import settings
+from app.schemas.validators import CachedEmailStr, check_phone, to_e164
 
 
 class ContactForm(BaseModel):
@@ -18,6 +28,8 @@ class ContactForm(BaseModel):
     This schema validates incoming contact form submissions from the landing page.
     """
 
+    _phone_e164: Optional[str] = PrivateAttr(default=None)
+
     full_name: str = Field(
         ...,
         description="Full name of the contact person",
@@ -25,7 +37,7 @@ class ContactForm(BaseModel):
         max_length=100,
         examples=["Juan Pérez"],
     )
-    email: EmailStr = Field(
+    email: CachedEmailStr = Field(
         ..., description="Email address", examples=["juan.perez@example.com"]
     )
     phone: str = Field(
@@ -48,10 +60,10 @@ class ContactForm(BaseModel):
         examples=["Textiles"],
     )
     quantity: Optional[str] = Field(
-        None, 
-        description="Quantity requested (can be a number or descriptive text)", 
+        None,
+        description="Quantity requested (can be a number or descriptive text)",
         max_length=100,
-        examples=["100", "More than 10,000 units", "To be confirmed"]
+        examples=["100", "More than 10,000 units", "To be confirmed"],
     )
     message: str = Field(
         ...,
@@ -76,11 +88,23 @@ class ContactForm(BaseModel):
         Raises:
             ValueError: If phone format is invalid
         """
-        # Remove common separators for validation
-        cleaned = v.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-        if not any(char.isdigit() for char in cleaned):
-            raise ValueError("Phone number must contain digits")
-        return v
+        return check_phone(v)
+
+    @model_validator(mode="after")
+    def derive_phone_e164(self) -> "ContactForm":
+        """
+        Store the E.164 form of the phone number next to the raw value.
+
+        Returns:
+            The validated form
+        """
+        self._phone_e164 = to_e164(self.phone, settings.phone_default_country_code)
+        return self
+
+    @property
+    def phone_e164(self) -> Optional[str]:
+        """Phone number in E.164 form, or None if it cannot be derived."""
+        return self._phone_e164
 
     class Config:
         """Pydantic configuration."""
@@ -98,6 +122,53 @@ class ContactForm(BaseModel):
         }
 
 
+class ContactSubmissionData(BaseModel):
+    """
+    Contact submission echoed back in the contact form response.
+
+    Built from an already validated ``ContactForm``; the fields are plain
+    strings, so the email is not parsed and checked a second time.
+    """
+
+    full_name: str = Field(..., description="Full name of the contact person")
+    email: str = Field(..., description="Email address")
+    phone: str = Field(..., description="Phone number")
+    phone_e164: Optional[str] = Field(None, description="Phone number in E.164 form")
+    company: Optional[str] = Field(None, description="Company name")
+    product_type: Optional[str] = Field(
+        None, description="Type of product interested in"
+    )
+    quantity: Optional[str] = Field(None, description="Quantity requested")
+    message: str = Field(..., description="Message content")
+    timestamp: datetime = Field(..., description="Time the submission was received")
+
+    @classmethod
+    def from_form(
+        cls, form: ContactForm, timestamp: datetime
+    ) -> "ContactSubmissionData":
+        """
+        Build the response data from a validated contact form.
+
+        Args:
+            form: Validated contact form
+            timestamp: Time the submission was received
+
+        Returns:
+            Submission data
+        """
+        return cls(
+            full_name=form.full_name,
+            email=form.email,
+            phone=form.phone,
+            phone_e164=form.phone_e164,
+            company=form.company,
+            product_type=form.product_type,
+            quantity=form.quantity,
+            message=form.message,
+            timestamp=timestamp,
+        )
+
+
 class ContactResponse(BaseModel):
     """
     Contact form response schema.
@@ -107,7 +178,9 @@ class ContactResponse(BaseModel):
 
     success: bool = Field(..., description="Operation success status")
     message: str = Field(..., description="Response message")
-    data: dict = Field(default_factory=dict, description="Response data")
+    data: Optional[ContactSubmissionData] = Field(
+        None, description="Submitted contact data"
+    )
 
     class Config:
         """Pydantic configuration."""
@@ -117,8 +190,14 @@ class ContactResponse(BaseModel):
                 "success": True,
                 "message": "Mensaje enviado exitosamente. Te responderemos pronto.",
                 "data": {
-                    "name": "Juan Pérez",
+                    "full_name": "Juan Pérez",
                     "email": "juan.perez@example.com",
+                    "phone": "+52 123 456 7890",
+                    "phone_e164": "+521234567890",
+                    "company": "Empresa S.A.",
+                    "product_type": "Textiles",
+                    "quantity": "Más de 10,000 unidades",
+                    "message": "Me gustaría obtener más información.",
                     "timestamp": "2024-01-15T10:30:00",
                 },
             }
@@ -133,7 +212,7 @@ class ClientCreate(BaseModel):
     """
 
     full_name: str
-    email: EmailStr
+    email: CachedEmailStr
     phone: str
     company: Optional[str] = None
     product_type: Optional[str] = None
@@ -149,7 +228,7 @@ class ClientUpdate(BaseModel):
     """
 
     full_name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[CachedEmailStr] = None
     phone: Optional[str] = None
     company: Optional[str] = None
     product_type: Optional[str] = None
@@ -194,3 +273,22 @@ class ClientResponse(BaseModel):
             }
         }
 
+
+class ClientPage(BaseModel):
+    """
+    Schema for a page of client records.
+
+    Items only hold the requested fields, plus ``id``.
+    """
+
+    items: List[Dict[str, Any]]
+    total: int
+    skip: int
+    limit: int
+
+
+# Reusable validators for collections; building a TypeAdapter compiles a
+# validator, so they are created once here rather than per call
+ClientResponseList: TypeAdapter[List[ClientResponse]] = TypeAdapter(
+    List[ClientResponse]
+)
@@ -0,0 +1,38 @@
+"""
+Submission statistics schemas.
+
+This module contains the response models of the submission statistics
+endpoint.
+"""
+
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SubmissionCount(BaseModel):
+    """
+    Number of submissions in one group.
+
+    Only the fields the query was grouped by are set.
+    """
+
+    day: Optional[date] = None
+    product_type: Optional[str] = None
+    company: Optional[str] = None
+    submissions: int
+
+
+class SubmissionStats(BaseModel):
+    """Schema for submission counts over a date range."""
+
+    start: date = Field(alias="from")
+    end: date = Field(alias="to")
+    group_by: List[str]
+    results: List[SubmissionCount]
+
+    class Config:
+        """Pydantic configuration."""
+
+        populate_by_name = True
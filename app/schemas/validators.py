@@ -0,0 +1,101 @@
+"""
+Reusable field validators.
+
+This module holds the validation fast paths shared by the schemas: phone
+checks and E.164 normalization with precompiled patterns, and an email
+type that remembers recently validated addresses.
+"""
+
+import re
+from functools import lru_cache
+from typing import Annotated, Optional
+
+from pydantic import AfterValidator, WithJsonSchema
+from pydantic.networks import validate_email
+
+from app.core.config import settings
+
+_DIGIT = re.compile(r"\d")
+_NON_DIGITS = re.compile(r"\D+")
+
+# E.164 numbers hold at most 15 digits; shorter than 8 cannot be a
+# country code plus a subscriber number
+E164_MIN_DIGITS = 8
+E164_MAX_DIGITS = 15
+
+
+def check_phone(value: str) -> str:
+    """
+    Check that a phone number contains digits.
+
+    Args:
+        value: Phone number as entered
+
+    Returns:
+        The phone number, unchanged
+
+    Raises:
+        ValueError: If the phone number has no digits
+    """
+    if _DIGIT.search(value) is None:
+        raise ValueError("Phone number must contain digits")
+    return value
+
+
+def to_e164(value: str, default_country_code: Optional[str] = None) -> Optional[str]:
+    """
+    Derive the E.164 form of a phone number.
+
+    Separators are dropped. A leading ``+`` or ``00`` marks an
+    international number; other numbers get ``default_country_code``.
+
+    Args:
+        value: Phone number as entered
+        default_country_code: Calling code for numbers without one
+
+    Returns:
+        Number as ``+`` and digits, or None if it cannot be derived
+
+    Example:
+        >>> to_e164("(123) 456-7890", "52")
+        '+521234567890'
+    """
+    digits = _NON_DIGITS.sub("", value)
+    if value.lstrip().startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif default_country_code:
+        digits = default_country_code + digits
+    else:
+        return None
+    if not E164_MIN_DIGITS <= len(digits) <= E164_MAX_DIGITS or digits[0] == "0":
+        return None
+    return "+" + digits
+
+
+@lru_cache(maxsize=settings.email_validation_cache_size)
+def validate_email_cached(value: str) -> str:
+    """
+    Validate and normalize an email address, remembering valid ones.
+
+    Invalid addresses raise and are not cached.
+
+    Args:
+        value: Email address
+
+    Returns:
+        Normalized email address, as ``EmailStr`` returns it
+
+    Raises:
+        PydanticCustomError: If the address is invalid
+    """
+    return validate_email(value)[1]
+
+
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(validate_email_cached),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+"""Drop-in ``EmailStr`` that skips re-parsing recently seen addresses."""
@@ -0,0 +1,176 @@
+"""
+Production server launcher.
+
+Runs the API under a Gunicorn master with Uvicorn workers. The master
+handles signals, restarts crashed workers and recycles workers after a
+number of requests, while each worker serves the ASGI app on uvloop with
+the httptools parser when they are installed. Worker count follows the
+CPUs actually available to the container, including cgroup quotas.
+
+Usage:
+    python -m app.server
+"""
+
+import math
+import os
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from gunicorn.app.base import BaseApplication  # type: ignore[import-untyped]
+from uvicorn.workers import UvicornWorker
+
+from app.core.config import settings
+
+CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+CGROUP_V1_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+CGROUP_V1_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+
+
+def _has_module(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    return find_spec(name) is not None
+
+
+def cgroup_cpu_limit(
+    cpu_max: Path = CGROUP_V2_CPU_MAX,
+    quota_file: Path = CGROUP_V1_QUOTA,
+    period_file: Path = CGROUP_V1_PERIOD,
+) -> Optional[float]:
+    """
+    Read the CPU quota of the current cgroup.
+
+    Args:
+        cpu_max: cgroup v2 ``cpu.max`` file
+        quota_file: cgroup v1 CFS quota file
+        period_file: cgroup v1 CFS period file
+
+    Returns:
+        Number of CPUs the quota allows, or None if unlimited or unknown
+    """
+    try:
+        quota, period = cpu_max.read_text().split()[:2]
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota_us = int(quota_file.read_text())
+        period_us = int(period_file.read_text())
+    except (OSError, ValueError):
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return quota_us / period_us
+
+
+def available_cpus() -> float:
+    """
+    Count the CPUs this process may actually use.
+
+    Returns:
+        The smaller of the CPU affinity set and the cgroup quota
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus: float = len(os.sched_getaffinity(0))
+    else:  # pragma: no cover - macOS and Windows
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, limit)
+    return cpus
+
+
+def default_workers(cpus: Optional[float] = None) -> int:
+    """
+    Pick the number of workers.
+
+    Async workers are CPU bound once I/O overlaps, so one worker per
+    available CPU is used. Fractional quotas round down so the container
+    is not throttled.
+
+    Args:
+        cpus: Available CPUs (detected when omitted)
+
+    Returns:
+        Configured ``server_workers`` or one worker per CPU, at least one
+    """
+    if settings.server_workers:
+        return settings.server_workers
+    return max(1, math.floor(available_cpus() if cpus is None else cpus))
+
+
+class TunedUvicornWorker(UvicornWorker):
+    """Uvicorn worker that insists on uvloop and httptools when installed."""
+
+    CONFIG_KWARGS: Dict[str, Any] = {
+        "loop": "uvloop" if _has_module("uvloop") else "asyncio",
+        "http": "httptools" if _has_module("httptools") else "h11",
+        "lifespan": "on",
+        "server_header": False,
+    }
+
+
+def build_options(workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Build the Gunicorn configuration from settings.
+
+    Args:
+        workers: Worker count override
+
+    Returns:
+        Gunicorn settings
+    """
+    return {
+        "bind": f"{settings.host}:{settings.port}",
+        "workers": workers or default_workers(),
+        "worker_class": f"{__name__}.TunedUvicornWorker",
+        "backlog": settings.server_backlog,
+        "keepalive": settings.server_keepalive,
+        "max_requests": settings.server_max_requests,
+        "max_requests_jitter": settings.server_max_requests_jitter,
+        "graceful_timeout": settings.server_graceful_timeout,
+        "timeout": settings.server_worker_timeout,
+        "proc_name": "zititex-api",
+    }
+
+
+class ServerApplication(BaseApplication):
+    """Gunicorn application serving ``app.main:app``."""
+
+    def __init__(self, options: Dict[str, Any]) -> None:
+        """
+        Initialize the application.
+
+        Args:
+            options: Gunicorn settings, see ``build_options``
+        """
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        """Apply the options to the Gunicorn config."""
+        assert self.cfg is not None
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Callable[..., Any]:
+        """Import the ASGI app inside the worker."""
+        from app.main import app
+
+        return app
+
+
+def main() -> None:
+    """Start the server."""
+    options = build_options()
+    # Workers are separate processes, so metrics need a shared directory
+    if options["workers"] > 1 and not settings.metrics_multiprocess_dir:
+        settings.metrics_multiprocess_dir = tempfile.mkdtemp(prefix="zititex-metrics-")
+    ServerApplication(options).run()
+
+
+if __name__ == "__main__":
+    main()
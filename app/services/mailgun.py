@@ -5,12 +5,19 @@ This module provides email functionality using Mailgun API
 for sending transactional emails.
 """
 
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import requests
 
 from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, bounded_timeout
+from app.core.logger import get_logger
+from app.core.metrics import mailgun_request_duration_seconds, mailgun_requests_total
+from app.core.tracing import tracer
+
+logger = get_logger(__name__)
 
 
 class MailgunService:
@@ -22,6 +29,77 @@ class MailgunService:
         self.domain = settings.mailgun_domain
         self.base_url = settings.mailgun_base_url
         self.auth = ("api", self.api_key) if self.api_key else None
+        # Shared session keeps the TLS connection to Mailgun alive between sends
+        self.session = requests.Session()
+
+    def warm_up(self, timeout: float = 5.0) -> bool:
+        """
+        Pre-establish the keep-alive connection to the Mailgun API.
+
+        Performs a lightweight request against the base URL so the TCP and
+        TLS handshakes are paid before the first email is sent.
+
+        Args:
+            timeout: Connection and read timeout in seconds
+
+        Returns:
+            True if a connection was established, False otherwise
+        """
+        if not self.api_key or not self.domain:
+            return False
+
+        try:
+            self.session.head(self.base_url, auth=self.auth, timeout=timeout)
+            return True
+        except requests.RequestException as e:
+            logger.warning("Mailgun warm-up error", extra={"error": str(e)})
+            return False
+
+    def close(self) -> None:
+        """Close the pooled connections of the shared HTTP session."""
+        self.session.close()
+
+    def _post_message(
+        self, url: str, data: Dict[str, Any], operation: str
+    ) -> Dict[str, Any]:
+        """
+        Post a message to the Mailgun API and record call metrics.
+
+        The HTTP timeout is capped by the time left in the current request,
+        and the call runs in a ``mailgun.post`` span whose ``traceparent``
+        is sent along.
+
+        Args:
+            url: Mailgun messages endpoint
+            data: Form data for the message
+            operation: Metric label for the calling operation
+
+        Returns:
+            Decoded API response
+
+        Raises:
+            requests.RequestException: If the request fails
+            DeadlineExceeded: If too little time is left to send it
+        """
+        timeout = bounded_timeout(settings.mailgun_timeout)
+        outcome = "error"
+        started = time.perf_counter()
+        with tracer.span("mailgun.post", {"operation": operation}) as span:
+            headers = {"traceparent": span.traceparent} if span.traceparent else None
+            try:
+                response = self.session.post(
+                    url, auth=self.auth, data=data, headers=headers, timeout=timeout
+                )
+                span.set_attribute("http.status_code", response.status_code)
+                response.raise_for_status()
+                outcome = "success"
+                return response.json()
+            finally:
+                labels = (operation, outcome)
+                mailgun_request_duration_seconds.observe(
+                    time.perf_counter() - started, labels
+                )
+                mailgun_requests_total.inc(labels)
 
     def send_email(
         self,
@@ -53,7 +131,7 @@ class MailgunService:
             API response or None if failed
         """
         if not self.api_key or not self.domain:
-            print("Mailgun API key or domain not configured")
+            logger.warning("Mailgun API key or domain not configured")
             return None
 
         try:
@@ -78,12 +156,9 @@ class MailgunService:
                     data[f"v:{key}"] = str(value)
 
             url = f"{self.base_url}/{self.domain}/messages"
-            response = requests.post(url, auth=self.auth, data=data)
-            response.raise_for_status()
-
-            return response.json()
+            return self._post_message(url, data, operation="send_email")
         except requests.RequestException as e:
-            print(f"Email sending error: {e}")
+            logger.error("Email sending error", extra={"error": str(e)})
             return None
 
     def send_template_email(
@@ -108,7 +183,7 @@ class MailgunService:
             API response or None if failed
         """
         if not self.api_key or not self.domain:
-            print("Mailgun API key or domain not configured")
+            logger.warning("Mailgun API key or domain not configured")
             return None
 
         try:
@@ -125,12 +200,9 @@ class MailgunService:
                     data[f"v:{key}"] = str(value)
 
             url = f"{self.base_url}/{self.domain}/messages"
-            response = requests.post(url, auth=self.auth, data=data)
-            response.raise_for_status()
-
-            return response.json()
+            return self._post_message(url, data, operation="send_template_email")
         except requests.RequestException as e:
-            print(f"Template email sending error: {e}")
+            logger.error("Template email sending error", extra={"error": str(e)})
             return None
 
     def send_welcome_email(self, email: str, username: str) -> bool:
@@ -189,7 +261,12 @@ class MailgunService:
 
         Returns:
             True if successful, False otherwise
+
+        Raises:
+            DeadlineExceeded: If the request deadline leaves no time to
+                notify the admin
         """
+        admin_sent = False
         try:
             subject = f"Nuevo mensaje de contacto de {full_name}"
 
@@ -230,8 +307,12 @@ class MailgunService:
             )
 
             if not admin_result:
-                print(f"Failed to send admin notification to {admin_email}")
+                logger.error(
+                    "Failed to send admin notification",
+                    extra={"admin_email": admin_email},
+                )
                 return False
+            admin_sent = True
 
             # Enviar confirmación al usuario
             user_subject = "Gracias por contactarnos - Zititex"
@@ -268,14 +349,24 @@ class MailgunService:
             )
 
             if not user_result:
-                print(f"Failed to send confirmation email to {email}")
+                logger.warning(
+                    "Failed to send confirmation email", extra={"email": email}
+                )
                 # No fallamos completamente si solo falla la confirmación
                 return True
 
             return True
 
+        except DeadlineExceeded:
+            if not admin_sent:
+                raise
+            # The admin has the message; a retry would notify them twice
+            logger.warning(
+                "No time left to send confirmation email", extra={"email": email}
+            )
+            return True
         except Exception as e:
-            print(f"Error in send_contact_form_email: {str(e)}")
+            logger.error("Error in send_contact_form_email", exc_info=e)
             return False
 
 
@@ -0,0 +1,7 @@
+"""
+Performance benchmarks.
+
+This package contains offline micro and endpoint benchmarks. Each
+``bench_*`` module can be run on its own with ``python -m`` and prints
+its results as JSON.
+"""
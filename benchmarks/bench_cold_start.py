@@ -0,0 +1,191 @@
+"""
+Lambda cold start benchmark.
+
+Starts a fresh interpreter per sample, imports ``app.main`` and sends a
+synthetic API Gateway event through the Mangum ``handler``. Import time,
+time to the first response and their total are reported, and the run
+fails when the median total exceeds the budget.
+
+Usage:
+    python -m benchmarks.bench_cold_start --iterations 10 --budget-ms 1500
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import emit, make_parser, summarize
+
+# Modules that must stay out of the import graph until they are used
+DEFERRED_MODULES = (
+    "mangum",
+    "pymysql",
+    "aiomysql",
+    "boto3",
+    "botocore",
+    "jose",
+    "passlib",
+    "alembic",
+)
+
+
+class LambdaContext:
+    """Minimal stand-in for the Lambda context object."""
+
+    function_name = "zititex-api-bench"
+    invoked_function_arn = (
+        "arn:aws:lambda:us-east-2:123456789012:function:zititex-api-bench"
+    )
+    memory_limit_in_mb = 512
+    aws_request_id = "00000000-0000-0000-0000-000000000000"
+
+    def get_remaining_time_in_millis(self) -> int:
+        """Report a fixed remaining time."""
+        return 30_000
+
+
+def api_gateway_event(
+    path: str = "/health",
+    method: str = "GET",
+    body: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build an API Gateway REST (v1) proxy event.
+
+    Args:
+        path: Request path
+        method: HTTP method
+        body: Request body
+        headers: Request headers
+
+    Returns:
+        Event dictionary as delivered to the Lambda handler
+    """
+    headers = {
+        "host": "api.zititex.test",
+        "accept": "application/json",
+        **(headers or {}),
+    }
+    return {
+        "resource": path,
+        "path": path,
+        "httpMethod": method,
+        "headers": headers,
+        "multiValueHeaders": {key: [value] for key, value in headers.items()},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "pathParameters": None,
+        "stageVariables": None,
+        "requestContext": {
+            "resourcePath": path,
+            "httpMethod": method,
+            "path": f"/prod{path}",
+            "stage": "prod",
+            "requestId": "bench-request",
+            "identity": {"sourceIp": "127.0.0.1"},
+        },
+        "body": body,
+        "isBase64Encoded": False,
+    }
+
+
+def measure_once() -> Dict[str, Any]:
+    """
+    Measure one cold start in the current, freshly started interpreter.
+
+    Returns:
+        Import and first response durations, status and the deferred
+        modules that ``app.main`` imported anyway
+    """
+    started = time.perf_counter()
+    from app.main import handler
+
+    imported = time.perf_counter()
+    loaded = sorted(name for name in DEFERRED_MODULES if name in sys.modules)
+    response = handler(api_gateway_event(), LambdaContext())
+    responded = time.perf_counter()
+    return {
+        "import_s": imported - started,
+        "first_response_s": responded - imported,
+        "status": response["statusCode"],
+        "loaded": loaded,
+    }
+
+
+def run(iterations: int) -> List[Dict[str, Any]]:
+    """Measure cold starts in fresh subprocesses."""
+    samples = []
+    for _ in range(iterations):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_cold_start", "--child"],
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "LOG_LEVEL": "WARNING"},
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    loaded = sorted({name for sample in samples for name in sample["loaded"]})
+    statuses = sorted({sample["status"] for sample in samples})
+    results = []
+    for phase in ("import", "first_response", "total"):
+        if phase == "total":
+            latencies = [s["import_s"] + s["first_response_s"] for s in samples]
+        else:
+            latencies = [s[f"{phase}_s"] for s in samples]
+        results.append(
+            summarize(
+                f"cold_start[{phase}]",
+                latencies,
+                sum(latencies),
+                statuses=statuses,
+                deferred_modules_loaded=loaded,
+            )
+        )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark, print JSON results and enforce the budget."""
+    parser = make_parser(__doc__, iterations=10)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=1500.0,
+        help="Maximum median import-to-first-response time",
+    )
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.stdout.write(json.dumps(measure_once()) + "\n")
+        return
+
+    results = run(args.iterations)
+    emit("cold_start", results, args.output)
+
+    total = results[-1]
+    failures = []
+    if total["p50_us"] / 1000 > args.budget_ms:
+        failures.append(
+            f"median cold start {total['p50_us'] / 1000:.1f}ms exceeds "
+            f"budget {args.budget_ms:.1f}ms"
+        )
+    if total["deferred_modules_loaded"]:
+        failures.append(
+            f"deferred modules imported: {', '.join(total['deferred_modules_loaded'])}"
+        )
+    if total["statuses"] != [200]:
+        failures.append(f"unexpected status codes: {total['statuses']}")
+    if failures:
+        sys.stderr.write("\n".join(failures) + "\n")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Response compression benchmark.
+
+Measures the CPU cost of each gzip level and brotli quality against the
+bytes saved on client-list JSON payloads of several sizes, to pick the
+defaults of ``CompressionMiddleware``.
+
+Usage:
+    python -m benchmarks.bench_compression --iterations 50
+"""
+
+import json
+import random
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.common import bench, emit, parse_args
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+PRODUCT_TYPES = ("Textiles", "Hilos", "Telas técnicas", "Confección", None)
+QUANTITIES = ("Menos de 1,000 unidades", "1,000 - 10,000", "Más de 10,000 unidades")
+
+
+def make_client_rows(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generate client rows shaped like ``ClientResponse``.
+
+    Args:
+        count: Number of rows
+        seed: Random seed, so every run compresses the same bytes
+
+    Returns:
+        List of client dictionaries
+    """
+    rng = random.Random(seed)
+    created = datetime(2024, 1, 1)
+    rows = []
+    for i in range(count):
+        created += timedelta(minutes=rng.randint(1, 600))
+        rows.append(
+            {
+                "id": i + 1,
+                "full_name": f"Cliente {rng.randint(1000, 99999)} Pérez",
+                "email": f"cliente{i}@empresa{rng.randint(1, 500)}.com",
+                "phone": f"+52 {rng.randint(100, 999)} {rng.randint(100, 999)} "
+                f"{rng.randint(1000, 9999)}",
+                "company": f"Empresa {rng.randint(1, 500)} S.A.",
+                "product_type": rng.choice(PRODUCT_TYPES),
+                "quantity": rng.choice(QUANTITIES),
+                "message": "Me gustaría obtener más información sobre sus "
+                f"productos. Referencia {rng.getrandbits(48):012x}.",
+                "created_at": created.isoformat(),
+                "updated_at": created.isoformat(),
+            }
+        )
+    return rows
+
+
+def codecs() -> List[Tuple[str, Callable[[bytes], bytes]]]:
+    """
+    List the encoder settings to compare.
+
+    Returns:
+        Pairs of codec label and compress function
+    """
+    variants: List[Tuple[str, Callable[[bytes], bytes]]] = []
+    for level in (1, 6, 9):
+
+        def gzip_compress(data: bytes, level: int = level) -> bytes:
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            return compressor.compress(data) + compressor.flush()
+
+        variants.append((f"gzip-{level}", gzip_compress))
+    if brotli is not None:
+        for quality in (1, 4, 11):
+
+            def brotli_compress(data: bytes, quality: int = quality) -> bytes:
+                return brotli.compress(data, quality=quality)
+
+            variants.append((f"br-{quality}", brotli_compress))
+    return variants
+
+
+def run(iterations: int) -> List[Dict[str, Any]]:
+    """Compress every payload size with every codec."""
+    results = []
+    for rows in (100, 1_000, 10_000):
+        payload = json.dumps(make_client_rows(rows)).encode()
+        for label, compress in codecs():
+            compressed = len(compress(payload))
+            result = bench(
+                f"compress[{label}, rows={rows}]",
+                lambda: compress(payload),
+                iterations=max(1, iterations * 100 // rows),
+                warmup=1,
+                original_bytes=len(payload),
+                compressed_bytes=compressed,
+                bytes_saved=len(payload) - compressed,
+                ratio=round(len(payload) / compressed, 2),
+            )
+            result["us_per_kb_saved"] = round(
+                result["mean_us"] * 1024 / (len(payload) - compressed), 3
+            )
+            results.append(result)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    args = parse_args(__doc__, iterations=50)
+    emit("compression", run(args.iterations), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Endpoint benchmark.
+
+Sends ``POST /api/v1/contact/`` (and ``GET /health`` for reference)
+through the full ASGI app, middleware included, with the database on a
+temporary SQLite file and Mailgun replaced by an offline fake. Reports
+throughput and latency percentiles per concurrency level. Admission
+control is off, so every request does the full work, and any response
+other than 200 fails the run instead of skewing the numbers.
+
+Usage:
+    python -m benchmarks.bench_endpoints --iterations 5000 --mailgun-latency-ms 0
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Sequence
+
+from app.core.config import settings
+from benchmarks.common import (
+    asgi_request,
+    bench_async,
+    emit,
+    make_parser,
+    quiet_logging,
+    use_fake_mailgun,
+)
+
+FORM = {
+    "full_name": "Juan Pérez",
+    "email": "juan.perez@example.com",
+    "phone": "+52 123 456 7890",
+    "company": "Empresa S.A.",
+    "product_type": "Textiles",
+    "quantity": "Más de 10,000 unidades",
+    "message": "Me gustaría obtener más información sobre sus productos.",
+}
+
+
+def use_sqlite(directory: str) -> None:
+    """
+    Point the app's database settings at a SQLite file.
+
+    Must run before the engines are first used, as they are created
+    lazily from the settings.
+
+    Args:
+        directory: Directory to hold the database file
+    """
+    path = os.path.join(directory, "bench.db")
+    settings.database_url = f"sqlite:///{path}"
+    settings.database_async_url = f"sqlite+aiosqlite:///{path}"
+
+
+async def run(
+    iterations: int,
+    concurrency_levels: Sequence[int] = (1, 32),
+    mailgun_latency: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """Drive each endpoint at each concurrency level."""
+    from app.core.database import create_tables
+    from app.main import create_app
+    from app.services.mailgun import mailgun_service
+
+    settings.admin_email = "admin@example.com"
+    settings.mailgun_api_key = "bench-key"
+    settings.mailgun_domain = "mailgun.test"
+    use_fake_mailgun(mailgun_service, mailgun_latency)
+    # Instant 503s from load shedding would inflate throughput and hide
+    # latency; the concurrency levels here are above the default limit
+    settings.admission_enabled = False
+    await create_tables()
+    app = create_app()
+
+    body = json.dumps(FORM).encode()
+    requests: Dict[str, Dict[str, Any]] = {
+        "POST /api/v1/contact/": dict(
+            path="/api/v1/contact/",
+            method="POST",
+            body=body,
+            headers=[
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        ),
+        "GET /health": dict(path="/health"),
+    }
+
+    results = []
+    for name, request in requests.items():
+
+        async def call() -> None:
+            status, _, response = await asgi_request(app, **request)
+            if status != 200:
+                raise RuntimeError(f"{name} answered {status}: {response[:200]!r}")
+
+        await call()
+        for concurrency in concurrency_levels:
+            result = await bench_async(
+                f"endpoint[{name}]",
+                call,
+                iterations=iterations,
+                concurrency=concurrency,
+                mailgun_latency_ms=mailgun_latency * 1000,
+            )
+            results.append(result)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    parser = make_parser(__doc__, iterations=5_000)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 32], help="Concurrent callers"
+    )
+    parser.add_argument(
+        "--mailgun-latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated Mailgun API round trip",
+    )
+    args = parser.parse_args()
+    quiet_logging()
+    with tempfile.TemporaryDirectory() as directory:
+        use_sqlite(directory)
+        results = asyncio.run(
+            run(args.iterations, args.concurrency, args.mailgun_latency_ms / 1000)
+        )
+    emit("endpoints", results, args.output)
+
+
+if __name__ == "__main__":
+    main()
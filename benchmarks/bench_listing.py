@@ -0,0 +1,113 @@
+"""
+Client listing benchmark.
+
+Reads and serializes one page of clients from a seeded SQLite file
+three ways: ORM instances through ``Client.to_dict`` and ``json.dumps``,
+ORM instances validated into ``ClientResponse`` models, and projected
+rows through ``encode_rows``. Fetching and encoding are also timed on
+their own, and the peak memory of each path is reported.
+
+Usage:
+    python -m benchmarks.bench_listing --iterations 20 --page-size 10000
+"""
+
+import json
+import os
+import tempfile
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.responses import encode_rows
+from app.repositories.client_repository import ClientRepository
+from app.schemas.client import ClientResponse, ClientResponseList
+from benchmarks.bench_repository import seed
+from benchmarks.common import bench, emit, make_parser, quiet_logging
+
+PAGE_SIZE = 10_000
+FIELDS = list(ClientResponse.model_fields)
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """
+    Measure the peak memory allocated by one call.
+
+    Args:
+        func: Callable to measure
+
+    Returns:
+        Peak traced allocation in bytes
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(iterations: int, page_size: int = PAGE_SIZE) -> List[Dict[str, Any]]:
+    """Time each listing path on one page of ``page_size`` rows."""
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        seed(url, page_size)
+        engine = create_engine(url)
+        session = Session(engine)
+        repo = ClientRepository(session)
+
+        def orm_page() -> List[Any]:
+            # A fresh identity map, as each request gets its own session
+            session.expunge_all()
+            return repo.get_all(0, page_size, include_message=True)
+
+        def row_page() -> List[Any]:
+            return repo.get_rows(FIELDS, 0, page_size)
+
+        orm = orm_page()
+        rows = row_page()
+        paths: Dict[str, Callable[[], Any]] = {
+            "fetch[orm]": orm_page,
+            "fetch[rows]": row_page,
+            "encode[to_dict]": lambda: json.dumps([c.to_dict() for c in orm]).encode(),
+            "encode[models]": lambda: ClientResponseList.dump_json(
+                [ClientResponse.model_validate(c) for c in orm]
+            ),
+            "encode[encode_rows]": lambda: encode_rows(FIELDS, rows),
+            "page[orm,to_dict]": lambda: json.dumps(
+                [c.to_dict() for c in orm_page()]
+            ).encode(),
+            "page[orm,models]": lambda: ClientResponseList.dump_json(
+                [ClientResponse.model_validate(c) for c in orm_page()]
+            ),
+            "page[rows,encode_rows]": lambda: encode_rows(FIELDS, row_page()),
+        }
+
+        results = []
+        for name, func in paths.items():
+            result = bench(
+                f"listing.{name}[rows={page_size}]",
+                func,
+                iterations=iterations,
+                warmup=2,
+                rows=page_size,
+            )
+            result["peak_memory_bytes"] = peak_memory(func)
+            results.append(result)
+        session.close()
+        engine.dispose()
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    parser = make_parser(__doc__, iterations=20)
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    args = parser.parse_args()
+    quiet_logging()
+    emit("listing", run(args.iterations, args.page_size), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Mailgun payload construction benchmark.
+
+Times every ``MailgunService`` send method with the HTTP session replaced
+by an offline fake, so the results cover building subjects, HTML bodies
+and form data plus the metrics and tracing around each post, without
+any network I/O.
+
+Usage:
+    python -m benchmarks.bench_mailgun --iterations 20000
+"""
+
+from typing import Any, Dict, List
+
+from app.services.mailgun import MailgunService
+from benchmarks.common import bench, emit, parse_args, quiet_logging, use_fake_mailgun
+
+CONTACT = {
+    "full_name": "Juan Pérez",
+    "email": "juan.perez@example.com",
+    "phone": "+52 123 456 7890",
+    "company": "Empresa S.A.",
+    "product_type": "Textiles",
+    "quantity": "Más de 10,000 unidades",
+    "message": "Me gustaría obtener más información.\nGracias." * 20,
+}
+WARMUP = 100
+
+
+def run(iterations: int) -> List[Dict[str, Any]]:
+    """Time every send method against the fake session."""
+    service = MailgunService()
+    session = use_fake_mailgun(service)
+
+    cases = {
+        "send_email": lambda: service.send_email(
+            to_emails=["cliente@example.com"],
+            subject="Asunto",
+            html="<p>Hola</p>",
+            reply_to="ventas@example.com",
+            custom_data={"client_id": 1, "source": "landing"},
+        ),
+        "send_template_email": lambda: service.send_template_email(
+            to_emails=["cliente@example.com"],
+            template_name="welcome",
+            template_variables={"name": "Juan", "plan": "basic"},
+            subject="Bienvenido",
+        ),
+        "send_welcome_email": lambda: service.send_welcome_email(
+            "cliente@example.com", "Juan"
+        ),
+        "send_contact_form_email": lambda: service.send_contact_form_email(
+            admin_email="admin@example.com", **CONTACT
+        ),
+    }
+    results = []
+    for name, func in cases.items():
+        session.posts = 0
+        result = bench(f"mailgun.{name}", func, iterations=iterations, warmup=WARMUP)
+        result["posts_per_call"] = round(session.posts / (iterations + WARMUP), 2)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    args = parse_args(__doc__, iterations=20_000)
+    quiet_logging()
+    emit("mailgun", run(args.iterations), args.output)
+
+
+if __name__ == "__main__":
+    main()
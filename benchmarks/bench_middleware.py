@@ -0,0 +1,81 @@
+"""
+Middleware throughput benchmark.
+
+Compares the former ``@app.middleware("http")`` no-cache hook, which runs
+on Starlette's BaseHTTPMiddleware, with the pure ASGI
+``CacheControlMiddleware`` on the same minimal endpoint.
+
+Usage:
+    python -m benchmarks.bench_middleware --iterations 20000
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+
+from app.middleware.cache import CacheControlMiddleware
+from benchmarks.common import asgi_request, bench_async, emit, parse_args
+
+
+def build_app(variant: str) -> FastAPI:
+    """
+    Build a minimal app with the given no-cache implementation.
+
+    Args:
+        variant: ``none``, ``base_http_middleware`` or ``pure_asgi``
+
+    Returns:
+        FastAPI application
+    """
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health() -> Dict[str, str]:
+        return {"status": "healthy"}
+
+    if variant == "base_http_middleware":
+
+        @app.middleware("http")
+        async def add_no_cache_headers(request: Request, call_next):
+            response = await call_next(request)
+            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+            response.headers["Pragma"] = "no-cache"
+            response.headers["Expires"] = "0"
+            return response
+
+    elif variant == "pure_asgi":
+        app.add_middleware(CacheControlMiddleware)
+
+    return app
+
+
+async def run(iterations: int) -> List[Dict[str, Any]]:
+    """Run every variant sequentially and with concurrent callers."""
+    results = []
+    for concurrency in (1, 32):
+        for variant in ("none", "base_http_middleware", "pure_asgi"):
+            app = build_app(variant)
+
+            async def call() -> None:
+                await asgi_request(app, "/health")
+
+            results.append(
+                await bench_async(
+                    f"no_cache_middleware[{variant}]",
+                    call,
+                    iterations=iterations,
+                    concurrency=concurrency,
+                )
+            )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    args = parse_args(__doc__, iterations=20_000)
+    emit("middleware", asyncio.run(run(args.iterations)), args.output)
+
+
+if __name__ == "__main__":
+    main()
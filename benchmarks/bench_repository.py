@@ -0,0 +1,257 @@
+"""
+Client repository benchmark.
+
+Times every ``ClientRepository`` method, sync and async, against a SQLite
+file seeded with 10k, 100k and 1M client rows. Lookups pick random
+existing rows; ``create`` inserts new rows that ``delete`` then removes,
+so every table size stays stable. Queries that scan or sort the table
+run fewer iterations.
+
+Usage:
+    python -m benchmarks.bench_repository --iterations 500 --rows 10000 100000
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.models.client import Client
+from app.repositories.client_repository import ClientRepository
+from app.schemas.client import ClientCreate, ClientUpdate
+from benchmarks.common import bench, bench_async, emit, make_parser, quiet_logging
+
+ROW_COUNTS = (10_000, 100_000, 1_000_000)
+SEED_BATCH = 10_000
+
+# Columns of a back office listing, the message left out
+LIST_FIELDS = ["id", "full_name", "email", "phone", "company", "created_at"]
+
+
+def client_rows(count: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Generate client rows in insert batches.
+
+    Args:
+        count: Total number of rows
+
+    Yields:
+        Batches of column dictionaries, with ids from 1 to ``count``
+    """
+    created = datetime(2024, 1, 1)
+    for start in range(1, count + 1, SEED_BATCH):
+        batch = []
+        for i in range(start, min(start + SEED_BATCH, count + 1)):
+            timestamp = created + timedelta(seconds=i)
+            batch.append(
+                {
+                    "id": i,
+                    "full_name": f"Cliente {i}",
+                    "email": f"cliente{i}@example.com",
+                    "phone": "+52 123 456 7890",
+                    "company": f"Empresa {i % 500} S.A.",
+                    "product_type": "Textiles",
+                    "quantity": "100",
+                    "message": f"Me gustaría obtener más información. Ref {i}.",
+                    "created_at": timestamp,
+                    "updated_at": timestamp,
+                }
+            )
+        yield batch
+
+
+def seed(url: str, rows: int) -> None:
+    """
+    Create the schema and insert the client rows.
+
+    Args:
+        url: Synchronous database URL
+        rows: Number of rows
+    """
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for batch in client_rows(rows):
+            connection.execute(insert(Client), batch)
+    engine.dispose()
+
+
+def new_client(i: int) -> ClientCreate:
+    """Build the data of a client to insert."""
+    return ClientCreate(
+        full_name=f"Nuevo {i}",
+        email=f"nuevo{i}@example.com",
+        phone="+52 123 456 7890",
+        message="Mensaje del benchmark.",
+    )
+
+
+Case = Tuple[str, Callable[[], Any], int]
+
+
+def sync_cases(
+    repo: ClientRepository, rows: int, iterations: int, rng: random.Random
+) -> List[Case]:
+    """List the synchronous methods with their call and iteration count."""
+    scans = max(3, iterations // 20)
+    created: List[int] = []
+    updates = ClientUpdate(company="Actualizada S.A.")
+    counter = iter(range(10**9))
+
+    def create() -> None:
+        created.append(repo.create(new_client(next(counter))).id)
+
+    return [
+        ("get_by_id", lambda: repo.get_by_id(rng.randint(1, rows)), iterations),
+        (
+            "get_by_email",
+            lambda: repo.get_by_email(f"cliente{rng.randint(1, rows)}@example.com"),
+            iterations,
+        ),
+        ("update", lambda: repo.update(rng.randint(1, rows), updates), iterations),
+        ("create", create, iterations),
+        ("delete", lambda: repo.delete(created.pop()), iterations),
+        ("get_all[first_page]", lambda: repo.get_all(0, 100), scans),
+        ("get_all[last_page]", lambda: repo.get_all(rows - 100, 100), scans),
+        (
+            "get_all[first_page,message]",
+            lambda: repo.get_all(0, 100, include_message=True),
+            scans,
+        ),
+        ("get_rows[first_page]", lambda: repo.get_rows(LIST_FIELDS, 0, 100), scans),
+        ("count", repo.count, scans),
+    ]
+
+
+def async_cases(
+    repo: ClientRepository, rows: int, iterations: int, rng: random.Random
+) -> List[Case]:
+    """List the asynchronous methods with their call and iteration count."""
+    scans = max(3, iterations // 20)
+    created: List[int] = []
+    updates = ClientUpdate(company="Actualizada S.A.")
+    counter = iter(range(10**9, 2 * 10**9))
+
+    async def create() -> None:
+        created.append((await repo.create_async(new_client(next(counter)))).id)
+
+    return [
+        (
+            "get_by_id_async",
+            lambda: repo.get_by_id_async(rng.randint(1, rows)),
+            iterations,
+        ),
+        (
+            "get_by_email_async",
+            lambda: repo.get_by_email_async(
+                f"cliente{rng.randint(1, rows)}@example.com"
+            ),
+            iterations,
+        ),
+        (
+            "update_async",
+            lambda: repo.update_async(rng.randint(1, rows), updates),
+            iterations,
+        ),
+        ("create_async", create, iterations),
+        ("delete_async", lambda: repo.delete_async(created.pop()), iterations),
+        ("get_all_async[first_page]", lambda: repo.get_all_async(0, 100), scans),
+        (
+            "get_all_async[last_page]",
+            lambda: repo.get_all_async(rows - 100, 100),
+            scans,
+        ),
+        (
+            "get_all_async[first_page,message]",
+            lambda: repo.get_all_async(0, 100, include_message=True),
+            scans,
+        ),
+        (
+            "get_rows_async[first_page]",
+            lambda: repo.get_rows_async(LIST_FIELDS, 0, 100),
+            scans,
+        ),
+        ("count_async", repo.count_async, scans),
+    ]
+
+
+async def run_async(
+    url: str, rows: int, iterations: int, rng: random.Random
+) -> List[Dict[str, Any]]:
+    """Time the asynchronous methods on one table size."""
+    engine = create_async_engine(url)
+    results = []
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        repo = ClientRepository(session)
+        for name, func, count in async_cases(repo, rows, iterations, rng):
+            results.append(
+                await bench_async(
+                    f"repository.{name}[rows={rows}]",
+                    func,
+                    iterations=count,
+                    warmup=1,
+                    rows=rows,
+                )
+            )
+    await engine.dispose()
+    return results
+
+
+def run(
+    iterations: int, row_counts: Sequence[int] = ROW_COUNTS
+) -> List[Dict[str, Any]]:
+    """Time every repository method on every table size."""
+    results = []
+    for rows in row_counts:
+        rng = random.Random(rows)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.db")
+            seed(f"sqlite:///{path}", rows)
+
+            engine = create_engine(f"sqlite:///{path}")
+            with Session(engine, expire_on_commit=False) as session:
+                repo = ClientRepository(session)
+                for name, func, count in sync_cases(repo, rows, iterations, rng):
+                    results.append(
+                        bench(
+                            f"repository.{name}[rows={rows}]",
+                            func,
+                            iterations=count,
+                            warmup=1,
+                            rows=rows,
+                        )
+                    )
+            engine.dispose()
+
+            results.extend(
+                asyncio.run(
+                    run_async(f"sqlite+aiosqlite:///{path}", rows, iterations, rng)
+                )
+            )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    parser = make_parser(__doc__, iterations=500)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=list(ROW_COUNTS),
+        help="Table sizes to benchmark",
+    )
+    args = parser.parse_args()
+    quiet_logging()
+    emit("repository", run(args.iterations, args.rows), args.output)
+
+
+if __name__ == "__main__":
+    main()
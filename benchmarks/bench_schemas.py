@@ -0,0 +1,158 @@
+"""
+Schema validation benchmark.
+
+Measures validations per second for the models in
+``app/schemas/client.py``, and compares the validation fast paths with
+what they replaced:
+
+* phone checks: chained ``str.replace`` and a generator against the
+  precompiled pattern, alone and with E.164 normalization
+* email: ``EmailStr`` against ``CachedEmailStr`` on a repeated address
+* ``ContactForm``: the former model against the current one
+* client lists: one ``model_validate`` per row against a ``TypeAdapter``
+
+Usage:
+    python -m benchmarks.bench_schemas --iterations 20000
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, field_validator
+
+from app.core.config import settings
+from app.schemas.client import (
+    ClientCreate,
+    ClientResponse,
+    ClientResponseList,
+    ContactForm,
+)
+from app.schemas.validators import CachedEmailStr, check_phone, to_e164
+from benchmarks.common import bench, emit, parse_args
+
+FORM = {
+    "full_name": "Juan Pérez",
+    "email": "juan.perez@example.com",
+    "phone": "+52 (123) 456-7890",
+    "company": "Empresa S.A.",
+    "product_type": "Textiles",
+    "quantity": "Más de 10,000 unidades",
+    "message": "Me gustaría obtener más información sobre sus productos.",
+}
+
+
+def legacy_check_phone(v: str) -> str:
+    """Phone check as ``ContactForm.validate_phone`` used to do it."""
+    cleaned = v.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
+    if not any(char.isdigit() for char in cleaned):
+        raise ValueError("Phone number must contain digits")
+    return v
+
+
+class LegacyContactForm(BaseModel):
+    """``ContactForm`` before the validation fast path."""
+
+    full_name: str = Field(..., min_length=2, max_length=100)
+    email: EmailStr
+    phone: str = Field(..., min_length=10, max_length=20)
+    company: Optional[str] = Field(None, max_length=255)
+    product_type: Optional[str] = Field(None, max_length=100)
+    quantity: Optional[str] = Field(None, max_length=100)
+    message: str = Field(..., min_length=10, max_length=2000)
+
+    @field_validator("phone")
+    @classmethod
+    def validate_phone(cls, v: str) -> str:
+        """Validate the phone number the former way."""
+        return legacy_check_phone(v)
+
+
+def client_rows(count: int) -> List[SimpleNamespace]:
+    """
+    Build ORM-like client rows.
+
+    Args:
+        count: Number of rows
+
+    Returns:
+        Objects with the attributes of a ``Client`` row
+    """
+    now = datetime(2024, 1, 15, 10, 30)
+    return [
+        SimpleNamespace(
+            id=i,
+            full_name=f"Cliente {i}",
+            email=f"cliente{i}@example.com",
+            phone="+52 123 456 7890",
+            company="Empresa S.A.",
+            product_type="Textiles",
+            quantity="100",
+            message="Me gustaría obtener más información.",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def run(iterations: int) -> List[Dict[str, Any]]:
+    """Time every validation path."""
+    phone = FORM["phone"]
+    email = FORM["email"]
+    country = settings.phone_default_country_code
+    body = json.dumps(FORM).encode()
+    email_str = TypeAdapter(EmailStr)
+    cached_email_str: TypeAdapter[str] = TypeAdapter(CachedEmailStr)
+    rows = client_rows(100)
+    list_iterations = max(1, iterations // 100)
+
+    cases = [
+        ("phone[legacy]", lambda: legacy_check_phone(phone), iterations),
+        ("phone[precompiled]", lambda: check_phone(phone), iterations),
+        (
+            "phone[precompiled+e164]",
+            lambda: to_e164(check_phone(phone), country),
+            iterations,
+        ),
+        ("email[EmailStr]", lambda: email_str.validate_python(email), iterations),
+        (
+            "email[CachedEmailStr]",
+            lambda: cached_email_str.validate_python(email),
+            iterations,
+        ),
+        (
+            "contact_form[legacy]",
+            lambda: LegacyContactForm.model_validate(FORM),
+            iterations,
+        ),
+        ("contact_form", lambda: ContactForm.model_validate(FORM), iterations),
+        (
+            "contact_form_json",
+            lambda: ContactForm.model_validate_json(body),
+            iterations,
+        ),
+        ("client_create", lambda: ClientCreate.model_validate(FORM), iterations),
+        (
+            "client_list[model_validate, rows=100]",
+            lambda: [ClientResponse.model_validate(row) for row in rows],
+            list_iterations,
+        ),
+        (
+            "client_list[TypeAdapter, rows=100]",
+            lambda: ClientResponseList.validate_python(rows, from_attributes=True),
+            list_iterations,
+        ),
+    ]
+    return [bench(name, func, iterations=count) for name, func, count in cases]
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    args = parse_args(__doc__, iterations=20_000)
+    emit("schemas", run(args.iterations), args.output)
+
+
+if __name__ == "__main__":
+    main()
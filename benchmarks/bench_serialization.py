@@ -0,0 +1,134 @@
+"""
+Contact response serialization benchmark.
+
+Compares three ways of turning the contact form result into response
+bytes:
+
+* ``dict_response_model``: the former path, an untyped ``data`` dict
+  validated against ``response_model``, run through ``jsonable_encoder``
+  and encoded by ``JSONResponse``
+* ``typed_response_model``: the typed ``ContactResponse`` returned to
+  FastAPI, which still validates and re-encodes it
+* ``typed_direct``: the typed model returned as a ``PydanticJSONResponse``,
+  encoded to bytes by the compiled serializer with no second validation
+
+Usage:
+    python -m benchmarks.bench_serialization --iterations 20000
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Type
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel, Field
+from starlette.responses import JSONResponse
+
+from app.core.responses import PydanticJSONResponse
+from app.schemas.client import ContactForm, ContactResponse, ContactSubmissionData
+from benchmarks.common import bench_async, emit, parse_args
+
+FORM = ContactForm(
+    full_name="Juan Pérez",
+    email="juan.perez@example.com",
+    phone="+52 123 456 7890",
+    company="Empresa S.A.",
+    product_type="Textiles",
+    quantity="Más de 10,000 unidades",
+    message="Me gustaría obtener más información sobre sus productos. " * 10,
+)
+MESSAGE = "Mensaje enviado exitosamente. Te responderemos pronto."
+
+
+class DictContactResponse(BaseModel):
+    """``ContactResponse`` as it was, with an untyped ``data`` dict."""
+
+    success: bool = Field(..., description="Operation success status")
+    message: str = Field(..., description="Response message")
+    data: dict = Field(default_factory=dict, description="Response data")
+
+
+def through_response_model(
+    model: Type[BaseModel], build: Callable[[], BaseModel]
+) -> Callable[[], Awaitable[bytes]]:
+    """
+    Serialize the way FastAPI does for an endpoint with ``response_model``.
+
+    Args:
+        model: Response model of the endpoint
+        build: Endpoint body building the returned model
+
+    Returns:
+        Coroutine function producing the response body
+    """
+    field = create_response_field(name="Response", type_=model, mode="serialization")
+
+    async def render() -> bytes:
+        content = await serialize_response(field=field, response_content=build())
+        return JSONResponse(content).body
+
+    return render
+
+
+def build_dict() -> BaseModel:
+    """Build the former untyped response."""
+    return DictContactResponse(
+        success=True,
+        message=MESSAGE,
+        data={
+            "full_name": FORM.full_name,
+            "email": FORM.email,
+            "phone": FORM.phone,
+            "company": FORM.company,
+            "product_type": FORM.product_type,
+            "quantity": FORM.quantity,
+            "message": FORM.message,
+            "timestamp": datetime.now().isoformat(),
+        },
+    )
+
+
+def build_typed() -> ContactResponse:
+    """Build the typed response the endpoint now returns."""
+    return ContactResponse(
+        success=True,
+        message=MESSAGE,
+        data=ContactSubmissionData.from_form(FORM, datetime.now()),
+    )
+
+
+async def typed_direct() -> bytes:
+    """Encode the typed response straight to bytes."""
+    return PydanticJSONResponse(build_typed()).body
+
+
+async def run(iterations: int) -> List[Dict[str, Any]]:
+    """Time every serialization path."""
+    variants: Dict[str, Callable[[], Awaitable[bytes]]] = {
+        "dict_response_model": through_response_model(DictContactResponse, build_dict),
+        "typed_response_model": through_response_model(ContactResponse, build_typed),
+        "typed_direct": typed_direct,
+    }
+    results = []
+    for name, render in variants.items():
+        body = await render()
+        results.append(
+            await bench_async(
+                f"contact_response[{name}]",
+                render,
+                iterations=iterations,
+                body_bytes=len(body),
+            )
+        )
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print JSON results."""
+    args = parse_args(__doc__, iterations=20_000)
+    emit("serialization", asyncio.run(run(args.iterations)), args.output)
+
+
+if __name__ == "__main__":
+    main()
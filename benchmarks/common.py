@@ -0,0 +1,351 @@
+"""
+Shared benchmark helpers.
+
+This module provides timing loops, an in-process ASGI request driver, an
+offline stand-in for the Mailgun API and JSON result emission used by
+every benchmark module.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """
+    Compute a percentile with linear interpolation.
+
+    Args:
+        samples: Sorted samples
+        q: Percentile between 0 and 100
+
+    Returns:
+        Interpolated percentile value
+    """
+    if not samples:
+        return 0.0
+    position = (len(samples) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+def summarize(
+    name: str, latencies: List[float], elapsed: float, **extra: Any
+) -> Dict[str, Any]:
+    """
+    Build a result record from per-operation latencies.
+
+    Args:
+        name: Benchmark name
+        latencies: Per-operation latencies in seconds
+        elapsed: Wall-clock time of the measured loop in seconds
+        **extra: Additional fields to include
+
+    Returns:
+        Result record with throughput and latency percentiles
+    """
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "iterations": len(ordered),
+        "ops_per_sec": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 3) if ordered else 0.0,
+        "p50_us": round(percentile(ordered, 50) * 1e6, 3),
+        "p99_us": round(percentile(ordered, 99) * 1e6, 3),
+        **extra,
+    }
+
+
+def bench(
+    name: str,
+    func: Callable[[], Any],
+    iterations: int = 10_000,
+    warmup: int = 100,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    Time a synchronous callable.
+
+    Args:
+        name: Benchmark name
+        func: Callable to time
+        iterations: Measured calls
+        warmup: Unmeasured calls run first
+        **extra: Additional fields for the result
+
+    Returns:
+        Result record
+    """
+    for _ in range(warmup):
+        func()
+    latencies = []
+    clock = time.perf_counter
+    started = clock()
+    for _ in range(iterations):
+        t0 = clock()
+        func()
+        latencies.append(clock() - t0)
+    return summarize(name, latencies, clock() - started, **extra)
+
+
+async def bench_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    iterations: int = 10_000,
+    warmup: int = 100,
+    concurrency: int = 1,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    Time an async callable, optionally with concurrent callers.
+
+    Args:
+        name: Benchmark name
+        func: Coroutine function to time
+        iterations: Measured calls in total
+        warmup: Unmeasured calls run first
+        concurrency: Number of concurrent callers
+        **extra: Additional fields for the result
+
+    Returns:
+        Result record
+    """
+    for _ in range(warmup):
+        await func()
+    latencies: List[float] = []
+    clock = time.perf_counter
+    per_worker = max(1, iterations // concurrency)
+
+    async def worker() -> None:
+        for _ in range(per_worker):
+            t0 = clock()
+            await func()
+            latencies.append(clock() - t0)
+
+    started = clock()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(
+        name, latencies, clock() - started, concurrency=concurrency, **extra
+    )
+
+
+async def asgi_request(
+    app: Callable[..., Awaitable[None]],
+    path: str,
+    method: str = "GET",
+    body: bytes = b"",
+    headers: Iterable[Tuple[bytes, bytes]] = (),
+) -> Tuple[int, Dict[bytes, bytes], bytes]:
+    """
+    Send one HTTP request straight into an ASGI app, without a network.
+
+    Args:
+        app: ASGI application
+        path: Request path
+        method: HTTP method
+        body: Request body
+        headers: Raw request headers
+
+    Returns:
+        Status code, response headers and response body
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), *headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    status = 0
+    response_headers: Dict[bytes, bytes] = {}
+    chunks: List[bytes] = []
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal request_sent
+        if request_sent:
+            await asyncio.sleep(3600)
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update(message.get("headers", ()))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
+
+
+class FakeMailgunResponse:
+    """Successful Mailgun API response."""
+
+    status_code = 200
+
+    def raise_for_status(self) -> None:
+        """Accept the response."""
+
+    def json(self) -> Dict[str, Any]:
+        """Return the body Mailgun sends for a queued message."""
+        return {"id": "<bench@mailgun.test>", "message": "Queued. Thank you."}
+
+
+class FakeMailgunSession:
+    """
+    Stand-in for the ``requests.Session`` of ``MailgunService``.
+
+    Posts succeed without any network I/O, after an optional fixed delay
+    standing in for the API round trip.
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            latency: Seconds each post blocks, as the real call would
+        """
+        self.latency = latency
+        self.posts = 0
+
+    def post(self, url: str, **kwargs: Any) -> FakeMailgunResponse:
+        """Accept a message."""
+        if self.latency:
+            time.sleep(self.latency)
+        self.posts += 1
+        return FakeMailgunResponse()
+
+    def head(self, url: str, **kwargs: Any) -> FakeMailgunResponse:
+        """Accept a warm-up request."""
+        return FakeMailgunResponse()
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def use_fake_mailgun(service: Any, latency: float = 0.0) -> FakeMailgunSession:
+    """
+    Configure a ``MailgunService`` to send through a fake session.
+
+    Args:
+        service: Mailgun service to configure
+        latency: Simulated API round trip in seconds
+
+    Returns:
+        The fake session, which counts posts
+    """
+    session = FakeMailgunSession(latency)
+    service.api_key = "bench-key"
+    service.domain = "mailgun.test"
+    service.auth = ("api", service.api_key)
+    service.session = session
+    return session
+
+
+def quiet_logging() -> None:
+    """Silence informational logs, which would interleave with the results."""
+    logging.disable(logging.INFO)
+
+
+def git_commit() -> Optional[str]:
+    """
+    Identify the checked out commit.
+
+    Returns:
+        Short commit hash, with ``-dirty`` if there are local changes, or
+        None outside a git checkout
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=12"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit or None
+
+
+def environment() -> Dict[str, Optional[str]]:
+    """
+    Describe the code, machine and interpreter running the benchmarks.
+
+    Returns:
+        Commit, Python version, implementation and platform
+    """
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+    }
+
+
+def emit(
+    suite: str, results: List[Dict[str, Any]], output: Optional[str] = None
+) -> None:
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        suite: Name of the benchmark suite
+        results: Result records
+        output: File path, or None to print to stdout
+    """
+    document = {"suite": suite, "environment": environment(), "results": results}
+    text = json.dumps(document, indent=2)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+def make_parser(description: str, iterations: int = 10_000) -> argparse.ArgumentParser:
+    """
+    Build the common command line parser of a benchmark module.
+
+    Args:
+        description: Help text for the benchmark
+        iterations: Default number of measured iterations
+
+    Returns:
+        Parser with ``--iterations`` and ``--output``, ready for extra options
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--iterations", type=int, default=iterations)
+    parser.add_argument("--output", help="Write JSON results to this file")
+    return parser
+
+
+def parse_args(description: str, iterations: int = 10_000) -> argparse.Namespace:
+    """
+    Parse the common command line options of a benchmark module.
+
+    Args:
+        description: Help text for the benchmark
+        iterations: Default number of measured iterations
+
+    Returns:
+        Parsed arguments with ``iterations`` and ``output``
+    """
+    return make_parser(description, iterations).parse_args()
@@ -0,0 +1,79 @@
+"""
+Fake Mailgun API server.
+
+Accepts every message sent to ``/<domain>/messages`` and answers like
+Mailgun does for a queued message, after an optional delay, so a real
+server can be load tested without sending email.
+
+Usage:
+    python -m benchmarks.fake_mailgun --port 8025 --latency-ms 50
+"""
+
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+
+RESPONSE = json.dumps(
+    {"id": "<loadgen@mailgun.test>", "message": "Queued. Thank you."}
+).encode()
+
+
+def make_server(address: Tuple[str, int], latency: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Build the fake Mailgun server.
+
+    Args:
+        address: Host and port to listen on, port 0 for any free port
+        latency: Seconds to wait before answering each request
+
+    Returns:
+        Server ready for ``serve_forever``
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _answer(self, body: bytes) -> None:
+            if latency:
+                time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self._answer(RESPONSE)
+
+        def do_HEAD(self) -> None:
+            self._answer(b"")
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(address, Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    """Serve until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    server = make_server((args.host, args.port), args.latency_ms / 1000)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,622 @@
+"""
+Open-loop load generator for the contact API.
+
+Sends realistic contact form submissions at a scheduled arrival rate,
+either to a running server or to the in-process ASGI app with Mailgun
+faked. Requests are started on schedule whether or not earlier ones
+have finished, and latency is measured from the scheduled send time, so
+time spent waiting behind a saturated server or a busy client counts
+against the server instead of silently lowering the offered load
+(coordinated omission).
+
+Traffic profiles:
+
+* ``constant``: ``--rate`` requests per second
+* ``ramp``: linearly from ``--rate`` to ``--end-rate``, to find the
+  saturation point
+* ``burst``: ``--rate``, raised to ``--burst-rate`` for
+  ``--burst-length`` seconds every ``--burst-every`` seconds
+
+The report holds the latency histogram, error rate, per-window offered
+and achieved throughput, and the first window where the target fell
+behind, missed the latency objective or returned errors.
+
+To measure the capacity of one real worker, run uvicorn against the
+fake Mailgun server of ``benchmarks.fake_mailgun``::
+
+    python -m benchmarks.fake_mailgun --port 8025 &
+    MAILGUN_BASE_URL=http://127.0.0.1:8025 MAILGUN_API_KEY=key \\
+        MAILGUN_DOMAIN=mailgun.test ADMIN_EMAIL=admin@example.com \\
+        uvicorn app.main:app --workers 1 --port 8000
+
+Usage:
+    python -m benchmarks.loadgen --profile ramp --rate 10 --end-rate 400 \\
+        --duration 60 --url http://127.0.0.1:8000
+    python -m benchmarks.loadgen --profile burst --rate 20 --burst-rate 200
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import tempfile
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from benchmarks.common import asgi_request, emit, quiet_logging, use_fake_mailgun
+
+CONTACT_PATH = "/api/v1/contact/"
+
+FIRST_NAMES = ("Juan", "María", "José", "Guadalupe", "Luis", "Ana", "Carlos", "Sofía")
+LAST_NAMES = ("Pérez", "García", "Hernández", "López", "Martínez", "Rodríguez")
+DOMAINS = ("gmail.com", "hotmail.com", "outlook.com", "empresa.com.mx", "yahoo.com")
+PRODUCT_TYPES = ("Textiles", "Hilos", "Telas técnicas", "Confección")
+QUANTITIES = ("100", "1,000 - 10,000", "Más de 10,000 unidades", "Por confirmar")
+SENTENCES = (
+    "Me gustaría obtener más información sobre sus productos.",
+    "¿Podrían enviarme una cotización?",
+    "Buscamos un proveedor para la próxima temporada.",
+    "¿Cuáles son los tiempos de entrega?",
+    "Necesitamos muestras antes de hacer el pedido.",
+)
+
+Send = Callable[[bytes], Awaitable[int]]
+
+
+def ascii_slug(text: str) -> str:
+    """Lowercase text with its accents removed, for email local parts."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return decomposed.encode("ascii", "ignore").decode()
+
+
+class ContactPayloads:
+    """
+    Generate valid, varied ``ContactForm`` request bodies.
+
+    Optional fields are left out at realistic rates and message lengths
+    vary, so validation and email rendering see a realistic mix.
+    """
+
+    def __init__(self, seed: int = 42) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Random seed, so runs send the same sequence
+        """
+        self.rng = random.Random(seed)
+        self.sequence = 0
+
+    def form(self) -> Dict[str, Any]:
+        """
+        Build one submission.
+
+        Returns:
+            Contact form fields
+        """
+        rng = self.rng
+        self.sequence += 1
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        form: Dict[str, Any] = {
+            "full_name": f"{first} {last}",
+            "email": f"{ascii_slug(first)}.{self.sequence}@{rng.choice(DOMAINS)}",
+            "phone": rng.choice(
+                (
+                    f"+52 {rng.randint(100, 999)} {rng.randint(100, 999)} "
+                    f"{rng.randint(1000, 9999)}",
+                    f"({rng.randint(100, 999)}) {rng.randint(100, 999)}-"
+                    f"{rng.randint(1000, 9999)}",
+                    f"{rng.randint(10**9, 10**10 - 1)}",
+                )
+            ),
+            "message": " ".join(
+                rng.choice(SENTENCES) for _ in range(rng.randint(1, 12))
+            ),
+        }
+        if rng.random() < 0.6:
+            form["company"] = f"{last} Textil S.A. de C.V."
+        if rng.random() < 0.7:
+            form["product_type"] = rng.choice(PRODUCT_TYPES)
+        if rng.random() < 0.5:
+            form["quantity"] = rng.choice(QUANTITIES)
+        return form
+
+    def __call__(self) -> bytes:
+        """Build one encoded request body."""
+        return json.dumps(self.form()).encode()
+
+
+@dataclass
+class TrafficProfile:
+    """
+    Arrival rate over time.
+
+    Attributes:
+        kind: ``constant``, ``ramp`` or ``burst``
+        rate: Requests per second (starting rate for ``ramp``)
+        duration: Length of the run in seconds
+        end_rate: Final rate of a ramp
+        burst_rate: Rate during bursts
+        burst_every: Seconds from one burst start to the next
+        burst_length: Seconds each burst lasts
+        poisson: Draw exponential gaps around the rate instead of
+            evenly spaced arrivals
+    """
+
+    kind: str = "constant"
+    rate: float = 50.0
+    duration: float = 30.0
+    end_rate: Optional[float] = None
+    burst_rate: Optional[float] = None
+    burst_every: float = 10.0
+    burst_length: float = 1.0
+    poisson: bool = False
+
+    def rate_at(self, t: float) -> float:
+        """
+        Get the intended arrival rate.
+
+        Args:
+            t: Seconds since the start of the run
+
+        Returns:
+            Requests per second at that time
+        """
+        if self.kind == "ramp":
+            end = self.rate if self.end_rate is None else self.end_rate
+            return self.rate + (end - self.rate) * min(t / self.duration, 1.0)
+        if self.kind == "burst" and t % self.burst_every < self.burst_length:
+            return self.rate if self.burst_rate is None else self.burst_rate
+        return self.rate
+
+    def arrivals(self, rng: random.Random) -> Iterator[float]:
+        """
+        Schedule the requests.
+
+        Args:
+            rng: Random source for Poisson arrivals
+
+        Yields:
+            Send times in seconds since the start of the run
+        """
+        t = 0.0
+        while True:
+            rate = self.rate_at(t)
+            gap = rng.expovariate(rate) if self.poisson else 1.0 / rate
+            t += gap
+            if t >= self.duration:
+                return
+            yield t
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with bounded relative error.
+
+    Values are counted in buckets whose bounds grow by ``1 + precision``,
+    so any percentile is reported within that relative error, however
+    many values are recorded.
+    """
+
+    def __init__(self, precision: float = 0.01, lowest: float = 1e-6) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            precision: Relative width of each bucket
+            lowest: Smallest distinguishable value in seconds
+        """
+        self.lowest = lowest
+        self._log_base = math.log1p(precision)
+        self.buckets: Counter = Counter()
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """
+        Count one latency.
+
+        Args:
+            value: Latency in seconds
+        """
+        index = max(
+            0,
+            math.ceil(math.log(max(value, self.lowest) / self.lowest) / self._log_base),
+        )
+        self.buckets[index] += 1
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def _upper(self, index: int) -> float:
+        """Upper bound of a bucket in seconds."""
+        return self.lowest * math.exp(index * self._log_base)
+
+    def percentile(self, q: float) -> float:
+        """
+        Get a latency percentile.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Describe the distribution in milliseconds.
+
+        Returns:
+            Count, common percentiles and maximum
+        """
+        return {
+            "count": self.count,
+            **{
+                f"p{str(q).replace('.', '_')}_ms": round(self.percentile(q) * 1000, 3)
+                for q in (50, 90, 99, 99.9)
+            },
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+    def buckets_ms(self) -> List[List[float]]:
+        """
+        Export the non-empty buckets.
+
+        Returns:
+            Pairs of bucket upper bound in milliseconds and count
+        """
+        return [
+            [round(self._upper(index) * 1000, 4), self.buckets[index]]
+            for index in sorted(self.buckets)
+        ]
+
+
+@dataclass
+class Outcome:
+    """
+    One request of a load run; times are seconds since the run started.
+
+    Attributes:
+        intended: Scheduled send time
+        started: Time the request was actually sent
+        finished: Time the response or error arrived
+        status: HTTP status, 0 if no response was received
+        error: Exception type name for failed requests
+    """
+
+    intended: float
+    started: float
+    finished: float
+    status: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded with a 2xx response."""
+        return self.error is None and 200 <= self.status < 300
+
+
+async def drive(
+    send: Send,
+    profile: TrafficProfile,
+    payloads: Callable[[], bytes],
+    max_in_flight: int = 1000,
+    timeout: float = 30.0,
+    seed: int = 42,
+) -> List[Outcome]:
+    """
+    Run one load profile against a target.
+
+    Requests are started at their scheduled time without waiting for
+    earlier responses. Beyond ``max_in_flight`` they queue in the client,
+    and that wait still counts towards their latency.
+
+    Args:
+        send: Coroutine function posting a body and returning the status
+        profile: Arrival schedule
+        payloads: Callable building each request body
+        max_in_flight: Most requests outstanding at once
+        timeout: Seconds before a request counts as failed
+        seed: Random seed for Poisson arrivals
+
+    Returns:
+        Outcome of every scheduled request
+    """
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(max_in_flight)
+    outcomes: List[Outcome] = []
+    start = loop.time()
+
+    async def request(intended: float, body: bytes) -> None:
+        async with limit:
+            started = loop.time() - start
+            status, error = 0, None
+            try:
+                status = await asyncio.wait_for(send(body), timeout)
+            except asyncio.TimeoutError:
+                error = "Timeout"
+            except Exception as e:
+                error = type(e).__name__
+            outcomes.append(
+                Outcome(intended, started, loop.time() - start, status, error)
+            )
+
+    tasks = []
+    for intended in profile.arrivals(random.Random(seed)):
+        delay = start + intended - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(request(intended, payloads())))
+    await asyncio.gather(*tasks)
+    return outcomes
+
+
+def analyze(
+    outcomes: List[Outcome],
+    profile: TrafficProfile,
+    window: float = 1.0,
+    slo: float = 1.0,
+    max_error_rate: float = 0.01,
+) -> Dict[str, Any]:
+    """
+    Summarize a load run.
+
+    Latency is measured from each request's scheduled time. Per window
+    of scheduled time, the offered rate is compared with the rate of
+    successful responses. The saturation point is the first window that
+    completes under 90% of its offered requests successfully, has a p99
+    above ``slo`` or an error rate above ``max_error_rate``.
+
+    Args:
+        outcomes: Outcomes from ``drive``
+        profile: Profile the outcomes were produced with
+        window: Window length in seconds
+        slo: Latency objective for the p99, in seconds
+        max_error_rate: Highest tolerated error rate per window
+
+    Returns:
+        Report with latency histograms, statuses, errors, windows and
+        the saturation point (None if the target kept up)
+    """
+    latency = LatencyHistogram()
+    service_time = LatencyHistogram()
+    statuses: Counter = Counter()
+    windows: Dict[int, List[Outcome]] = {}
+    for outcome in outcomes:
+        latency.record(outcome.finished - outcome.intended)
+        service_time.record(outcome.finished - outcome.started)
+        statuses[outcome.error or str(outcome.status)] += 1
+        windows.setdefault(int(outcome.intended // window), []).append(outcome)
+
+    rows = []
+    saturation = None
+    for index in sorted(windows):
+        group = windows[index]
+        ordered = sorted(o.finished - o.intended for o in group)
+        p99 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.99) - 1)]
+        succeeded = sum(o.ok for o in group)
+        error_rate = 1 - succeeded / len(group)
+        row = {
+            "start_s": index * window,
+            "offered_rps": round(len(group) / window, 2),
+            "intended_rps": round(profile.rate_at((index + 0.5) * window), 2),
+            "succeeded_rps": round(succeeded / window, 2),
+            "error_rate": round(error_rate, 4),
+            "p99_ms": round(p99 * 1000, 3),
+        }
+        rows.append(row)
+        if saturation is None:
+            reasons = []
+            if succeeded < 0.9 * len(group):
+                reasons.append("throughput")
+            if p99 > slo:
+                reasons.append("latency")
+            if error_rate > max_error_rate:
+                reasons.append("errors")
+            if reasons:
+                saturation = {**row, "reasons": reasons}
+
+    failed = sum(not o.ok for o in outcomes)
+    elapsed = max((o.finished for o in outcomes), default=0.0)
+    return {
+        "name": f"loadgen[{profile.kind}]",
+        "profile": profile.__dict__,
+        "requests": len(outcomes),
+        "succeeded": len(outcomes) - failed,
+        "error_rate": round(failed / len(outcomes), 4) if outcomes else 0.0,
+        "throughput_rps": round((len(outcomes) - failed) / elapsed, 2)
+        if elapsed
+        else 0.0,
+        "statuses": dict(statuses),
+        "latency": latency.summary(),
+        "service_time": service_time.summary(),
+        "saturation": saturation,
+        "windows": rows,
+        "histogram_ms": latency.buckets_ms(),
+    }
+
+
+def asgi_sender(app: Any, path: str = CONTACT_PATH) -> Send:
+    """
+    Post bodies straight into an ASGI app.
+
+    Args:
+        app: ASGI application
+        path: Request path
+
+    Returns:
+        Send function for ``drive``
+    """
+
+    async def send(body: bytes) -> int:
+        status, _, _ = await asgi_request(
+            app,
+            path,
+            method="POST",
+            body=body,
+            headers=[
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        )
+        return status
+
+    return send
+
+
+@dataclass
+class HttpTarget:
+    """
+    Send bodies to a running server over HTTP with a pooled client.
+
+    Attributes:
+        url: Base URL of the server
+        path: Request path
+        max_connections: Connection pool size
+        client: HTTP client, created by ``open``
+    """
+
+    url: str
+    path: str = CONTACT_PATH
+    max_connections: int = 1000
+    client: Any = field(default=None, repr=False)
+
+    async def open(self) -> None:
+        """Create the HTTP client; httpx is a development dependency."""
+        import httpx
+
+        self.client = httpx.AsyncClient(
+            base_url=self.url,
+            timeout=None,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+    async def send(self, body: bytes) -> int:
+        """Post one body."""
+        response = await self.client.post(
+            self.path, content=body, headers={"content-type": "application/json"}
+        )
+        return response.status_code
+
+
+async def run_in_process(
+    profile: TrafficProfile, args: Any, directory: str
+) -> List[Outcome]:
+    """Drive the in-process app with Mailgun faked and SQLite storage."""
+    from benchmarks.bench_endpoints import use_sqlite
+
+    use_sqlite(directory)
+    from app.core.config import settings
+    from app.core.database import create_tables
+    from app.main import create_app
+    from app.services.mailgun import mailgun_service
+
+    settings.admin_email = "admin@example.com"
+    settings.mailgun_api_key = "loadgen-key"
+    settings.mailgun_domain = "mailgun.test"
+    use_fake_mailgun(mailgun_service, args.mailgun_latency_ms / 1000)
+    await create_tables()
+    return await drive(
+        asgi_sender(create_app(), args.path),
+        profile,
+        ContactPayloads(args.seed),
+        args.max_in_flight,
+        args.timeout,
+        args.seed,
+    )
+
+
+async def run_http(profile: TrafficProfile, args: Any) -> List[Outcome]:
+    """Drive a running server."""
+    target = HttpTarget(args.url, args.path, args.max_in_flight)
+    await target.open()
+    try:
+        return await drive(
+            target.send,
+            profile,
+            ContactPayloads(args.seed),
+            args.max_in_flight,
+            args.timeout,
+            args.seed,
+        )
+    finally:
+        await target.close()
+
+
+def main() -> None:
+    """Run a load profile and print the JSON report."""
+    # Load is set by rate and duration, so the common --iterations is not used
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="Write JSON results to this file")
+    parser.add_argument(
+        "--profile", choices=("constant", "ramp", "burst"), default="constant"
+    )
+    parser.add_argument("--rate", type=float, default=50.0, help="Requests/s")
+    parser.add_argument("--end-rate", type=float, help="Final rate of a ramp")
+    parser.add_argument("--burst-rate", type=float, help="Rate during bursts")
+    parser.add_argument("--burst-every", type=float, default=10.0)
+    parser.add_argument("--burst-length", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument("--poisson", action="store_true", help="Random gaps")
+    parser.add_argument("--url", help="Server to load; in-process app if unset")
+    parser.add_argument("--path", default=CONTACT_PATH)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="p99 objective")
+    parser.add_argument("--window", type=float, default=1.0, help="Seconds")
+    parser.add_argument("--mailgun-latency-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    profile = TrafficProfile(
+        kind=args.profile,
+        rate=args.rate,
+        duration=args.duration,
+        end_rate=args.end_rate,
+        burst_rate=args.burst_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        poisson=args.poisson,
+    )
+    quiet_logging()
+    if args.url:
+        outcomes = asyncio.run(run_http(profile, args))
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            outcomes = asyncio.run(run_in_process(profile, args, directory))
+
+    report = analyze(outcomes, profile, args.window, args.slo_ms / 1000)
+    sys.stderr.write(
+        f"{report['requests']} requests, {report['error_rate']:.2%} errors, "
+        f"p50 {report['latency']['p50_ms']}ms, p99 {report['latency']['p99_ms']}ms, "
+        f"saturation: "
+        + (
+            f"{report['saturation']['intended_rps']} rps "
+            f"({', '.join(report['saturation']['reasons'])})"
+            if report["saturation"]
+            else "none"
+        )
+        + "\n"
+    )
+    emit("loadgen", [report], args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Performance regression gate.
+
+Runs the offline benchmark suites several times, reduces each benchmark
+to the median and spread of its p50, p99 and throughput, and compares
+them with a stored baseline. A metric regresses when it is worse than
+the baseline by more than its tolerance, widened by the measured noise
+of both runs. Any regression fails the run with a per-benchmark diff.
+
+Baselines are machine specific: record one on the machine that runs the
+gate, with ``--update-baseline``, before comparing against it.
+
+Usage:
+    python -m benchmarks.perfcheck --update-baseline
+    python -m benchmarks.perfcheck
+    python -m benchmarks.perfcheck --suites schemas serialization --repeats 7
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import statistics
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks import (
+    bench_endpoints,
+    bench_listing,
+    bench_mailgun,
+    bench_middleware,
+    bench_repository,
+    bench_schemas,
+    bench_serialization,
+)
+from benchmarks.common import environment, quiet_logging
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Scale of the median absolute deviation that estimates a standard
+# deviation for normally distributed samples
+MAD_SCALE = 1.4826
+
+# Metrics compared, and whether a higher value is better
+METRICS: Dict[str, bool] = {"p50_us": False, "p99_us": False, "ops_per_sec": True}
+
+DEFAULT_TOLERANCES: Dict[str, float] = {
+    "p50_us": 0.10,
+    "p99_us": 0.25,
+    "ops_per_sec": 0.10,
+}
+
+# Comparison statuses, in report order
+STATUSES = ("regressed", "improved", "new", "missing", "ok")
+
+Summary = Dict[str, Dict[str, Dict[str, float]]]
+
+
+def _run_endpoints(iterations: int) -> List[Dict[str, Any]]:
+    """Run the endpoint suite against a throwaway SQLite database."""
+    with tempfile.TemporaryDirectory() as directory:
+        bench_endpoints.use_sqlite(directory)
+        return asyncio.run(bench_endpoints.run(iterations))
+
+
+# Suite name -> (runner, iterations per run)
+SUITES: Dict[str, Tuple[Callable[[int], List[Dict[str, Any]]], int]] = {
+    "schemas": (bench_schemas.run, 5_000),
+    "serialization": (lambda n: asyncio.run(bench_serialization.run(n)), 5_000),
+    "mailgun": (bench_mailgun.run, 5_000),
+    "middleware": (lambda n: asyncio.run(bench_middleware.run(n)), 2_000),
+    "endpoints": (_run_endpoints, 1_000),
+    "repository": (lambda n: bench_repository.run(n, row_counts=(10_000,)), 100),
+    "listing": (lambda n: bench_listing.run(n, page_size=2_000), 20),
+}
+
+
+@dataclass
+class Comparison:
+    """
+    One metric of one benchmark compared with the baseline.
+
+    Attributes:
+        benchmark: Benchmark key
+        metric: ``p50_us``, ``p99_us`` or ``ops_per_sec``
+        baseline: Baseline median, None for a new benchmark
+        current: Current median, None for a missing benchmark
+        change: Relative change in the direction of "worse", e.g. 0.2
+            for a 20% slower p50 or 20% lower throughput
+        threshold: Relative change tolerated before it counts as a
+            regression
+        status: ``ok``, ``regressed``, ``improved``, ``new`` or ``missing``
+    """
+
+    benchmark: str
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    change: float = 0.0
+    threshold: float = 0.0
+    status: str = "ok"
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    """
+    Build a unique key for a benchmark result.
+
+    Args:
+        result: Result record from a suite
+
+    Returns:
+        Benchmark name, with the concurrency appended when reported
+    """
+    if "concurrency" in result:
+        return f"{result['name']}[concurrency={result['concurrency']}]"
+    return result["name"]
+
+
+def summarize_runs(runs: Sequence[List[Dict[str, Any]]]) -> Summary:
+    """
+    Reduce repeated runs to the median and relative noise of each metric.
+
+    Args:
+        runs: Result records of each run
+
+    Returns:
+        Mapping of benchmark key to metric to ``median`` and ``noise``,
+        the scaled median absolute deviation relative to the median
+    """
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    for results in runs:
+        for result in results:
+            metrics = samples.setdefault(result_key(result), {})
+            for metric in METRICS:
+                metrics.setdefault(metric, []).append(float(result[metric]))
+
+    summary: Summary = {}
+    for key, metrics in samples.items():
+        summary[key] = {}
+        for metric, values in metrics.items():
+            median = statistics.median(values)
+            mad = statistics.median(abs(value - median) for value in values)
+            noise = MAD_SCALE * mad / median if median else 0.0
+            summary[key][metric] = {"median": median, "noise": round(noise, 4)}
+    return summary
+
+
+def compare(
+    baseline: Summary,
+    current: Summary,
+    tolerances: Optional[Dict[str, float]] = None,
+    noise_factor: float = 3.0,
+    min_delta_us: float = 1.0,
+) -> List[Comparison]:
+    """
+    Compare current results with the baseline.
+
+    The threshold of each metric is its tolerance, or ``noise_factor``
+    times the combined noise of both runs if that is larger, so a noisy
+    benchmark needs a bigger change to fail. Latency changes below
+    ``min_delta_us`` are within timer resolution and never count.
+
+    Args:
+        baseline: Baseline summary
+        current: Current summary
+        tolerances: Allowed relative change per metric
+        noise_factor: Noise multiples a change must exceed
+        min_delta_us: Smallest latency change, in microseconds, that counts
+
+    Returns:
+        One comparison per benchmark and metric
+    """
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    comparisons = []
+    for key in sorted(set(baseline) | set(current)):
+        for metric, higher_is_better in METRICS.items():
+            before = baseline.get(key, {}).get(metric)
+            after = current.get(key, {}).get(metric)
+            if before is None or after is None:
+                comparisons.append(
+                    Comparison(
+                        key,
+                        metric,
+                        before["median"] if before else None,
+                        after["median"] if after else None,
+                        status="new" if before is None else "missing",
+                    )
+                )
+                continue
+
+            old, new = before["median"], after["median"]
+            if old:
+                change = (old - new) / old if higher_is_better else (new - old) / old
+            else:
+                change = 0.0
+            noise = math.hypot(before["noise"], after["noise"])
+            threshold = max(tolerances[metric], noise_factor * noise)
+            if not higher_is_better and abs(new - old) < min_delta_us:
+                status = "ok"
+            elif change > threshold:
+                status = "regressed"
+            elif change < -threshold:
+                status = "improved"
+            else:
+                status = "ok"
+            comparisons.append(
+                Comparison(key, metric, old, new, change, threshold, status)
+            )
+    return comparisons
+
+
+def format_report(comparisons: List[Comparison], verbose: bool = False) -> str:
+    """
+    Render comparisons as a plain text table.
+
+    Args:
+        comparisons: Comparisons to render
+        verbose: Include metrics within their threshold
+
+    Returns:
+        Table with one line per metric, followed by a summary line
+    """
+
+    def number(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:,.2f}"
+
+    shown = [c for c in comparisons if verbose or c.status != "ok"]
+    width = max([len(c.benchmark) for c in shown] + [len("benchmark")])
+    lines = [
+        f"{'benchmark':<{width}}  {'metric':<11}  {'baseline':>14}  "
+        f"{'current':>14}  {'worse by':>9}  {'limit':>7}  status"
+    ]
+    for c in shown:
+        known = c.status not in ("new", "missing")
+        lines.append(
+            f"{c.benchmark:<{width}}  {c.metric:<11}  {number(c.baseline):>14}  "
+            f"{number(c.current):>14}  "
+            f"{f'{c.change:+.1%}' if known else '-':>9}  "
+            f"{f'{c.threshold:.1%}' if known else '-':>7}  {c.status}"
+        )
+    counts = [
+        (sum(c.status == status for c in comparisons), status) for status in STATUSES
+    ]
+    lines.append(", ".join(f"{count} {status}" for count, status in counts if count))
+    return "\n".join(lines)
+
+
+def run_suites(
+    suites: Sequence[str],
+    repeats: int,
+    warmup_runs: int,
+    iterations: Optional[int] = None,
+) -> Summary:
+    """
+    Run the suites repeatedly and summarize them.
+
+    Args:
+        suites: Suite names from ``SUITES``
+        repeats: Measured runs of each suite
+        warmup_runs: Discarded rounds before the measured ones
+        iterations: Iterations per run instead of each suite's default
+
+    Returns:
+        Summary of all measured runs, keyed by ``suite/benchmark``
+    """
+    runs: Dict[str, List[List[Dict[str, Any]]]] = {name: [] for name in suites}
+    rounds = warmup_runs + repeats
+    # Suites take turns, so drift in machine speed during the check is
+    # spread over all of them instead of skewing the last ones
+    for attempt in range(rounds):
+        for name in suites:
+            runner, default_iterations = SUITES[name]
+            sys.stderr.write(f"perfcheck: {name} run {attempt + 1}/{rounds}\n")
+            results = runner(iterations or default_iterations)
+            if attempt >= warmup_runs:
+                runs[name].append(results)
+
+    summary: Summary = {}
+    for name, suite_runs in runs.items():
+        for key, metrics in summarize_runs(suite_runs).items():
+            summary[f"{name}/{key}"] = metrics
+    return summary
+
+
+def load_baseline(path: str) -> Summary:
+    """
+    Read a baseline file.
+
+    Args:
+        path: Baseline file written by ``--update-baseline``
+
+    Returns:
+        Baseline summary
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["benchmarks"]
+
+
+def save_baseline(path: str, summary: Summary) -> None:
+    """
+    Write a baseline file.
+
+    Args:
+        path: Destination file
+        summary: Summary to store
+    """
+    document = {"environment": environment(), "benchmarks": summary}
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the gate.
+
+    Args:
+        argv: Command line arguments, defaulting to ``sys.argv``
+
+    Returns:
+        Exit status: 0 if nothing regressed, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store this run as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--suites", nargs="+", choices=sorted(SUITES), default=list(SUITES)
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup-runs", type=int, default=1)
+    parser.add_argument("--iterations", type=int, help="Override suite defaults")
+    parser.add_argument("--noise-factor", type=float, default=3.0)
+    parser.add_argument(
+        "--min-delta-us",
+        type=float,
+        default=1.0,
+        help="Ignore latency changes smaller than this",
+    )
+    for metric, tolerance in DEFAULT_TOLERANCES.items():
+        parser.add_argument(
+            f"--{metric.replace('_', '-')}-tolerance",
+            type=float,
+            default=tolerance,
+            dest=f"{metric}_tolerance",
+            help=f"Allowed relative {metric} change (default {tolerance})",
+        )
+    parser.add_argument(
+        "--verbose", action="store_true", help="List metrics within tolerance too"
+    )
+    args = parser.parse_args(argv)
+
+    quiet_logging()
+    if not args.update_baseline and not os.path.exists(args.baseline):
+        parser.error(
+            f"no baseline at {args.baseline}; record one with --update-baseline"
+        )
+
+    current = run_suites(args.suites, args.repeats, args.warmup_runs, args.iterations)
+    if args.update_baseline:
+        save_baseline(args.baseline, current)
+        sys.stdout.write(f"Baseline with {len(current)} benchmarks saved\n")
+        return 0
+
+    baseline = {
+        key: value
+        for key, value in load_baseline(args.baseline).items()
+        if key.split("/", 1)[0] in args.suites
+    }
+    tolerances = {metric: getattr(args, f"{metric}_tolerance") for metric in METRICS}
+    comparisons = compare(
+        baseline, current, tolerances, args.noise_factor, args.min_delta_us
+    )
+    sys.stdout.write(format_report(comparisons, args.verbose) + "\n")
+    return 1 if any(c.status == "regressed" for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
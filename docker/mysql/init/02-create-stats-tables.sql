@@ -0,0 +1,19 @@
+-- Submission statistics rollup for Zititex API
+-- Maintained by app.jobs.rollup and the /api/v1/stats endpoints
+
+USE zititex_db;
+
+-- Daily submission counts; missing product types and companies are ''
+CREATE TABLE IF NOT EXISTS client_daily_stats (
+    day DATE NOT NULL COMMENT 'Day the submissions were created',
+    product_type VARCHAR(50) NOT NULL DEFAULT '' COMMENT 'Product type, or empty',
+    company VARCHAR(255) NOT NULL DEFAULT '' COMMENT 'Company, or empty',
+    submissions INT NOT NULL DEFAULT 0 COMMENT 'Number of submissions',
+    PRIMARY KEY (day, product_type, company)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Daily submission counts';
+
+-- Highest client id already counted by each rollup
+CREATE TABLE IF NOT EXISTS rollup_watermark (
+    name VARCHAR(50) NOT NULL PRIMARY KEY COMMENT 'Rollup name',
+    last_id INT NOT NULL DEFAULT 0 COMMENT 'Highest source row id counted'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Rollup progress';
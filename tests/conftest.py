@@ -18,21 +18,28 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 from app.core.database import Base, get_async_db, get_db
+from app.core.lifecycle import lifecycle
 from app.main import app
 from app.models.client import Client
+from benchmarks.bench_cold_start import LambdaContext, api_gateway_event
 
 # Use in-memory SQLite for testing
 TEST_DATABASE_URL = "sqlite:///./test.db"
 TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 
+@pytest.fixture(autouse=True)
+def accepting_lifecycle() -> Generator[None, None, None]:
+    """Accept requests again after a test whose lifespan shutdown drained the app."""
+    yield
+    lifecycle.reset()
+
+
 # Synchronous test engine and session
 @pytest.fixture(scope="function")
 def test_engine():
     """Create a test database engine."""
-    engine = create_engine(
-        TEST_DATABASE_URL, connect_args={"check_same_thread": False}
-    )
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
@@ -175,6 +182,19 @@ async def sample_client_in_db(
     return client
 
 
+# Lambda fixtures
+@pytest.fixture
+def lambda_event():
+    """Factory for synthetic API Gateway proxy events."""
+    return api_gateway_event
+
+
+@pytest.fixture
+def lambda_context() -> LambdaContext:
+    """Minimal Lambda context object."""
+    return LambdaContext()
+
+
 # Mock fixtures
 @pytest.fixture
 def mock_mailgun_service(monkeypatch):
@@ -204,4 +224,3 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "unit: mark test as a unit test")
     config.addinivalue_line("markers", "integration: mark test as an integration test")
     config.addinivalue_line("markers", "asyncio: mark test as async")
-
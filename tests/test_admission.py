@@ -0,0 +1,202 @@
+"""
+Test cases for adaptive admission control.
+
+This module tests the AIMD concurrency limiter and the middleware that
+sheds requests above its limit.
+"""
+
+import asyncio
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.admission import AIMDLimiter, admission_rejected_total
+from app.main import create_app
+from app.middleware.admission import AdmissionControlMiddleware
+
+
+class TestAIMDLimiter:
+    """Test suite for AIMDLimiter."""
+
+    def test_rejects_above_limit(self):
+        """Test that requests over the limit are not admitted."""
+        limiter = AIMDLimiter(initial_limit=2)
+
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+        assert limiter.in_flight == 2
+
+    def test_fast_responses_grow_the_limit(self):
+        """Test the additive increase while the limit is in use."""
+        limiter = AIMDLimiter(initial_limit=4, latency_target=1.0)
+
+        for _ in range(20):
+            for _ in range(4):
+                limiter.try_acquire()
+            for _ in range(4):
+                limiter.release(0.01)
+
+        assert limiter.limit > 4
+        assert limiter.in_flight == 0
+
+    def test_idle_limit_does_not_grow(self):
+        """Test that a mostly unused limit stays where it is."""
+        limiter = AIMDLimiter(initial_limit=10, latency_target=1.0)
+
+        for _ in range(100):
+            limiter.try_acquire()
+            limiter.release(0.01)
+
+        assert limiter.limit == 10
+
+    def test_slow_responses_shrink_the_limit_once_per_window(self):
+        """Test the multiplicative decrease and its cooldown."""
+        limiter = AIMDLimiter(initial_limit=20, latency_target=0.05, backoff=0.5)
+
+        for _ in range(5):
+            limiter.try_acquire()
+            limiter.release(1.0)
+
+        assert limiter.limit == 10
+
+    def test_overload_status_shrinks_to_minimum(self, monkeypatch):
+        """Test that overload signals back off down to the floor."""
+        limiter = AIMDLimiter(initial_limit=8, min_limit=2, backoff=0.5)
+        clock = iter(range(0, 1000, 10))
+        monkeypatch.setattr("app.core.admission.time.monotonic", lambda: next(clock))
+
+        for _ in range(10):
+            limiter.try_acquire()
+            limiter.release(0.01, overloaded=True)
+
+        assert limiter.limit == 2
+
+
+class TestAdmissionControlMiddleware:
+    """Test suite for AdmissionControlMiddleware."""
+
+    def make_client(self, limiter: AIMDLimiter) -> TestClient:
+        """Build a client for a small app with guarded and free routes."""
+
+        async def guarded(request):
+            return PlainTextResponse(str(limiter.in_flight))
+
+        async def overloaded(request):
+            return JSONResponse({"success": False}, status_code=504)
+
+        app = Starlette(
+            routes=[
+                Route("/contact/", guarded),
+                Route("/slow/down", overloaded),
+                Route("/free", guarded),
+            ]
+        )
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            paths=["/contact/", "/slow/*"],
+            limiter=limiter,
+            retry_after=2,
+        )
+        return TestClient(app)
+
+    def test_guarded_requests_are_counted(self):
+        """Test that guarded requests hold a slot while they run."""
+        limiter = AIMDLimiter(initial_limit=5)
+        client = self.make_client(limiter)
+
+        assert client.get("/contact/").text == "1"
+        assert client.get("/free").text == "0"
+        assert limiter.in_flight == 0
+
+    def test_requests_over_limit_get_503(self):
+        """Test that excess requests are rejected with Retry-After."""
+        limiter = AIMDLimiter(initial_limit=1)
+        limiter.try_acquire()
+        before = admission_rejected_total.collect().get((), 0.0)
+
+        response = self.make_client(limiter).get("/contact/")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "2"
+        assert admission_rejected_total.collect()[()] == before + 1
+
+    def test_unguarded_paths_are_never_shed(self):
+        """Test that other routes ignore the limit."""
+        limiter = AIMDLimiter(initial_limit=1)
+        limiter.try_acquire()
+
+        assert self.make_client(limiter).get("/free").status_code == 200
+
+    def test_preflights_are_never_shed(self):
+        """Test that OPTIONS requests neither wait for nor take a slot."""
+        limiter = AIMDLimiter(initial_limit=1)
+        limiter.try_acquire()
+
+        response = self.make_client(limiter).options("/contact/")
+
+        assert response.status_code != 503
+        assert limiter.in_flight == 1
+
+    def test_shed_requests_carry_cors_headers(self, monkeypatch):
+        """Test that a cross-origin browser can read the 503 and retry."""
+        limiter = AIMDLimiter(initial_limit=1)
+        limiter.try_acquire()
+        monkeypatch.setattr("app.middleware.admission.default_limiter", limiter)
+        client = TestClient(create_app())
+        origin = {"Origin": "https://zititex.example"}
+
+        shed = client.post("/api/v1/contact/", json={}, headers=origin)
+        preflight = client.options(
+            "/api/v1/contact/",
+            headers={**origin, "Access-Control-Request-Method": "POST"},
+        )
+
+        assert shed.status_code == 503
+        assert shed.headers["access-control-allow-origin"]
+        assert shed.headers["retry-after"] == "1"
+        assert preflight.status_code == 200
+        assert limiter.in_flight == 1
+
+    def test_gateway_timeout_backs_off(self):
+        """Test that a 504 from the app counts as overload."""
+        limiter = AIMDLimiter(initial_limit=10, backoff=0.5)
+
+        self.make_client(limiter).get("/slow/down")
+
+        assert limiter.limit == 5
+
+    async def test_concurrent_burst_is_partly_shed(self):
+        """Test that a burst above the limit is shed instead of queued."""
+        limiter = AIMDLimiter(initial_limit=3)
+        release = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        middleware = AdmissionControlMiddleware(
+            app, paths=["/contact/"], limiter=limiter
+        )
+        statuses = []
+
+        async def call():
+            async def receive():
+                return {"type": "http.request", "body": b""}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            scope = {"type": "http", "path": "/contact/", "method": "POST"}
+            await middleware(scope, receive, send)
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert sorted(statuses) == [200, 200, 200, 503, 503]
@@ -0,0 +1,208 @@
+"""
+Test cases for the client back office API.
+
+This module tests authentication, listing with sparse fieldsets and
+conditional requests, and the detail, update and delete routes.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.core.responses import body_etag, etag_matches, make_etag
+from app.main import create_app
+from app.models.client import Client
+
+API_KEY = "back-office-key"
+AUTH = {"Authorization": f"Bearer {API_KEY}"}
+
+
+@pytest.fixture
+async def api(monkeypatch, async_test_db: AsyncSession):
+    """Create an app with the clients API enabled on the test database."""
+    monkeypatch.setattr(settings, "admin_api_key", API_KEY)
+    app = create_app()
+
+    async def override_get_async_db():
+        yield async_test_db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def stored_clients(async_test_db: AsyncSession) -> list:
+    """Store three clients created a minute apart."""
+    created = datetime(2024, 1, 15, 10, 0)
+    clients = [
+        Client(
+            full_name=f"Cliente {i}",
+            email=f"cliente{i}@example.com",
+            phone="+52 123 456 7890",
+            message=f"Mensaje {i}",
+            created_at=created + timedelta(minutes=i),
+            updated_at=created + timedelta(minutes=i),
+        )
+        for i in range(3)
+    ]
+    async_test_db.add_all(clients)
+    await async_test_db.commit()
+    return clients
+
+
+class TestETag:
+    """Test suite for the entity tag helpers."""
+
+    def test_matching(self):
+        """Test weak comparison, lists and the wildcard."""
+        etag = make_etag(1, "a")
+
+        assert etag.startswith('W/"')
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches(make_etag(2, "a"), etag)
+
+
+class TestAuthentication:
+    """Test suite for the API key check."""
+
+    async def test_requires_bearer_token(self, api: AsyncClient):
+        """Test that missing and wrong keys are rejected."""
+        missing = await api.get("/api/v1/clients/")
+        wrong = await api.get(
+            "/api/v1/clients/", headers={"Authorization": "Bearer guess"}
+        )
+
+        assert missing.status_code == 401
+        assert wrong.status_code == 401
+        assert wrong.headers["www-authenticate"] == "Bearer"
+
+    def test_not_registered_without_key(self):
+        """Test that the routes do not exist unless a key is configured."""
+        app = create_app()
+
+        assert not any(
+            getattr(route, "path", "").startswith("/api/v1/clients")
+            for route in app.routes
+        )
+
+
+class TestListClients:
+    """Test suite for GET /api/v1/clients/."""
+
+    async def test_lists_newest_first_without_message(
+        self, api: AsyncClient, stored_clients: list
+    ):
+        """Test the default listing and its pagination fields."""
+        response = await api.get("/api/v1/clients/?limit=2", headers=AUTH)
+
+        assert response.status_code == 200
+        page = response.json()
+        assert page["total"] == 3
+        assert (page["skip"], page["limit"]) == (0, 2)
+        assert [item["full_name"] for item in page["items"]] == [
+            "Cliente 2",
+            "Cliente 1",
+        ]
+        assert "message" not in page["items"][0]
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    async def test_sparse_fieldset(self, api: AsyncClient, stored_clients: list):
+        """Test that only the requested fields and the id are returned."""
+        response = await api.get("/api/v1/clients/?fields=email,message", headers=AUTH)
+
+        assert response.status_code == 200
+        assert set(response.json()["items"][0]) == {"id", "email", "message"}
+
+    async def test_unknown_field(self, api: AsyncClient):
+        """Test that unknown fields are rejected."""
+        response = await api.get("/api/v1/clients/?fields=password", headers=AUTH)
+
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+
+    async def test_not_modified_until_page_changes(
+        self, api: AsyncClient, stored_clients: list
+    ):
+        """Test conditional requests before and after an update."""
+        first = await api.get("/api/v1/clients/", headers=AUTH)
+        etag = first.headers["etag"]
+        assert etag == body_etag(first.content)
+
+        cached = await api.get(
+            "/api/v1/clients/", headers={**AUTH, "If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        await api.patch(
+            f"/api/v1/clients/{stored_clients[0].id}",
+            json={"company": "Nueva S.A."},
+            headers=AUTH,
+        )
+        changed = await api.get(
+            "/api/v1/clients/", headers={**AUTH, "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+
+class TestClientDetail:
+    """Test suite for the single client routes."""
+
+    async def test_get_with_etag(self, api: AsyncClient, stored_clients: list):
+        """Test the detail route and its conditional request."""
+        url = f"/api/v1/clients/{stored_clients[1].id}"
+
+        response = await api.get(url, headers=AUTH)
+        cached = await api.get(
+            url, headers={**AUTH, "If-None-Match": response.headers["etag"]}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Mensaje 1"
+        assert cached.status_code == 304
+
+    async def test_get_not_found(self, api: AsyncClient):
+        """Test that a missing client is a 404."""
+        response = await api.get("/api/v1/clients/99999", headers=AUTH)
+
+        assert response.status_code == 404
+
+    async def test_update(self, api: AsyncClient, stored_clients: list):
+        """Test a partial update."""
+        response = await api.patch(
+            f"/api/v1/clients/{stored_clients[0].id}",
+            json={"company": "Nueva S.A."},
+            headers=AUTH,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["company"] == "Nueva S.A."
+        assert response.json()["full_name"] == "Cliente 0"
+
+    async def test_update_validates_email(self, api: AsyncClient, stored_clients: list):
+        """Test that updates are validated."""
+        response = await api.patch(
+            f"/api/v1/clients/{stored_clients[0].id}",
+            json={"email": "not-an-email"},
+            headers=AUTH,
+        )
+
+        assert response.status_code == 422
+
+    async def test_delete(self, api: AsyncClient, stored_clients: list):
+        """Test deleting a client, then deleting it again."""
+        url = f"/api/v1/clients/{stored_clients[0].id}"
+
+        assert (await api.delete(url, headers=AUTH)).status_code == 204
+        assert (await api.delete(url, headers=AUTH)).status_code == 404
+        assert (await api.get(url, headers=AUTH)).status_code == 404
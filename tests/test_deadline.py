@@ -0,0 +1,182 @@
+"""
+Test cases for request deadlines.
+
+This module tests the deadline context variable, the timeout middleware
+and how the repository and Mailgun service bound their calls by it.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core import deadline
+from app.core.config import settings
+from app.core.deadline import (
+    DeadlineExceeded,
+    bounded_timeout,
+    check_deadline,
+    remaining,
+    set_deadline,
+)
+from app.middleware.timeout import TimeoutMiddleware
+from app.models.client import Client
+from app.repositories.client_repository import ClientRepository, _bounded
+from app.services.mailgun import MailgunService
+
+
+@pytest.fixture
+def request_deadline():
+    """Set a deadline for the duration of a test."""
+    yield set_deadline
+    # Async tests run in a copied context, so clear rather than reset
+    deadline._deadline.set(None)
+
+
+class TestDeadline:
+    """Test suite for the deadline context variable."""
+
+    def test_no_deadline_by_default(self):
+        """Test that code outside a request is not bounded."""
+        assert remaining() is None
+        assert check_deadline() is None
+        assert bounded_timeout(10.0) == 10.0
+
+    def test_timeout_is_capped_by_deadline(self, request_deadline):
+        """Test that the time left caps longer timeouts."""
+        request_deadline(2.0)
+
+        assert 1.9 < bounded_timeout(10.0) <= 2.0
+        assert bounded_timeout(0.5) == 0.5
+
+    def test_too_little_time_left_raises(self, request_deadline):
+        """Test that operations are not started without enough time."""
+        request_deadline(0.01)
+
+        with pytest.raises(DeadlineExceeded):
+            bounded_timeout(10.0)
+
+    async def test_deadline_reaches_threads(self, request_deadline):
+        """Test that blocking calls run in threads see the deadline."""
+        request_deadline(5.0)
+
+        left = await asyncio.to_thread(remaining)
+
+        assert left is not None and 4.0 < left <= 5.0
+
+
+class TestTimeoutMiddleware:
+    """Test suite for TimeoutMiddleware."""
+
+    def make_client(self, timeout: float) -> TestClient:
+        """Build a client for a small app wrapped in the middleware."""
+
+        async def fast(request):
+            return PlainTextResponse(f"{remaining():.3f}")
+
+        async def slow(request):
+            await asyncio.sleep(5)
+            return PlainTextResponse("too late")
+
+        async def exhausted(request):
+            raise DeadlineExceeded("0ms left before deadline")
+
+        app = Starlette(
+            routes=[
+                Route("/fast", fast),
+                Route("/slow", slow),
+                Route("/exhausted", exhausted),
+            ]
+        )
+        app.add_middleware(TimeoutMiddleware, timeout=timeout)
+        return TestClient(app)
+
+    def test_request_sees_deadline(self):
+        """Test that the route can read the time left."""
+        response = self.make_client(timeout=3.0).get("/fast")
+
+        assert 2.5 < float(response.text) <= 3.0
+        assert remaining() is None
+
+    def test_slow_request_gets_504(self):
+        """Test that a request running past the deadline is cancelled."""
+        response = self.make_client(timeout=0.1).get("/slow")
+
+        assert response.status_code == 504
+        assert response.json() == {"success": False, "message": "Request timed out"}
+
+    def test_deadline_exceeded_gets_503(self):
+        """Test that failing fast on the deadline is reported as retryable."""
+        response = self.make_client(timeout=3.0).get("/exhausted")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+
+    def test_lambda_remaining_time_caps_budget(self, lambda_context):
+        """Test that the deadline ends before the Lambda invocation does."""
+        middleware = TimeoutMiddleware(MagicMock(), timeout=10.0, lambda_margin=0.5)
+        lambda_context.get_remaining_time_in_millis = lambda: 3000
+
+        assert middleware.budget({"aws.context": lambda_context}) == 2.5
+        assert middleware.budget({}) == 10.0
+
+
+class TestDeadlinePropagation:
+    """Test suite for deadline-bounded database and email calls."""
+
+    def test_select_gets_max_execution_time(self, request_deadline):
+        """Test that MySQL queries carry the time left, in 100ms steps."""
+        request_deadline(2.345)
+
+        sql = str(_bounded(select(Client)).compile(dialect=mysql.dialect()))
+
+        assert sql.startswith("SELECT /*+ MAX_EXECUTION_TIME(2300) */ ")
+
+    def test_select_without_deadline_is_unchanged(self):
+        """Test that queries outside a request carry no hint."""
+        sql = str(_bounded(select(Client)).compile(dialect=mysql.dialect()))
+
+        assert "MAX_EXECUTION_TIME" not in sql
+
+    async def test_repository_fails_fast(self, async_test_db, request_deadline):
+        """Test that no query is started once the deadline has passed."""
+        request_deadline(0)
+        repo = ClientRepository(async_test_db)
+
+        with pytest.raises(DeadlineExceeded):
+            await repo.get_by_email_async("juan@example.com")
+
+    @patch("app.services.mailgun.requests.Session.post")
+    def test_mailgun_timeout_follows_deadline(self, mock_post, request_deadline):
+        """Test that the HTTP timeout is capped by the time left."""
+        service = MailgunService()
+        service.api_key, service.domain = "key", "test.mailgun.org"
+        request_deadline(1.0)
+
+        service.send_email(to_emails=["a@example.com"], subject="Hi", text="x")
+
+        assert settings.mailgun_timeout > 1.0
+        assert 0.5 < mock_post.call_args.kwargs["timeout"] <= 1.0
+
+    @patch("app.services.mailgun.requests.Session.post")
+    def test_contact_email_propagates_deadline(self, mock_post, request_deadline):
+        """Test that the admin notification is not attempted without time."""
+        service = MailgunService()
+        service.api_key, service.domain = "key", "test.mailgun.org"
+        request_deadline(0)
+
+        with pytest.raises(DeadlineExceeded):
+            service.send_contact_form_email(
+                full_name="Juan",
+                email="juan@example.com",
+                phone="+52 123",
+                message="Hola",
+                admin_email="admin@example.com",
+            )
+        mock_post.assert_not_called()
@@ -0,0 +1,91 @@
+"""
+Test cases for Lambda keep-warm pings.
+
+This module tests keep-warm event detection, the handler short-circuit
+and concurrent fan-out to other containers.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from app import main
+from app.core import keepwarm
+from app.core.config import settings
+from app.core.keepwarm import handle_keep_warm, is_keep_warm_event
+
+
+class TestKeepWarmEvents:
+    """Test suite for keep-warm event detection."""
+
+    def test_warmer_input_is_detected(self):
+        """Test that the scheduled rule's input is recognized."""
+        assert is_keep_warm_event({"warmer": True, "concurrency": 3}) is True
+
+    def test_scheduled_event_is_detected(self):
+        """Test that bare EventBridge scheduled events are recognized."""
+        event = {"source": "aws.events", "detail-type": "Scheduled Event"}
+
+        assert is_keep_warm_event(event) is True
+
+    def test_api_gateway_event_is_not_detected(self, lambda_event):
+        """Test that HTTP events are passed on to the app."""
+        assert is_keep_warm_event(lambda_event("/health")) is False
+        assert is_keep_warm_event({"warmer": "yes"}) is False
+        assert is_keep_warm_event(None) is False
+
+
+class TestKeepWarmHandler:
+    """Test suite for keep-warm handling."""
+
+    def test_handler_short_circuits_before_mangum(self, monkeypatch, lambda_context):
+        """Test that pings never reach Mangum or FastAPI."""
+        monkeypatch.setattr(main, "_mangum", None)
+
+        with patch("mangum.Mangum") as mangum:
+            response = main.handler({"warmer": True}, lambda_context)
+
+        assert response["warmed"] is True
+        assert response["invoked"] == 0
+        mangum.assert_not_called()
+        assert main._mangum is None
+
+    def test_fan_out_invokes_other_containers(self, monkeypatch, lambda_context):
+        """Test that a ping with concurrency N invokes the function N-1 times."""
+        client = MagicMock()
+        monkeypatch.setattr(keepwarm, "_lambda_client", lambda: client)
+
+        response = handle_keep_warm({"warmer": True, "concurrency": 3}, lambda_context)
+
+        assert response["invoked"] == 2
+        assert client.invoke.call_count == 2
+        kwargs = client.invoke.call_args.kwargs
+        assert kwargs["FunctionName"] == lambda_context.invoked_function_arn
+        assert kwargs["InvocationType"] == "RequestResponse"
+        assert json.loads(kwargs["Payload"]) == {"warmer": True, "fanned_out": True}
+
+    def test_fan_out_is_capped_and_tolerates_failures(
+        self, monkeypatch, lambda_context
+    ):
+        """Test the concurrency cap and that failed invocations are counted out."""
+        client = MagicMock()
+        client.invoke.side_effect = [None, RuntimeError("throttled")] + [None] * 10
+        monkeypatch.setattr(keepwarm, "_lambda_client", lambda: client)
+        monkeypatch.setattr(settings, "keep_warm_max_concurrency", 3)
+
+        response = handle_keep_warm({"warmer": True, "concurrency": 50}, lambda_context)
+
+        assert client.invoke.call_count == 2
+        assert response["invoked"] == 1
+
+    def test_fanned_out_ping_does_not_fan_out_again(self, monkeypatch, lambda_context):
+        """Test that receivers of a fan-out only stay busy briefly."""
+        client = MagicMock()
+        monkeypatch.setattr(keepwarm, "_lambda_client", lambda: client)
+        monkeypatch.setattr(settings, "keep_warm_delay_ms", 0)
+
+        response = handle_keep_warm(
+            {"warmer": True, "fanned_out": True, "concurrency": 5}, lambda_context
+        )
+
+        assert response["invoked"] == 0
+        client.invoke.assert_not_called()
@@ -0,0 +1,167 @@
+"""
+Test cases for graceful shutdown.
+
+This module tests in-flight request tracking, draining with a deadline,
+the draining middleware and the resource disposal sequence.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core import database
+from app.core import lifecycle as lifecycle_module
+from app.core.lifecycle import Lifecycle, shutdown
+from app.middleware.drain import DrainMiddleware
+
+
+@pytest.fixture
+def fresh_lifecycle(monkeypatch):
+    """Replace the global lifecycle with a fresh one."""
+    instance = Lifecycle()
+    monkeypatch.setattr(lifecycle_module, "lifecycle", instance)
+    return instance
+
+
+class TestDrain:
+    """Test suite for Lifecycle.drain."""
+
+    async def test_waits_for_in_flight_requests(self):
+        """Test that draining waits for running requests to finish."""
+        lifecycle = Lifecycle()
+        lifecycle.request_started()
+
+        async def finish_later():
+            await asyncio.sleep(0.1)
+            lifecycle.request_finished()
+
+        finisher = asyncio.create_task(finish_later())
+        report = await lifecycle.drain(timeout=2)
+        await finisher
+
+        assert lifecycle.accepting is False
+        assert report.dropped_requests == 0
+        assert report.clean is True
+
+    async def test_reports_requests_past_the_deadline(self):
+        """Test that requests still running at the deadline are reported."""
+        lifecycle = Lifecycle()
+        lifecycle.request_started()
+
+        report = await lifecycle.drain(timeout=0.1)
+
+        assert report.dropped_requests == 1
+        assert report.clean is False
+
+    async def test_background_tasks_finish_or_are_cancelled(self):
+        """Test that quick tasks complete and slow ones are cancelled by name."""
+        lifecycle = Lifecycle()
+        done = []
+
+        async def quick():
+            await asyncio.sleep(0.01)
+            done.append("quick")
+
+        slow = lifecycle.spawn(asyncio.sleep(10), name="slow-notification")
+        lifecycle.spawn(quick(), name="quick")
+
+        report = await lifecycle.drain(timeout=0.2)
+
+        assert done == ["quick"]
+        assert slow.cancelled()
+        assert report.cancelled_tasks == ["slow-notification"]
+        assert lifecycle.background_tasks == 0
+
+
+class TestDrainMiddleware:
+    """Test suite for DrainMiddleware."""
+
+    def make_client(self, lifecycle: Lifecycle) -> TestClient:
+        """Build a client for a small app wrapped in the middleware."""
+
+        async def seen(request):
+            return PlainTextResponse(str(lifecycle.in_flight))
+
+        app = Starlette(routes=[Route("/", seen)])
+        app.add_middleware(DrainMiddleware, lifecycle=lifecycle)
+        return TestClient(app)
+
+    def test_counts_in_flight_requests(self):
+        """Test that a request is counted while it runs."""
+        lifecycle = Lifecycle()
+        response = self.make_client(lifecycle).get("/")
+
+        assert response.text == "1"
+        assert lifecycle.in_flight == 0
+
+    def test_rejects_requests_while_draining(self):
+        """Test that new requests get a 503 that closes the connection."""
+        lifecycle = Lifecycle()
+        lifecycle.accepting = False
+
+        response = self.make_client(lifecycle).get("/")
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert response.headers["connection"] == "close"
+        assert response.json()["success"] is False
+        assert lifecycle.in_flight == 0
+
+
+class TestShutdown:
+    """Test suite for the shutdown sequence."""
+
+    async def test_disposes_resources_after_draining(self, fresh_lifecycle):
+        """Test that pools and sessions are closed once requests drained."""
+        order = []
+        fresh_lifecycle.request_started()
+
+        async def finish_later():
+            await asyncio.sleep(0.05)
+            order.append("request")
+            fresh_lifecycle.request_finished()
+
+        async def dispose():
+            order.append("database")
+
+        mailgun = MagicMock()
+        mailgun.close.side_effect = lambda: order.append("mailgun")
+        finisher = asyncio.create_task(finish_later())
+        with patch.object(database, "dispose_engines", dispose), patch(
+            "app.services.mailgun.mailgun_service", mailgun
+        ):
+            report = await shutdown(timeout=2)
+        await finisher
+
+        assert order == ["request", "database", "mailgun"]
+        assert report.closed == ["metrics", "tracing", "database", "mailgun"]
+        assert report.clean is True
+
+    async def test_failing_step_does_not_stop_the_rest(self, fresh_lifecycle):
+        """Test that a failing disposal is reported and later steps still run."""
+        mailgun = MagicMock()
+        dispose = AsyncMock(side_effect=RuntimeError("pool busy"))
+        with patch.object(database, "dispose_engines", dispose), patch(
+            "app.services.mailgun.mailgun_service", mailgun
+        ):
+            report = await shutdown(timeout=1)
+
+        assert report.errors == {"database": "pool busy"}
+        assert "mailgun" in report.closed
+        mailgun.close.assert_called_once()
+
+    async def test_dispose_engines_only_touches_created_engines(self, monkeypatch):
+        """Test that engines that were never created are not created to dispose."""
+        monkeypatch.delitem(vars(database), "engine", raising=False)
+        async_engine = MagicMock(dispose=AsyncMock())
+        monkeypatch.setitem(vars(database), "async_engine", async_engine)
+
+        await database.dispose_engines()
+
+        async_engine.dispose.assert_awaited_once()
+        assert "engine" not in vars(database)
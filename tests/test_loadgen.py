@@ -0,0 +1,213 @@
+"""
+Test cases for the load generator.
+
+This module tests the traffic profiles, latency histogram, payload
+generation, the analysis of load runs and an end to end run against a
+small ASGI app and the fake Mailgun server.
+"""
+
+import asyncio
+import json
+import random
+import threading
+
+import pytest
+import requests
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.schemas.client import ContactForm
+from benchmarks.fake_mailgun import make_server
+from benchmarks.loadgen import (
+    ContactPayloads,
+    LatencyHistogram,
+    Outcome,
+    TrafficProfile,
+    analyze,
+    asgi_sender,
+    drive,
+)
+
+
+class TestTrafficProfile:
+    """Test suite for TrafficProfile."""
+
+    def test_constant_rate(self):
+        """Test that a constant profile sends rate times duration requests."""
+        profile = TrafficProfile(rate=100, duration=2)
+
+        arrivals = list(profile.arrivals(random.Random(1)))
+
+        assert len(arrivals) == 199
+        assert arrivals[0] == pytest.approx(0.01)
+
+    def test_ramp_rate(self):
+        """Test that a ramp moves linearly between its rates."""
+        profile = TrafficProfile(kind="ramp", rate=10, end_rate=110, duration=10)
+
+        assert profile.rate_at(0) == 10
+        assert profile.rate_at(5) == 60
+        assert profile.rate_at(20) == 110
+        assert len(list(profile.arrivals(random.Random(1)))) == pytest.approx(
+            600, rel=0.02
+        )
+
+    def test_burst_rate(self):
+        """Test that bursts repeat at their period."""
+        profile = TrafficProfile(
+            kind="burst", rate=10, burst_rate=100, burst_every=5, burst_length=1
+        )
+
+        assert [profile.rate_at(t) for t in (0.5, 1.5, 5.2, 9.9)] == [
+            100,
+            10,
+            100,
+            10,
+        ]
+
+    def test_poisson_arrivals_keep_the_mean_rate(self):
+        """Test that random arrivals average out to the rate."""
+        profile = TrafficProfile(rate=200, duration=50, poisson=True)
+
+        arrivals = list(profile.arrivals(random.Random(7)))
+
+        assert len(arrivals) == pytest.approx(10_000, rel=0.05)
+        assert arrivals == sorted(arrivals)
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles_within_precision(self):
+        """Test that percentiles are exact to the bucket precision."""
+        histogram = LatencyHistogram(precision=0.01)
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.01)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.01)
+        assert histogram.percentile(100) == 1.0
+        assert histogram.summary()["p99_9_ms"] == pytest.approx(999, rel=0.01)
+
+    def test_empty(self):
+        """Test that an empty histogram reports zero."""
+        assert LatencyHistogram().percentile(99) == 0.0
+
+
+class TestContactPayloads:
+    """Test suite for ContactPayloads."""
+
+    def test_payloads_are_valid_and_varied(self):
+        """Test that every generated body passes ContactForm validation."""
+        payloads = ContactPayloads(seed=3)
+
+        bodies = [payloads() for _ in range(200)]
+
+        forms = [ContactForm.model_validate_json(body) for body in bodies]
+        assert len({form.email for form in forms}) == 200
+        assert any(form.company is None for form in forms)
+        assert any(form.company is not None for form in forms)
+
+    def test_seed_repeats_the_sequence(self):
+        """Test that the same seed generates the same bodies."""
+        assert ContactPayloads(5)() == ContactPayloads(5)()
+
+
+class TestAnalyze:
+    """Test suite for analyze."""
+
+    def test_latency_counts_from_the_intended_time(self):
+        """Test that a delayed send is charged to the request's latency."""
+        profile = TrafficProfile(rate=1, duration=1)
+        outcome = Outcome(intended=0.0, started=0.5, finished=0.6, status=200)
+
+        report = analyze([outcome], profile)
+
+        assert report["latency"]["max_ms"] == pytest.approx(600)
+        assert report["service_time"]["max_ms"] == pytest.approx(100, rel=0.01)
+
+    def test_saturation_point(self):
+        """Test that the first window falling behind is reported."""
+        profile = TrafficProfile(kind="ramp", rate=10, end_rate=40, duration=3)
+        outcomes = []
+        for second, rate, latency in ((0, 10, 0.01), (1, 20, 0.02), (2, 30, 2.0)):
+            for i in range(rate):
+                intended = second + i / rate
+                outcomes.append(Outcome(intended, intended, intended + latency, 200))
+        outcomes[-1].status = 0
+        outcomes[-1].error = "Timeout"
+
+        report = analyze(outcomes, profile, slo=0.5)
+
+        assert report["requests"] == 60
+        assert report["statuses"] == {"200": 59, "Timeout": 1}
+        assert report["saturation"]["start_s"] == 2
+        assert report["saturation"]["reasons"] == ["latency", "errors"]
+        assert [w["offered_rps"] for w in report["windows"]] == [10, 20, 30]
+
+    def test_no_saturation(self):
+        """Test that a target keeping up has no saturation point."""
+        profile = TrafficProfile(rate=10, duration=1)
+        outcomes = [Outcome(i / 10, i / 10, i / 10 + 0.01, 201) for i in range(10)]
+
+        assert analyze(outcomes, profile)["saturation"] is None
+
+
+class TestDrive:
+    """Test suite for driving a target."""
+
+    async def test_open_loop_against_asgi_app(self):
+        """Test that requests are not held back by slow responses."""
+
+        async def contact(request):
+            await request.body()
+            await asyncio.sleep(0.05)
+            return JSONResponse({"success": True})
+
+        app = Starlette(routes=[Route("/contact", contact, methods=["POST"])])
+        profile = TrafficProfile(rate=200, duration=0.25)
+
+        outcomes = await drive(asgi_sender(app, "/contact"), profile, ContactPayloads())
+
+        assert len(outcomes) == 49
+        assert all(outcome.ok for outcome in outcomes)
+        # Closed-loop sending would need 49 * 50ms; open loop overlaps them
+        assert max(outcome.finished for outcome in outcomes) < 1.0
+
+    async def test_timeouts_are_errors(self):
+        """Test that requests beyond the timeout are counted as failed."""
+
+        async def slow(body: bytes) -> int:
+            await asyncio.sleep(1)
+            return 200
+
+        outcomes = await drive(
+            slow, TrafficProfile(rate=20, duration=0.1), ContactPayloads(), timeout=0.01
+        )
+
+        assert {outcome.error for outcome in outcomes} == {"Timeout"}
+
+
+class TestFakeMailgun:
+    """Test suite for the fake Mailgun server."""
+
+    def test_accepts_messages(self):
+        """Test that posted messages are queued like Mailgun answers."""
+        server = make_server(("127.0.0.1", 0))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host, port = server.server_address
+            response = requests.post(
+                f"http://{host}:{port}/mailgun.test/messages",
+                data={"to": "admin@example.com"},
+                timeout=5,
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 200
+        assert json.loads(response.content)["message"] == "Queued. Thank you."
@@ -0,0 +1,179 @@
+"""
+Test cases for structured logging.
+
+This module tests JSON formatting, PII redaction, sampling and the
+queue-based handler/listener setup.
+"""
+
+import io
+import json
+import logging
+import sys
+
+from app.core import logger as logger_module
+from app.core.logger import (
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RedactingFilter,
+    SamplingFilter,
+    get_logger,
+    mask_email,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(msg: str = "hello", level: int = logging.INFO, **extra):
+    """Build a log record with extra attributes."""
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestRedaction:
+    """Test suite for PII redaction."""
+
+    def test_mask_email(self):
+        """Test that email local parts are masked."""
+        assert mask_email("contact juan.perez@example.com now") == (
+            "contact j***@example.com now"
+        )
+
+    def test_redacts_configured_fields(self):
+        """Test that configured extra fields are redacted."""
+        record = make_record(
+            email="juan@example.com", phone="+52 123", product_type="Textiles"
+        )
+
+        RedactingFilter(["email", "phone"]).filter(record)
+
+        assert record.email == "j***@example.com"
+        assert record.phone == "[REDACTED]"
+        assert record.product_type == "Textiles"
+
+    def test_redacts_nested_fields(self):
+        """Test that redaction recurses into dictionaries."""
+        record = make_record(contact={"full_name": "Juan", "quantity": "10"})
+
+        RedactingFilter(["full_name"]).filter(record)
+
+        assert record.contact == {"full_name": "[REDACTED]", "quantity": "10"}
+
+    def test_masks_emails_in_message(self):
+        """Test that emails in the message text are masked."""
+        record = make_record("Failed to send to maria@example.com")
+
+        RedactingFilter([]).filter(record)
+
+        assert record.msg == "Failed to send to m***@example.com"
+
+    def test_masks_emails_in_traceback(self):
+        """Test that emails quoted in exception messages are masked."""
+        handler = NonBlockingQueueHandler(None)
+        try:
+            raise ValueError("Duplicate entry 'juan@example.com' for key 'email'")
+        except ValueError:
+            record = make_record("Database error")
+            record.exc_info = sys.exc_info()
+        prepared = handler.prepare(record)
+
+        RedactingFilter([]).filter(prepared)
+        payload = json.loads(JsonFormatter().format(prepared))
+
+        assert "juan@example.com" not in payload["exception"]
+        assert "j***@example.com" in payload["exception"]
+
+    def test_masks_emails_in_unrendered_traceback(self):
+        """Test masking when the traceback was not rendered by the queue."""
+        try:
+            raise ValueError("Duplicate entry 'juan@example.com'")
+        except ValueError:
+            record = make_record("Database error")
+            record.exc_info = sys.exc_info()
+
+        RedactingFilter([]).filter(record)
+
+        assert "j***@example.com" in record.exc_text
+        assert "juan@example.com" not in JsonFormatter().format(record)
+
+
+class TestSampling:
+    """Test suite for log sampling."""
+
+    def test_unconfigured_levels_are_kept(self):
+        """Test that levels without a rate are always kept."""
+        sampler = SamplingFilter({"DEBUG": 0.0})
+
+        assert sampler.filter(make_record(level=logging.INFO)) is True
+        assert sampler.filter(make_record(level=logging.DEBUG)) is False
+
+    def test_per_record_rate_overrides_level(self):
+        """Test that a record-level sample rate takes precedence."""
+        sampler = SamplingFilter({"INFO": 1.0})
+
+        assert sampler.filter(make_record(sample_rate=0.0)) is False
+        assert sampler.filter(make_record(sample_rate=1.0)) is True
+
+
+class TestJsonFormatter:
+    """Test suite for the JSON formatter."""
+
+    def test_formats_json_with_extras(self):
+        """Test that records become JSON objects including extras."""
+        record = make_record("Contact form received", product_type="Textiles")
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["level"] == "INFO"
+        assert payload["logger"] == "app.test"
+        assert payload["message"] == "Contact form received"
+        assert payload["product_type"] == "Textiles"
+        assert payload["timestamp"].endswith("Z")
+
+    def test_queue_handler_renders_exceptions_early(self):
+        """Test that tracebacks are rendered before enqueueing."""
+        handler = NonBlockingQueueHandler(None)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("failed %s", args=None)
+            record.msg, record.args = "failed %s", ("badly",)
+            record.exc_info = sys.exc_info()
+
+        prepared = handler.prepare(record)
+
+        assert prepared.msg == "failed badly"
+        assert prepared.exc_info is None
+        assert "ValueError: boom" in prepared.exc_text
+
+
+class TestSetup:
+    """Test suite for logger setup and shutdown."""
+
+    def test_get_logger_namespaces_under_app(self):
+        """Test that loggers live under the app hierarchy."""
+        assert get_logger("app.api.v1.contact").name == "app.api.v1.contact"
+        assert get_logger("scripts").name == "app.scripts"
+
+    def test_setup_is_idempotent_and_flushes_on_shutdown(self):
+        """Test that records are written by the listener thread."""
+        shutdown_logging()
+        logger = setup_logging()
+        assert setup_logging() is logger
+        assert len(logger.handlers) == 1
+
+        stream = io.StringIO()
+        original = logger_module._output_handler.setStream(stream)
+        try:
+            get_logger("test").warning("queued", extra={"email": "ana@example.com"})
+            shutdown_logging()
+        finally:
+            logger_module._output_handler.setStream(original)
+            setup_logging()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert any(
+            line["message"] == "queued" and line["email"] == "a***@example.com"
+            for line in lines
+        )
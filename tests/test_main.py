@@ -5,10 +5,18 @@ This module tests FastAPI application initialization,
 middleware, exception handlers, and core endpoints.
 """
 
+import json
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app, create_app
+from app.main import app, create_app, handler
+
+# Modules that importing app.main must not load (see benchmarks.bench_cold_start)
+DEFERRED_MODULES = ("mangum", "pymysql", "aiomysql", "boto3", "jose", "passlib")
 
 
 class TestAppCreation:
@@ -28,13 +36,15 @@ class TestAppCreation:
         # Check that middleware is present in middleware_stack
         middleware_types = [str(type(m)) for m in test_app.user_middleware]
         has_cors = any("CORSMiddleware" in m_type for m_type in middleware_types)
-        
+
         # Also check in the middleware stack
-        if not has_cors and hasattr(test_app, 'middleware_stack'):
+        if not has_cors and hasattr(test_app, "middleware_stack"):
             stack_str = str(test_app.middleware_stack)
             has_cors = "CORSMiddleware" in stack_str
-        
-        assert has_cors, f"CORS middleware not found. User middleware: {middleware_types}"
+
+        assert (
+            has_cors
+        ), f"CORS middleware not found. User middleware: {middleware_types}"
 
 
 class TestHealthEndpoint:
@@ -102,13 +112,20 @@ class TestMiddleware:
 
     def test_no_cache_headers(self, client):
         """Test that no-cache headers are added."""
-        response = client.get("/health")
+        response = client.post("/api/v1/contact/", json={})
 
         assert "Cache-Control" in response.headers
         assert "no-cache" in response.headers["Cache-Control"]
         assert "Pragma" in response.headers
         assert "Expires" in response.headers
 
+    def test_cache_policy_for_static_endpoints(self, client):
+        """Test that static endpoints use their configured cache policy."""
+        response = client.get("/health")
+
+        assert response.headers["Cache-Control"] == "public, max-age=10"
+        assert "Pragma" not in response.headers
+
 
 class TestExceptionHandler:
     """Test suite for global exception handler."""
@@ -167,3 +184,37 @@ class TestAPIRoutes:
         assert "openapi" in data
         assert "info" in data
 
+
+class TestColdStart:
+    """Test suite for the Lambda import graph and handler."""
+
+    def test_import_defers_heavy_modules(self):
+        """Test that importing the app does not load unused heavy modules."""
+        code = (
+            "import json, sys; import app.main; "
+            f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]"
+            " + [app.main.app.openapi_schema is not None]))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == [False]
+
+    def test_engines_are_created_on_first_access(self):
+        """Test that the database engines are resolved lazily."""
+        from app.core import database
+
+        assert database.async_engine is database.async_engine
+        assert "async_engine" in vars(database)
+
+    def test_handler_serves_api_gateway_event(self, lambda_event, lambda_context):
+        """Test the Lambda handler with a synthetic API Gateway event."""
+        response = handler(lambda_event("/health"), lambda_context)
+
+        assert response["statusCode"] == 200
+        assert json.loads(response["body"])["status"] == "healthy"
@@ -0,0 +1,163 @@
+"""
+Test cases for the metrics registry and /metrics endpoint.
+
+This module tests counters, gauges and histograms, per-thread
+aggregation, multiprocess snapshot merging and request instrumentation.
+"""
+
+import json
+import os
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.metrics import MetricsRegistry, http_requests_total, observe_duration
+from app.main import app
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def test_counter_aggregates_threads(self):
+        """Test that counter shards from several threads are summed."""
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("kind",))
+
+        def work():
+            for _ in range(1000):
+                counter.inc(("email",))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.collect() == {("email",): 4000.0}
+
+    def test_gauge_inc_dec_set_and_function(self):
+        """Test gauge deltas, absolute values and callbacks."""
+        registry = MetricsRegistry()
+        in_flight = registry.gauge("in_flight", "In flight")
+        limit = registry.gauge("limit", "Limit")
+
+        in_flight.inc()
+        in_flight.inc()
+        in_flight.dec()
+        limit.set_function(lambda: 42)
+
+        assert in_flight.collect() == {(): 1.0}
+        assert limit.collect() == {(): 42.0}
+
+    def test_histogram_buckets(self):
+        """Test that observations land in the right buckets."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5.0)
+
+        counts = histogram.collect()[()]
+        assert counts[:3] == [1, 1, 1]
+        assert counts[-1] == 3
+        assert counts[-2] == pytest.approx(5.55)
+
+    def test_register_returns_existing_metric(self):
+        """Test that registering the same name twice returns one metric."""
+        registry = MetricsRegistry()
+
+        first = registry.counter("events_total", "Events")
+
+        assert registry.counter("events_total", "Events") is first
+        with pytest.raises(ValueError):
+            registry.gauge("events_total", "Events")
+
+    def test_render_prometheus_text(self):
+        """Test the Prometheus text exposition format."""
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests", ("route",)).inc(("/health",))
+        registry.histogram("latency_seconds", "Latency", buckets=(0.1,)).observe(0.05)
+
+        text = registry.render()
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/health"} 1.0' in text
+        assert 'latency_seconds_bucket{le="0.1"} 1.0' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 1.0' in text
+        assert "latency_seconds_count 1.0" in text
+
+    def test_multiprocess_merges_worker_snapshots(self, tmp_path):
+        """Test that snapshots of several workers are merged at scrape."""
+        registry = MetricsRegistry(multiprocess_dir=str(tmp_path))
+        counter = registry.counter("requests_total", "Requests")
+        counter.inc(amount=2)
+
+        other = MetricsRegistry().snapshot()
+        other["pid"] = os.getpid()
+        other["metrics"]["requests_total"] = {
+            "kind": "counter",
+            "help": "Requests",
+            "labelnames": [],
+            "values": [[[], 3.0]],
+        }
+        (tmp_path / "metrics_999999.json").write_text(json.dumps(other))
+
+        text = registry.render()
+
+        assert "requests_total 5.0" in text
+        assert (tmp_path / f"metrics_{os.getpid()}.json").exists()
+
+    async def test_observe_duration_uses_function_name(self):
+        """Test that the duration decorator labels by function name."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("calls", "Calls", ("method",))
+        timed = observe_duration(histogram)
+
+        @timed
+        async def fetch():
+            return "ok"
+
+        @timed
+        def store():
+            return "ok"
+
+        assert await fetch() == "ok"
+        assert store() == "ok"
+        assert set(histogram.collect()) == {("fetch",), ("store",)}
+
+
+class TestMetricsEndpoint:
+    """Test suite for request instrumentation and /metrics."""
+
+    @pytest.fixture
+    def client(self):
+        """Create test client."""
+        with TestClient(app) as c:
+            yield c
+
+    def test_metrics_endpoint_exposes_request_metrics(self, client):
+        """Test that requests are recorded by route template."""
+        client.get("/health")
+        client.get("/nonexistent-route")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_requests_total{method="GET",route="/health",status="200"}' in (
+            response.text
+        )
+        assert 'route="<unmatched>",status="404"' in response.text
+        assert "http_request_duration_seconds_bucket" in response.text
+        assert "http_requests_in_flight" in response.text
+
+    def test_route_label_is_template(self, client):
+        """Test that counters use the path template, not the raw path."""
+        client.get("/health")
+
+        labels = {key[1] for key in http_requests_total.collect()}
+
+        assert "/health" in labels
+        assert "/nonexistent-route" not in labels
@@ -0,0 +1,382 @@
+"""
+Test cases for ASGI middleware.
+
+This module tests the pure ASGI middleware in ``app.middleware`` against
+small Starlette and FastAPI applications.
+"""
+
+import asyncio
+import gzip
+import json
+import zlib
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middleware.body_limit import BodySizeLimitMiddleware, json_body_limit
+from app.middleware.cache import NO_CACHE_HEADERS, CacheControlMiddleware
+from app.middleware.compression import CompressionMiddleware, parse_accept_encoding
+from app.schemas.client import ContactForm
+
+
+def make_app() -> Starlette:
+    """Build a small app with plain, streaming and self-caching routes."""
+
+    async def plain(request):
+        return PlainTextResponse("ok")
+
+    async def stream(request):
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def own_policy(request):
+        return PlainTextResponse("ok", headers={"Cache-Control": "private"})
+
+    async def unavailable(request):
+        return JSONResponse({"status": "unhealthy"}, status_code=503)
+
+    return Starlette(
+        routes=[
+            Route("/", plain),
+            Route("/static/logo", plain),
+            Route("/stream", stream),
+            Route("/own", own_policy),
+            Route("/static/down", unavailable),
+        ]
+    )
+
+
+class TestCacheControlMiddleware:
+    """Test suite for CacheControlMiddleware."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client with a policy table."""
+        app = make_app()
+        app.add_middleware(
+            CacheControlMiddleware,
+            policies={"/": "public, max-age=60", "/static/*": "public, max-age=3600"},
+        )
+        return TestClient(app)
+
+    def test_unmatched_path_gets_no_cache(self, client):
+        """Test that paths without a policy are not cacheable."""
+        response = client.get("/stream")
+
+        assert (
+            response.headers["cache-control"] == "no-cache, no-store, must-revalidate"
+        )
+        assert response.headers["pragma"] == "no-cache"
+        assert response.headers["expires"] == "0"
+
+    def test_exact_policy(self, client):
+        """Test that exact paths use their policy."""
+        response = client.get("/")
+
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert "pragma" not in response.headers
+
+    def test_prefix_policy(self, client):
+        """Test that prefix policies match nested paths."""
+        response = client.get("/static/logo")
+
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_error_responses_are_not_cached(self, client):
+        """Test that a route policy is not applied to error responses."""
+        response = client.get("/static/down")
+
+        assert response.status_code == 503
+        assert (
+            response.headers["cache-control"] == "no-cache, no-store, must-revalidate"
+        )
+        assert response.headers["pragma"] == "no-cache"
+
+    def test_endpoint_header_wins(self, client):
+        """Test that an endpoint's own Cache-Control is preserved."""
+        response = client.get("/own")
+
+        assert response.headers["cache-control"] == "private"
+
+    def test_streaming_response_passes_through(self, client):
+        """Test that streaming bodies are forwarded intact."""
+        response = client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+
+    def test_headers_for_defaults_to_no_cache(self):
+        """Test policy resolution without a table."""
+        middleware = CacheControlMiddleware(make_app())
+
+        assert middleware.headers_for("/anything") is NO_CACHE_HEADERS
+
+
+ROWS = [{"id": i, "email": f"user{i}@example.com"} for i in range(500)]
+
+
+def make_compression_app() -> Starlette:
+    """Build an app with large, small, binary and streaming responses."""
+
+    async def large(request):
+        return JSONResponse(ROWS)
+
+    async def small(request):
+        return JSONResponse({"status": "healthy"})
+
+    async def image(request):
+        return Response(b"\x89PNG" + b"\x00" * 4096, media_type="image/png")
+
+    async def export(request):
+        async def lines():
+            for row in ROWS:
+                yield json.dumps(row) + "\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    return Starlette(
+        routes=[
+            Route("/large", large),
+            Route("/small", small),
+            Route("/image", image),
+            Route("/export", export),
+        ]
+    )
+
+
+async def call_asgi(app, path: str, accept_encoding: bytes) -> list:
+    """Drive an ASGI app directly and return the raw response messages."""
+    messages = []
+    finished = asyncio.Event()
+
+    async def receive():
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get(
+            "more_body", False
+        ):
+            finished.set()
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", accept_encoding)],
+    }
+    await app(scope, receive, send)
+    return messages
+
+
+class TestCompressionMiddleware:
+    """Test suite for CompressionMiddleware."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client with compression enabled."""
+        app = make_compression_app()
+        app.add_middleware(CompressionMiddleware, minimum_size=1024)
+        return TestClient(app)
+
+    @pytest.fixture
+    def middleware(self):
+        """Create the middleware around the app for direct ASGI calls."""
+        return CompressionMiddleware(make_compression_app(), minimum_size=1024)
+
+    def test_parse_accept_encoding(self):
+        """Test Accept-Encoding parsing with q-values."""
+        assert parse_accept_encoding("gzip, br;q=0.5, *;q=0") == {
+            "gzip": 1.0,
+            "br": 0.5,
+            "*": 0.0,
+        }
+
+    def test_prefers_brotli(self, client):
+        """Test that brotli is preferred when the client accepts it."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()) == 500
+
+    async def test_gzip_content_length(self, middleware):
+        """Test that gzip bodies carry the compressed Content-Length."""
+        start, body = await call_asgi(middleware, "/large", b"gzip")
+
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == b"gzip"
+        assert int(headers[b"content-length"]) == len(body["body"])
+        assert json.loads(gzip.decompress(body["body"])) == ROWS
+
+    def test_respects_q_zero(self, client):
+        """Test that encodings with q=0 are not used."""
+        response = client.get("/large", headers={"Accept-Encoding": "br;q=0, gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_small_body_not_compressed(self, client):
+        """Test that bodies below the minimum size are sent as-is."""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip, br"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "healthy"}
+
+    def test_incompressible_type_skipped(self, client):
+        """Test that already-compressed content types are skipped."""
+        response = client.get("/image", headers={"Accept-Encoding": "gzip, br"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content.startswith(b"\x89PNG")
+
+    def test_no_accept_encoding(self, client):
+        """Test that responses are untouched without Accept-Encoding."""
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+
+    async def test_streaming_is_compressed_incrementally(self, middleware):
+        """Test that every streamed chunk is flushed as soon as it arrives."""
+        messages = await call_asgi(middleware, "/export", b"gzip")
+
+        headers = dict(messages[0]["headers"])
+        bodies = messages[1:]
+        assert headers[b"content-encoding"] == b"gzip"
+        assert b"content-length" not in headers
+        assert len(bodies) == len(ROWS) + 1
+        assert bodies[-1]["more_body"] is False
+
+        decoder = zlib.decompressobj(31)
+        for row, message in zip(ROWS, bodies):
+            assert message["more_body"] is True
+            assert message["body"]
+            assert (
+                decoder.decompress(message["body"]) == (json.dumps(row) + "\n").encode()
+            )
+        decoder.decompress(bodies[-1]["body"])
+        assert decoder.eof
+
+    async def test_brotli_streaming_flushes_each_chunk(self, middleware):
+        """Test that brotli output is decodable after every chunk."""
+        messages = await call_asgi(middleware, "/export", b"br")
+
+        decoder = brotli.Decompressor()
+        for row, message in zip(ROWS, messages[1:-1]):
+            assert decoder.process(message["body"]) == (json.dumps(row) + "\n").encode()
+
+    async def test_brotli_roundtrip(self, middleware):
+        """Test that the brotli body decodes to the original JSON."""
+        start, body = await call_asgi(middleware, "/large", b"br")
+
+        headers = dict(start["headers"])
+        assert headers[b"content-encoding"] == b"br"
+        assert int(headers[b"content-length"]) == len(body["body"])
+        assert json.loads(brotli.decompress(body["body"])) == ROWS
+
+
+def make_upload_app() -> FastAPI:
+    """Build an app with a validated body, a raw upload and a free route."""
+    app = FastAPI()
+    received = []
+
+    @app.post("/contact/")
+    async def contact(form: ContactForm):
+        received.append(form)
+        return {"ok": True}
+
+    @app.post("/uploads/raw")
+    async def raw(request: Request):
+        return {"size": len(await request.body())}
+
+    @app.post("/other")
+    async def other(request: Request):
+        return {"size": len(await request.body())}
+
+    app.state.received = received
+    return app
+
+
+class TestBodySizeLimitMiddleware:
+    """Test suite for BodySizeLimitMiddleware."""
+
+    @pytest.fixture
+    def app(self):
+        """Create the upload app wrapped in the middleware."""
+        app = make_upload_app()
+        app.add_middleware(
+            BodySizeLimitMiddleware,
+            limits={"/contact/": json_body_limit(ContactForm), "/uploads/*": 100},
+            default_limit=1000,
+        )
+        return app
+
+    @pytest.fixture
+    def client(self, app):
+        """Create a test client for the upload app."""
+        return TestClient(app)
+
+    def test_content_length_over_limit_is_rejected(self, app, client):
+        """Test that a declared oversized body is rejected unread."""
+        form = {"full_name": "Juan", "message": "x" * 1_000_000}
+
+        response = client.post("/contact/", json=form)
+
+        assert response.status_code == 413
+        assert response.headers["connection"] == "close"
+        assert app.state.received == []
+
+    def test_streamed_body_over_limit_is_rejected(self, client):
+        """Test that chunked bodies are counted as they arrive."""
+
+        def chunks():
+            for _ in range(10):
+                yield b"x" * 50
+
+        response = client.post("/uploads/raw", content=chunks())
+
+        assert response.status_code == 413
+        assert "100 bytes" in response.json()["detail"]
+
+    def test_bodies_within_limits_pass(self, client):
+        """Test that prefix and default limits allow smaller bodies."""
+        assert client.post("/uploads/raw", content=b"x" * 100).json() == {"size": 100}
+        assert client.post("/other", content=b"x" * 1000).json() == {"size": 1000}
+        assert client.post("/other", content=b"x" * 1001).status_code == 413
+
+    def test_largest_valid_form_fits_derived_limit(self, client):
+        """Test that the derived limit never rejects a valid body."""
+        # Every character escaped as \uXXXX, at every field's max length
+        form = {
+            "full_name": "\u00e9" * 100,
+            "email": "juan@example.com",
+            "phone": "1" * 20,
+            "company": "\u00e9" * 255,
+            "product_type": "\u00e9" * 100,
+            "quantity": "\u00e9" * 100,
+            "message": "\u00e9" * 2000,
+        }
+        body = json.dumps(form, ensure_ascii=True, indent=4).encode()
+
+        response = client.post(
+            "/contact/", content=body, headers={"content-type": "application/json"}
+        )
+
+        assert len(body) <= json_body_limit(ContactForm)
+        assert response.status_code == 200
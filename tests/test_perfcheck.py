@@ -0,0 +1,171 @@
+"""
+Test cases for the performance regression gate.
+
+This module tests how benchmark runs are summarized, compared with a
+baseline and reported, and the command line flow with a stub suite.
+"""
+
+import json
+
+import pytest
+
+from benchmarks import perfcheck
+from benchmarks.perfcheck import compare, format_report, summarize_runs
+
+
+def result(name: str, p50: float, p99: float, ops: float, **extra) -> dict:
+    """Build a benchmark result record."""
+    return {"name": name, "p50_us": p50, "p99_us": p99, "ops_per_sec": ops, **extra}
+
+
+def summary(p50: float, p99: float, ops: float, noise: float = 0.0) -> dict:
+    """Build the summary of one benchmark."""
+    return {
+        "p50_us": {"median": p50, "noise": noise},
+        "p99_us": {"median": p99, "noise": noise},
+        "ops_per_sec": {"median": ops, "noise": noise},
+    }
+
+
+def statuses(comparisons) -> dict:
+    """Map each compared metric to its status."""
+    return {(c.benchmark, c.metric): c.status for c in comparisons}
+
+
+class TestSummarizeRuns:
+    """Test suite for summarize_runs."""
+
+    def test_median_and_noise(self):
+        """Test that each metric is reduced to its median and relative MAD."""
+        runs = [[result("a", p50, 20, 1000)] for p50 in (10, 11, 12, 10, 30)]
+
+        summarized = summarize_runs(runs)["a"]
+
+        assert summarized["p50_us"]["median"] == 11
+        assert summarized["p50_us"]["noise"] == pytest.approx(1.4826 / 11, abs=1e-4)
+        assert summarized["p99_us"] == {"median": 20, "noise": 0.0}
+
+    def test_concurrency_is_part_of_the_key(self):
+        """Test that one name measured at two concurrencies stays apart."""
+        runs = [
+            [
+                result("call", 10, 20, 1000, concurrency=1),
+                result("call", 40, 90, 3000, concurrency=32),
+            ]
+        ]
+
+        assert set(summarize_runs(runs)) == {
+            "call[concurrency=1]",
+            "call[concurrency=32]",
+        }
+
+
+class TestCompare:
+    """Test suite for compare."""
+
+    def test_regression_beyond_tolerance_fails(self):
+        """Test that slower latency and lower throughput regress."""
+        comparisons = compare(
+            {"a": summary(100, 200, 1000)}, {"a": summary(120, 210, 850)}
+        )
+
+        assert statuses(comparisons) == {
+            ("a", "p50_us"): "regressed",
+            ("a", "p99_us"): "ok",
+            ("a", "ops_per_sec"): "regressed",
+        }
+        p50 = comparisons[0]
+        assert p50.change == pytest.approx(0.2)
+        assert p50.threshold == pytest.approx(0.1)
+
+    def test_improvement(self):
+        """Test that faster results are reported as improvements."""
+        comparisons = compare(
+            {"a": summary(100, 200, 1000)}, {"a": summary(50, 100, 2000)}
+        )
+
+        assert set(statuses(comparisons).values()) == {"improved"}
+
+    def test_noise_widens_the_threshold(self):
+        """Test that a noisy benchmark needs a bigger change to fail."""
+        comparisons = compare(
+            {"a": summary(100, 200, 1000, noise=0.1)},
+            {"a": summary(130, 200, 1000, noise=0.1)},
+        )
+
+        p50 = comparisons[0]
+        assert p50.threshold == pytest.approx(3 * 0.1 * 2**0.5)
+        assert p50.status == "ok"
+
+    def test_changes_below_timer_resolution_are_ignored(self):
+        """Test that sub-microsecond latency changes never regress."""
+        comparisons = compare(
+            {"a": summary(0.5, 0.8, 1e6)}, {"a": summary(0.9, 1.2, 1e6)}
+        )
+
+        assert set(statuses(comparisons).values()) == {"ok"}
+
+    def test_new_and_missing_benchmarks(self):
+        """Test benchmarks present on one side only."""
+        comparisons = compare({"old": summary(1, 2, 3)}, {"new": summary(1, 2, 3)})
+
+        assert set(statuses(comparisons).values()) == {"new", "missing"}
+
+
+class TestFormatReport:
+    """Test suite for format_report."""
+
+    def test_lists_changes_only(self):
+        """Test that the report shows the diff and a summary line."""
+        comparisons = compare(
+            {"a": summary(100, 200, 1000), "b": summary(100, 200, 1000)},
+            {"a": summary(150, 200, 1000), "b": summary(100, 200, 1000)},
+        )
+
+        lines = format_report(comparisons).splitlines()
+
+        assert len(lines) == 3
+        assert lines[1].split() == [
+            "a",
+            "p50_us",
+            "100.00",
+            "150.00",
+            "+50.0%",
+            "10.0%",
+            "regressed",
+        ]
+        assert lines[2] == "1 regressed, 5 ok"
+
+
+class TestMain:
+    """Test suite for the command line flow."""
+
+    @pytest.fixture
+    def timings(self, monkeypatch):
+        """Replace the suites with one whose speed the test controls."""
+        speed = {"p50": 100.0}
+
+        def run(iterations):
+            return [result("op", speed["p50"], speed["p50"] * 2, 1e6 / speed["p50"])]
+
+        monkeypatch.setattr(perfcheck, "SUITES", {"stub": (run, 10)})
+        return speed
+
+    def test_update_then_compare(self, tmp_path, timings, capsys):
+        """Test recording a baseline, passing, then failing on a slowdown."""
+        baseline = str(tmp_path / "baseline.json")
+        argv = ["--baseline", baseline, "--suites", "stub", "--repeats", "3"]
+
+        assert perfcheck.main(argv + ["--update-baseline"]) == 0
+        stored = json.loads((tmp_path / "baseline.json").read_text())
+        assert "stub/op" in stored["benchmarks"]
+        assert perfcheck.main(argv) == 0
+
+        timings["p50"] = 150.0
+        assert perfcheck.main(argv) == 1
+        assert "stub/op" in capsys.readouterr().out
+
+    def test_missing_baseline_is_an_error(self, tmp_path, timings):
+        """Test that comparing requires a recorded baseline."""
+        with pytest.raises(SystemExit):
+            perfcheck.main(["--baseline", str(tmp_path / "none.json")])
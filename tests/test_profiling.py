@@ -0,0 +1,228 @@
+"""
+Test cases for on-demand request profiling.
+
+This module tests the stack sampler, the profile ring buffer and its
+export formats, the profiling middleware and the download endpoints.
+"""
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import Profile, ProfileStore, StackSampler
+from app.main import create_app
+from app.middleware.profiling import ProfilingMiddleware
+
+SECRET = "let-me-profile"
+
+
+def busy_wait(seconds: float) -> None:
+    """Keep the current thread on CPU."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def make_profile(profile_id: int = 1) -> Profile:
+    """Build a profile with two stacks."""
+    return Profile(
+        id=profile_id,
+        method="POST",
+        path="/api/v1/contact/",
+        started_at=0.0,
+        duration_ms=12.5,
+        interval_ms=5.0,
+        samples=Counter({"main;handler;query": 3, "main;handler": 1}),
+    )
+
+
+class TestStackSampler:
+    """Test suite for StackSampler."""
+
+    def test_samples_the_target_thread(self):
+        """Test that stacks of the profiled thread are collected."""
+        sampler = StackSampler(threading.get_ident(), interval=0.001)
+
+        sampler.start()
+        busy_wait(0.05)
+        samples = sampler.stop()
+
+        assert sum(samples.values()) > 5
+        assert any("busy_wait" in stack for stack in samples)
+
+
+class TestProfileStore:
+    """Test suite for ProfileStore and the export formats."""
+
+    def test_ring_buffer_drops_oldest(self):
+        """Test that the store keeps only the most recent profiles."""
+        store = ProfileStore(capacity=2)
+        for _ in range(3):
+            store.add(make_profile(store.next_id()))
+
+        assert [profile.id for profile in store.recent()] == [3, 2]
+        assert store.get(1) is None
+
+    def test_collapsed_format(self):
+        """Test one line per stack, most frequent first."""
+        assert make_profile().to_collapsed() == (
+            "main;handler;query 3\nmain;handler 1\n"
+        )
+
+    def test_speedscope_format(self):
+        """Test the sampled speedscope profile."""
+        document = make_profile().to_speedscope()
+
+        frames = [frame["name"] for frame in document["shared"]["frames"]]
+        profile = document["profiles"][0]
+        assert frames == ["main", "handler", "query"]
+        assert profile["type"] == "sampled"
+        assert profile["samples"] == [[0, 1, 2], [0, 1]]
+        assert profile["weights"] == [15.0, 5.0]
+
+
+class TestProfilingMiddleware:
+    """Test suite for ProfilingMiddleware."""
+
+    def make_client(self, store: ProfileStore, **options) -> TestClient:
+        """Build a client for a small app wrapped in the middleware."""
+
+        async def slow(request):
+            busy_wait(0.02)
+            return PlainTextResponse("ok")
+
+        app = Starlette(routes=[Route("/slow", slow)])
+        app.add_middleware(ProfilingMiddleware, store=store, interval=0.001, **options)
+        return TestClient(app)
+
+    def test_secret_header_triggers_profile(self):
+        """Test that the secret header profiles the request."""
+        store = ProfileStore()
+        client = self.make_client(store, secret=SECRET)
+
+        response = client.get("/slow", headers={"X-Profile": SECRET})
+
+        profile = store.get(int(response.headers["x-profile-id"]))
+        assert profile is not None
+        assert profile.path == "/slow"
+        assert any("slow" in stack for stack in profile.samples)
+
+    def test_other_requests_are_not_profiled(self):
+        """Test that a missing or wrong header does nothing."""
+        store = ProfileStore()
+        client = self.make_client(store, secret=SECRET)
+
+        plain = client.get("/slow")
+        wrong = client.get("/slow", headers={"X-Profile": "guess"})
+
+        assert "x-profile-id" not in plain.headers
+        assert "x-profile-id" not in wrong.headers
+        assert store.recent() == []
+
+    def test_excluded_paths_are_not_profiled(self):
+        """Test that excluded prefixes skip profiling even with the secret."""
+        store = ProfileStore()
+        client = self.make_client(
+            store, secret=SECRET, sample_rate=1.0, exclude_paths=["/slow"]
+        )
+
+        response = client.get("/slow", headers={"X-Profile": SECRET})
+
+        assert "x-profile-id" not in response.headers
+        assert store.recent() == []
+
+    def test_sample_rate_profiles_without_header(self):
+        """Test that sampled requests are profiled."""
+        store = ProfileStore()
+
+        self.make_client(store, sample_rate=1.0).get("/slow")
+
+        assert len(store.recent()) == 1
+
+
+class TestProfileEndpoints:
+    """Test suite for the profile download routes."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        """Replace the global profile store with one holding a profile."""
+        store = ProfileStore()
+        store.add(make_profile(store.next_id()))
+        monkeypatch.setattr(profiling, "profile_store", store)
+        monkeypatch.setattr("app.api.v1.profiles.profile_store", store)
+        monkeypatch.setattr("app.middleware.profiling.default_store", store)
+        return store
+
+    @pytest.fixture
+    def client(self, monkeypatch, store):
+        """Create an app with profiling enabled."""
+        monkeypatch.setattr(settings, "profiling_enabled", True)
+        monkeypatch.setattr(settings, "profiling_secret", SECRET)
+        return TestClient(create_app())
+
+    def test_downloads_require_secret(self, client):
+        """Test that the routes hide behind the secret."""
+        assert client.get("/api/v1/admin/profiles/").status_code == 404
+        response = client.get("/api/v1/admin/profiles/", headers={"X-Profile": "guess"})
+        assert response.status_code == 404
+
+    def test_list_and_download(self, client):
+        """Test listing and both download formats."""
+        headers = {"X-Profile": SECRET}
+
+        listed = client.get("/api/v1/admin/profiles/", headers=headers).json()
+        collapsed = client.get("/api/v1/admin/profiles/1.collapsed", headers=headers)
+        speedscope = client.get(
+            "/api/v1/admin/profiles/1.speedscope.json", headers=headers
+        )
+        missing = client.get("/api/v1/admin/profiles/99.collapsed", headers=headers)
+
+        assert listed[0]["id"] == 1 and listed[0]["samples"] == 4
+        assert collapsed.text.startswith("main;handler;query 3")
+        assert speedscope.json()["profiles"][0]["type"] == "sampled"
+        assert missing.status_code == 404
+
+    def test_profiled_request_is_downloadable(self, client, store):
+        """Test the round trip from a profiled request to its download."""
+        response = client.get("/health", headers={"X-Profile": SECRET})
+        profile_id = response.headers["x-profile-id"]
+
+        download = client.get(
+            f"/api/v1/admin/profiles/{profile_id}.collapsed",
+            headers={"X-Profile": SECRET},
+        )
+
+        assert download.status_code == 200
+
+    def test_browsing_leaves_buffer_unchanged(self, monkeypatch, client):
+        """Test that admin calls are not profiled into the ring buffer."""
+        store = ProfileStore(capacity=3)
+        monkeypatch.setattr("app.api.v1.profiles.profile_store", store)
+        monkeypatch.setattr("app.middleware.profiling.default_store", store)
+        headers = {"X-Profile": SECRET}
+        profile_id = client.get("/health", headers=headers).headers["x-profile-id"]
+
+        for _ in range(3):
+            listed = client.get("/api/v1/admin/profiles/", headers=headers)
+            assert "x-profile-id" not in listed.headers
+        download = client.get(
+            f"/api/v1/admin/profiles/{profile_id}.collapsed", headers=headers
+        )
+
+        assert [profile["id"] for profile in listed.json()] == [int(profile_id)]
+        assert download.status_code == 200
+
+    def test_disabled_by_default(self):
+        """Test that neither middleware nor routes exist when disabled."""
+        app = create_app()
+
+        assert ProfilingMiddleware not in [m.cls for m in app.user_middleware]
+        assert TestClient(app).get("/api/v1/admin/profiles/").status_code == 404
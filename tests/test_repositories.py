@@ -6,6 +6,7 @@ data access patterns and CRUD operations.
 """
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
@@ -110,15 +111,70 @@ class TestClientRepositoryAsync:
         assert len(second_page) == 2
         assert first_page[0].id != second_page[0].id
 
+    async def test_get_all_async_ties_and_fields(
+        self, async_test_db: AsyncSession, sample_client_data: dict
+    ):
+        """Test that same-second rows page by id and fields limit loading."""
+        repo = ClientRepository(async_test_db)
+        for i in range(4):
+            data = sample_client_data.copy()
+            data["email"] = f"user{i}@example.com"
+            await repo.create_async(ClientCreate(**data))
+        async_test_db.expunge_all()
+
+        pages = [
+            await repo.get_all_async(skip=skip, limit=2, fields=["email"])
+            for skip in (0, 2)
+        ]
+
+        ids = [client.id for page in pages for client in page]
+        assert ids == sorted(ids, reverse=True)
+        assert "message" not in pages[0][0].__dict__
+        assert pages[0][0].__dict__["email"] == "user3@example.com"
+
+    async def test_message_is_deferred_unless_requested(
+        self, async_test_db: AsyncSession, sample_client_in_db: Client
+    ):
+        """Test that lookups and listings skip the TEXT column by default."""
+        repo = ClientRepository(async_test_db)
+        email = sample_client_in_db.email
+        async_test_db.expunge_all()
+
+        listed = (await repo.get_all_async())[0]
+        with pytest.raises(InvalidRequestError):
+            listed.message
+        async_test_db.expunge_all()
+
+        found = await repo.get_by_email_async(email, include_message=True)
+        assert found.message == sample_client_in_db.message
+
+    async def test_get_rows_async(
+        self, async_test_db: AsyncSession, sample_client_data: dict
+    ):
+        """Test the read-only projection of a page."""
+        repo = ClientRepository(async_test_db)
+        for i in range(3):
+            data = sample_client_data.copy()
+            data["email"] = f"user{i}@example.com"
+            await repo.create_async(ClientCreate(**data))
+        async_test_db.expunge_all()
+
+        rows = await repo.get_rows_async(["id", "email"], skip=1, limit=5)
+
+        assert [tuple(row) for row in rows] == [
+            (2, "user1@example.com"),
+            (1, "user0@example.com"),
+        ]
+        assert rows[0].email == "user1@example.com"
+        assert len(async_test_db.identity_map) == 0
+
     async def test_update_async(
         self, async_test_db: AsyncSession, sample_client_in_db: Client
     ):
         """Test updating client asynchronously."""
         repo = ClientRepository(async_test_db)
 
-        update_data = ClientUpdate(
-            full_name="Updated Name", company="New Company"
-        )
+        update_data = ClientUpdate(full_name="Updated Name", company="New Company")
 
         updated_client = await repo.update_async(sample_client_in_db.id, update_data)
 
@@ -227,6 +283,17 @@ class TestClientRepositorySync:
 
         assert len(clients) == 3
 
+    def test_get_rows_sync(self, test_db: Session, sample_client_data: dict):
+        """Test the read-only projection of a page synchronously."""
+        repo = ClientRepository(test_db)
+        client = repo.create(ClientCreate(**sample_client_data))
+
+        rows = repo.get_rows(["full_name", "company"])
+
+        assert [tuple(row) for row in rows] == [
+            (client.full_name, sample_client_data["company"])
+        ]
+
     def test_update_sync(self, test_db: Session, sample_client_data: dict):
         """Test updating client synchronously."""
         repo = ClientRepository(test_db)
@@ -264,4 +331,3 @@ class TestClientRepositorySync:
         count = repo.count()
 
         assert count == 2
-
@@ -0,0 +1,74 @@
+"""
+Test cases for JSON response rendering.
+
+This module tests the default response class and the contact endpoint
+serialization path built on it.
+"""
+
+import json
+from datetime import datetime
+
+from app.core.responses import PydanticJSONResponse, encode_rows
+from app.main import create_app
+from app.schemas.client import ContactForm, ContactResponse, ContactSubmissionData
+
+
+class TestPydanticJSONResponse:
+    """Test suite for PydanticJSONResponse."""
+
+    def test_renders_models_directly(self):
+        """Test that a model is encoded like model_dump_json."""
+        form = ContactForm(
+            full_name="Juan Pérez",
+            email="juan@example.com",
+            phone="+52 123 456 7890",
+            message="This is a test message",
+        )
+        model = ContactResponse(
+            success=True,
+            message="ok",
+            data=ContactSubmissionData.from_form(form, datetime(2024, 1, 15)),
+        )
+
+        response = PydanticJSONResponse(model)
+
+        assert response.body == model.model_dump_json().encode()
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body)["data"]["full_name"] == "Juan Pérez"
+
+    def test_renders_plain_values_like_json_response(self):
+        """Test that dicts match the standard compact UTF-8 encoding."""
+        content = {"status": "healthy", "name": "Pérez", "items": [1, None]}
+
+        response = PydanticJSONResponse(content)
+
+        assert json.loads(response.body) == content
+        assert "Pérez".encode() in response.body
+
+    def test_is_the_default_response_class(self):
+        """Test that the app uses it for endpoints returning plain values."""
+        app = create_app()
+
+        assert app.router.default_response_class is PydanticJSONResponse
+
+
+class TestEncodeRows:
+    """Test suite for encode_rows."""
+
+    def test_encodes_rows_as_objects(self):
+        """Test that rows become objects keyed by field, inside the page."""
+        rows = [(1, "Ana", datetime(2024, 1, 15)), (2, "Luis", None)]
+
+        body = encode_rows(["id", "full_name", "created_at"], rows, total=2)
+
+        assert json.loads(body) == {
+            "items": [
+                {"id": 1, "full_name": "Ana", "created_at": "2024-01-15T00:00:00"},
+                {"id": 2, "full_name": "Luis", "created_at": None},
+            ],
+            "total": 2,
+        }
+
+    def test_empty_page(self):
+        """Test a page without rows."""
+        assert json.loads(encode_rows(["id"], [])) == {"items": []}
@@ -0,0 +1,169 @@
+"""
+Test cases for the client retention job.
+
+This module tests archiving and deleting expired clients in batches,
+the resumable checkpoint, dry runs and the job entry point.
+"""
+
+import gzip
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import database
+from app.jobs import retention
+from app.jobs.retention import CHECKPOINT_NAME, purge_expired_clients
+from app.models.client import Client
+from app.models.stats import RollupWatermark
+from app.repositories.stats_repository import RollupConflict, StatsRepository
+
+
+def add_clients(db: Session, *ages: int) -> None:
+    """Add one client per age in days and commit them."""
+    now = datetime.utcnow()
+    db.add_all(
+        Client(
+            full_name=f"Cliente {i}",
+            email=f"cliente{i}@example.com",
+            phone="+52 123 456 7890",
+            message="Mensaje",
+            created_at=now - timedelta(days=age),
+            updated_at=now - timedelta(days=age),
+        )
+        for i, age in enumerate(ages)
+    )
+    db.commit()
+
+
+def remaining_ids(db: Session) -> list:
+    """Ids of the clients still in the table."""
+    return list(db.scalars(select(Client.id).order_by(Client.id)))
+
+
+def read_archive(path) -> list:
+    """Decode the clients in an archive file."""
+    with gzip.open(path, "rt") as archive:
+        return [json.loads(line) for line in archive]
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip the pauses between batches."""
+    monkeypatch.setattr(retention.time, "sleep", lambda seconds: None)
+
+
+class TestPurgeExpiredClients:
+    """Test suite for purge_expired_clients."""
+
+    def test_archives_and_deletes_in_batches(self, test_db: Session, tmp_path):
+        """Test that expired clients are archived, then deleted, in id order."""
+        add_clients(test_db, 800, 790, 780, 10)
+        StatsRepository(test_db).catch_up()
+
+        report = purge_expired_clients(test_db, tmp_path, days=365, batch_size=2)
+
+        assert (report.batches, report.clients, report.last_id) == (2, 3, 3)
+        assert [path.name for path in report.archives] == [
+            "clients-0000000001-0000000002.ndjson.gz",
+            "clients-0000000003-0000000003.ndjson.gz",
+        ]
+        archived = read_archive(report.archives[0])
+        assert [client["id"] for client in archived] == [1, 2]
+        assert archived[0]["email"] == "cliente0@example.com"
+        assert remaining_ids(test_db) == [4]
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_resumes_from_checkpoint(self, test_db: Session, tmp_path):
+        """Test that a stopped run continues after the last deleted batch."""
+        add_clients(test_db, 800, 790, 780)
+        StatsRepository(test_db).catch_up()
+
+        first = purge_expired_clients(
+            test_db, tmp_path, days=365, batch_size=1, max_batches=2
+        )
+        second = purge_expired_clients(test_db, tmp_path, days=365, batch_size=1)
+
+        assert (first.clients, first.last_id) == (2, 2)
+        assert (second.clients, second.last_id) == (1, 3)
+        assert test_db.get(RollupWatermark, CHECKPOINT_NAME).last_id == 3
+        assert remaining_ids(test_db) == []
+
+    def test_keeps_clients_not_yet_counted(self, test_db: Session, tmp_path):
+        """Test that clients missing from the stats rollup are not deleted."""
+        add_clients(test_db, 800, 790)
+        StatsRepository(test_db).catch_up(batch_size=1, max_batches=1)
+
+        report = purge_expired_clients(test_db, tmp_path, days=365)
+
+        assert report.clients == 1
+        assert remaining_ids(test_db) == [2]
+        assert StatsRepository(test_db).submissions(
+            date(2000, 1, 1), date.today(), ["company"]
+        ) == [{"company": None, "submissions": 1}]
+
+    def test_dry_run_writes_nothing(self, test_db: Session, tmp_path):
+        """Test that a dry run only reports what it would archive."""
+        add_clients(test_db, 800, 790, 10)
+        StatsRepository(test_db).catch_up()
+
+        report = purge_expired_clients(
+            test_db, tmp_path, days=365, batch_size=1, dry_run=True
+        )
+
+        assert (report.batches, report.clients, report.archives) == (2, 2, [])
+        assert remaining_ids(test_db) == [1, 2, 3]
+        assert list(tmp_path.iterdir()) == []
+        assert test_db.get(RollupWatermark, CHECKPOINT_NAME) is None
+
+    def test_dry_run_previews_past_the_rollup(self, test_db: Session, tmp_path):
+        """Test that a dry run counts what the real run will reach after catch-up."""
+        add_clients(test_db, 800, 790, 10)
+
+        report = purge_expired_clients(test_db, tmp_path, days=365, dry_run=True)
+
+        assert (report.batches, report.clients, report.last_id) == (1, 2, 2)
+        assert test_db.get(RollupWatermark, "client_daily_stats") is None
+
+    def test_conflicting_checkpoint(self, test_db: Session, tmp_path, monkeypatch):
+        """Test that a batch is rolled back if another run moved the checkpoint."""
+        add_clients(test_db, 800)
+        StatsRepository(test_db).catch_up()
+        test_db.add(RollupWatermark(name=CHECKPOINT_NAME, last_id=0))
+        test_db.commit()
+        next_batch = retention._next_batch
+
+        def racing_next_batch(session, *args):
+            rows = next_batch(session, *args)
+            test_db.get(RollupWatermark, CHECKPOINT_NAME).last_id = 7
+            test_db.flush()
+            return rows
+
+        monkeypatch.setattr(retention, "_next_batch", racing_next_batch)
+
+        with pytest.raises(RollupConflict):
+            purge_expired_clients(test_db, tmp_path, days=365)
+
+        assert remaining_ids(test_db) == [1]
+
+
+class TestRetentionJob:
+    """Test suite for the retention job entry point."""
+
+    def test_main_counts_before_deleting(
+        self, monkeypatch, test_engine, test_db: Session, tmp_path
+    ):
+        """Test that the job rolls up stats first, then archives."""
+        add_clients(test_db, 800, 10)
+        monkeypatch.setattr(
+            database, "SessionLocal", sessionmaker(bind=test_engine), raising=False
+        )
+
+        status = retention.main(["--days", "365", "--archive-dir", str(tmp_path)])
+
+        assert status == 0
+        assert remaining_ids(test_db) == [2]
+        assert len(list(tmp_path.glob("*.ndjson.gz"))) == 1
+        assert test_db.scalar(select(func.count()).select_from(RollupWatermark)) == 2
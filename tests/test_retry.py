@@ -0,0 +1,159 @@
+"""
+Test cases for transaction retry helpers.
+
+This module tests detection of retryable MySQL errors, the retry
+decorator for sync and async repository methods, and retry metrics.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pymysql
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.core.retry import (
+    compute_backoff,
+    get_mysql_error_code,
+    is_retryable_error,
+    retry_metrics,
+    retry_on_deadlock,
+)
+
+
+def make_operational_error(code: int) -> OperationalError:
+    """Build a SQLAlchemy error wrapping a PyMySQL error code."""
+    return OperationalError(
+        "UPDATE client", {}, pymysql.err.OperationalError(code, "lock error")
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_metrics():
+    """Reset retry metrics between tests."""
+    retry_metrics.reset()
+    yield
+    retry_metrics.reset()
+
+
+class TestRetryableErrors:
+    """Test suite for retryable error detection."""
+
+    def test_deadlock_is_retryable(self):
+        """Test that InnoDB deadlocks are retryable."""
+        exc = make_operational_error(1213)
+
+        assert get_mysql_error_code(exc) == 1213
+        assert is_retryable_error(exc) is True
+
+    def test_lock_wait_timeout_is_retryable(self):
+        """Test that lock wait timeouts are retryable."""
+        assert is_retryable_error(make_operational_error(1205)) is True
+
+    def test_other_errors_are_not_retryable(self):
+        """Test that unrelated database errors are not retried."""
+        assert is_retryable_error(make_operational_error(2006)) is False
+        assert is_retryable_error(IntegrityError("INSERT", {}, Exception())) is False
+        assert is_retryable_error(ValueError("boom")) is False
+
+    def test_backoff_is_bounded(self):
+        """Test that backoff never exceeds the maximum delay."""
+        for attempt in range(10):
+            delay = compute_backoff(attempt, base_delay=0.1, max_delay=0.5)
+            assert 0 <= delay <= 0.5
+
+
+class TestRetryDecorator:
+    """Test suite for the retry_on_deadlock decorator."""
+
+    def test_sync_retries_then_succeeds(self):
+        """Test that a sync method is retried after a deadlock."""
+
+        class Repo:
+            def __init__(self):
+                self.db = MagicMock()
+                self.calls = 0
+
+            @retry_on_deadlock(operation="repo.save", base_delay=0, max_delay=0)
+            def save(self):
+                self.calls += 1
+                if self.calls == 1:
+                    raise make_operational_error(1213)
+                return "saved"
+
+        repo = Repo()
+
+        assert repo.save() == "saved"
+        assert repo.calls == 2
+        repo.db.rollback.assert_called_once()
+        assert retry_metrics.snapshot()["repo.save"] == {
+            "retries": 1,
+            "recovered": 1,
+            "exhausted": 0,
+        }
+
+    def test_sync_gives_up_after_max_attempts(self):
+        """Test that the error is raised once attempts are exhausted."""
+
+        class Repo:
+            def __init__(self):
+                self.db = MagicMock()
+                self.calls = 0
+
+            @retry_on_deadlock(
+                operation="repo.save", max_attempts=3, base_delay=0, max_delay=0
+            )
+            def save(self):
+                self.calls += 1
+                raise make_operational_error(1205)
+
+        repo = Repo()
+
+        with pytest.raises(OperationalError):
+            repo.save()
+
+        assert repo.calls == 3
+        assert retry_metrics.snapshot()["repo.save"]["exhausted"] == 1
+
+    def test_sync_does_not_retry_other_errors(self):
+        """Test that non-transient errors propagate immediately."""
+
+        class Repo:
+            def __init__(self):
+                self.db = MagicMock()
+                self.calls = 0
+
+            @retry_on_deadlock(base_delay=0, max_delay=0)
+            def save(self):
+                self.calls += 1
+                raise make_operational_error(2006)
+
+        repo = Repo()
+
+        with pytest.raises(OperationalError):
+            repo.save()
+
+        assert repo.calls == 1
+        repo.db.rollback.assert_not_called()
+
+    async def test_async_retries_then_succeeds(self):
+        """Test that an async method is retried after a lock wait timeout."""
+
+        class Repo:
+            def __init__(self):
+                self.db = MagicMock()
+                self.db.rollback = AsyncMock()
+                self.calls = 0
+
+            @retry_on_deadlock(operation="repo.save_async", base_delay=0, max_delay=0)
+            async def save_async(self):
+                self.calls += 1
+                if self.calls < 3:
+                    raise make_operational_error(1205)
+                return "saved"
+
+        repo = Repo()
+
+        assert await repo.save_async() == "saved"
+        assert repo.calls == 3
+        assert repo.db.rollback.await_count == 2
+        assert retry_metrics.snapshot()["repo.save_async"]["retries"] == 2
@@ -5,16 +5,23 @@ This module tests schema validation, serialization,
 and deserialization for all data models.
 """
 
+from datetime import datetime
+from types import SimpleNamespace
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
+from app.core.config import settings
 from app.schemas.client import (
     ClientCreate,
     ClientResponse,
+    ClientResponseList,
     ClientUpdate,
     ContactForm,
     ContactResponse,
+    ContactSubmissionData,
 )
+from app.schemas.validators import CachedEmailStr, to_e164, validate_email_cached
 
 
 class TestContactFormSchema:
@@ -124,6 +131,33 @@ class TestContactFormSchema:
 
         form = ContactForm(**data)
         assert form.phone == data["phone"]
+        assert form.phone_e164 == "+521234567890"
+
+    def test_phone_e164_uses_default_country_code(self, monkeypatch):
+        """Test that national numbers get the configured calling code."""
+        data = {
+            "full_name": "Test User",
+            "email": "test@example.com",
+            "phone": "(123) 456-7890",
+            "message": "Test message for validation",
+        }
+
+        assert ContactForm(**data).phone_e164 == "+521234567890"
+        monkeypatch.setattr(settings, "phone_default_country_code", None)
+        assert ContactForm(**data).phone_e164 is None
+
+    def test_phone_e164_is_not_an_input(self):
+        """Test that the E.164 form is always derived, never taken as input."""
+        form = ContactForm(
+            full_name="Test User",
+            email="test@example.com",
+            phone="0052 123 456 7890",
+            message="Test message for validation",
+            phone_e164="+10000000000",
+        )
+
+        assert form.phone_e164 == "+521234567890"
+        assert "phone_e164" not in form.model_dump()
 
     def test_negative_quantity(self):
         """Test that negative quantity raises validation error."""
@@ -143,20 +177,29 @@ class TestContactResponseSchema:
 
     def test_valid_response(self):
         """Test valid contact response."""
-        data = {
-            "success": True,
-            "message": "Success message",
-            "data": {"key": "value"},
-        }
-
-        response = ContactResponse(**data)
+        form = ContactForm(
+            full_name="Juan Pérez",
+            email="juan@example.com",
+            phone="+52 123 456 7890",
+            message="This is a test message",
+        )
+        timestamp = datetime(2024, 1, 15, 10, 30)
+
+        response = ContactResponse(
+            success=True,
+            message="Success message",
+            data=ContactSubmissionData.from_form(form, timestamp),
+        )
 
         assert response.success is True
-        assert response.message == data["message"]
-        assert response.data == data["data"]
-
-    def test_response_with_empty_data(self):
-        """Test response with empty data dict."""
+        assert response.data.email == form.email
+        assert response.data.company is None
+        assert response.model_dump(mode="json")["data"]["timestamp"] == (
+            "2024-01-15T10:30:00"
+        )
+
+    def test_response_without_data(self):
+        """Test response without submission data."""
         data = {
             "success": False,
             "message": "Error message",
@@ -165,7 +208,12 @@ class TestContactResponseSchema:
         response = ContactResponse(**data)
 
         assert response.success is False
-        assert response.data == {}
+        assert response.data is None
+
+    def test_data_rejects_unknown_shape(self):
+        """Test that data must be a contact submission."""
+        with pytest.raises(ValidationError):
+            ContactResponse(success=True, message="ok", data={"key": "value"})
 
 
 class TestClientCreateSchema:
@@ -248,3 +296,65 @@ class TestClientResponseSchema:
         assert response.id == data["id"]
         assert response.full_name == data["full_name"]
 
+
+class TestValidators:
+    """Test suite for the shared field validators."""
+
+    @pytest.mark.parametrize(
+        "phone, expected",
+        [
+            ("+52 123 456 7890", "+521234567890"),
+            ("+1 (415) 555-0100", "+14155550100"),
+            ("00 44 20 7946 0958", "+442079460958"),
+            ("123 456 7890", "+521234567890"),
+            ("+52 123", None),
+            ("+52 1234 5678 9012 345", None),
+            ("+0 123 456 7890", None),
+        ],
+    )
+    def test_to_e164(self, phone, expected):
+        """Test E.164 normalization of phone numbers."""
+        assert to_e164(phone, "52") == expected
+
+    def test_cached_email_matches_email_str(self):
+        """Test that cached validation normalizes like EmailStr."""
+        adapter: TypeAdapter[str] = TypeAdapter(CachedEmailStr)
+
+        assert adapter.validate_python("Juan@Example.COM") == "Juan@example.com"
+        with pytest.raises(ValidationError, match="valid email address"):
+            adapter.validate_python("invalid-email")
+
+    def test_cached_email_reuses_results(self):
+        """Test that a repeated address is served from the cache."""
+        validate_email_cached.cache_clear()
+        adapter: TypeAdapter[str] = TypeAdapter(CachedEmailStr)
+
+        adapter.validate_python("repeat@example.com")
+        adapter.validate_python("repeat@example.com")
+
+        info = validate_email_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_client_response_list_from_rows(self):
+        """Test validating ORM-like rows through the list adapter."""
+        now = datetime(2024, 1, 15, 10, 30)
+        rows = [
+            SimpleNamespace(
+                id=i,
+                full_name="Test Client",
+                email="client@example.com",
+                phone="1234567890",
+                company=None,
+                product_type=None,
+                quantity=None,
+                message="Test message",
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(3)
+        ]
+
+        clients = ClientResponseList.validate_python(rows, from_attributes=True)
+
+        assert [client.id for client in clients] == [0, 1, 2]
+        assert all(isinstance(client, ClientResponse) for client in clients)
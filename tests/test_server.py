@@ -0,0 +1,98 @@
+"""
+Test cases for the production server launcher.
+
+This module tests CPU detection from cgroup files, worker sizing and the
+Gunicorn options built from settings.
+"""
+
+from app import server
+from app.core.config import settings
+from app.server import (
+    TunedUvicornWorker,
+    build_options,
+    cgroup_cpu_limit,
+    default_workers,
+)
+
+
+class TestCpuDetection:
+    """Test suite for cgroup CPU limits."""
+
+    def test_cgroup_v2_quota(self, tmp_path):
+        """Test that a cgroup v2 quota is converted to CPUs."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("150000 100000\n")
+
+        assert cgroup_cpu_limit(cpu_max=cpu_max) == 1.5
+
+    def test_cgroup_v2_unlimited(self, tmp_path):
+        """Test that an unlimited cgroup v2 quota yields None."""
+        cpu_max = tmp_path / "cpu.max"
+        cpu_max.write_text("max 100000\n")
+
+        assert cgroup_cpu_limit(cpu_max=cpu_max) is None
+
+    def test_cgroup_v1_quota(self, tmp_path):
+        """Test the cgroup v1 fallback and its unlimited marker."""
+        quota, period = tmp_path / "quota", tmp_path / "period"
+        quota.write_text("200000\n")
+        period.write_text("100000\n")
+        missing = tmp_path / "missing"
+
+        assert cgroup_cpu_limit(missing, quota, period) == 2.0
+        quota.write_text("-1\n")
+        assert cgroup_cpu_limit(missing, quota, period) is None
+
+    def test_worker_count_follows_cpus(self, monkeypatch):
+        """Test that workers round down to whole CPUs, with at least one."""
+        monkeypatch.setattr(settings, "server_workers", None)
+
+        assert default_workers(4) == 4
+        assert default_workers(2.5) == 2
+        assert default_workers(0.5) == 1
+
+    def test_worker_count_setting_wins(self, monkeypatch):
+        """Test that an explicit worker count overrides detection."""
+        monkeypatch.setattr(settings, "server_workers", 3)
+
+        assert default_workers(16) == 3
+
+    def test_available_cpus_respects_quota(self, monkeypatch):
+        """Test that the quota caps the affinity set."""
+        monkeypatch.setattr(server, "cgroup_cpu_limit", lambda: 0.5)
+
+        assert server.available_cpus() == 0.5
+
+
+class TestServerOptions:
+    """Test suite for the Gunicorn configuration."""
+
+    def test_options_come_from_settings(self, monkeypatch):
+        """Test that tuning settings are passed to Gunicorn."""
+        monkeypatch.setattr(settings, "server_backlog", 4096)
+        monkeypatch.setattr(settings, "server_keepalive", 15)
+        monkeypatch.setattr(settings, "server_max_requests", 500)
+
+        options = build_options(workers=2)
+
+        assert options["bind"] == f"{settings.host}:{settings.port}"
+        assert options["workers"] == 2
+        assert options["worker_class"] == "app.server.TunedUvicornWorker"
+        assert options["backlog"] == 4096
+        assert options["keepalive"] == 15
+        assert options["max_requests"] == 500
+
+    def test_worker_uses_fast_loop_and_parser(self):
+        """Test that uvloop and httptools are selected when installed."""
+        expected_loop = "uvloop" if server._has_module("uvloop") else "asyncio"
+        expected_http = "httptools" if server._has_module("httptools") else "h11"
+
+        assert TunedUvicornWorker.CONFIG_KWARGS["loop"] == expected_loop
+        assert TunedUvicornWorker.CONFIG_KWARGS["http"] == expected_http
+
+    def test_application_applies_options(self):
+        """Test that the Gunicorn application loads the options."""
+        application = server.ServerApplication(build_options(workers=2))
+
+        assert application.cfg.workers == 2
+        assert application.cfg.keepalive == settings.server_keepalive
@@ -19,14 +19,14 @@ class TestMailgunService:
     @pytest.fixture
     def mailgun_service(self):
         """Create a test MailgunService instance."""
-        with patch("app.core.config.settings") as mock_settings:
+        with patch("app.services.mailgun.settings") as mock_settings:
             mock_settings.mailgun_api_key = "test-api-key"
             mock_settings.mailgun_domain = "test.mailgun.org"
             mock_settings.mailgun_base_url = "https://api.mailgun.net/v3"
             service = MailgunService()
             return service
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_email_success(self, mock_post, mailgun_service):
         """Test successful email sending."""
         mock_response = MagicMock()
@@ -44,7 +44,7 @@ class TestMailgunService:
         assert result["id"] == "test-message-id"
         mock_post.assert_called_once()
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_email_with_html(self, mock_post, mailgun_service):
         """Test sending email with HTML content."""
         mock_response = MagicMock()
@@ -62,7 +62,7 @@ class TestMailgunService:
         call_args = mock_post.call_args
         assert "<h1>Test HTML</h1>" in str(call_args)
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_email_failure(self, mock_post, mailgun_service):
         """Test email sending failure."""
         mock_post.side_effect = requests.RequestException("Connection error")
@@ -77,7 +77,7 @@ class TestMailgunService:
 
     def test_send_email_no_api_key(self):
         """Test email sending without API key."""
-        with patch("app.core.config.settings") as mock_settings:
+        with patch("app.services.mailgun.settings") as mock_settings:
             mock_settings.mailgun_api_key = None
             mock_settings.mailgun_domain = None
             service = MailgunService()
@@ -90,7 +90,7 @@ class TestMailgunService:
 
             assert result is None
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_contact_form_email_success(self, mock_post, mailgun_service):
         """Test successful contact form email sending."""
         mock_response = MagicMock()
@@ -110,7 +110,7 @@ class TestMailgunService:
         # Should be called twice: once for admin, once for user
         assert mock_post.call_count == 2
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_contact_form_email_with_optional_fields(
         self, mock_post, mailgun_service
     ):
@@ -138,7 +138,7 @@ class TestMailgunService:
         assert "Textiles" in call_args_str
         assert "Más de 10,000 unidades (opcional)" in call_args_str
         
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_contact_form_email_admin_fails(self, mock_post, mailgun_service):
         """Test contact form when admin email fails."""
         mock_post.side_effect = requests.RequestException("Connection error")
@@ -153,7 +153,7 @@ class TestMailgunService:
 
         assert result is False
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_contact_form_email_user_confirmation_fails(
         self, mock_post, mailgun_service
     ):
@@ -181,7 +181,7 @@ class TestMailgunService:
         # Should still return True as admin email succeeded
         assert result is True
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_welcome_email(self, mock_post, mailgun_service):
         """Test welcome email sending."""
         mock_response = MagicMock()
@@ -196,7 +196,7 @@ class TestMailgunService:
         assert result is True
         mock_post.assert_called_once()
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_template_email(self, mock_post, mailgun_service):
         """Test template email sending."""
         mock_response = MagicMock()
@@ -214,7 +214,7 @@ class TestMailgunService:
         call_args = mock_post.call_args
         assert "test-template" in str(call_args)
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_email_with_reply_to(self, mock_post, mailgun_service):
         """Test sending email with reply-to header."""
         mock_response = MagicMock()
@@ -235,7 +235,7 @@ class TestMailgunService:
         assert "h:Reply-To" in call_data
         assert call_data["h:Reply-To"] == "reply@example.com"
 
-    @patch("app.services.mailgun.requests.post")
+    @patch("app.services.mailgun.requests.Session.post")
     def test_send_email_with_cc_bcc(self, mock_post, mailgun_service):
         """Test sending email with CC and BCC."""
         mock_response = MagicMock()
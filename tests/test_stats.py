@@ -0,0 +1,291 @@
+"""
+Test cases for submission statistics.
+
+This module tests the response cache, the incremental daily rollup and
+its watermark, the stats endpoint and the rollup job.
+"""
+
+from datetime import date, datetime
+
+import pymysql
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.v1 import stats
+from app.core import cache, database
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.jobs import rollup
+from app.main import create_app
+from app.models.client import Client
+from app.models.stats import RollupWatermark
+from app.repositories import stats_repository
+from app.repositories.stats_repository import StatsRepository, ensure_watermark
+
+API_KEY = "dashboard-key"
+AUTH = {"Authorization": f"Bearer {API_KEY}"}
+
+
+def make_clients(*specs):
+    """Build clients from (day, product_type, company) tuples."""
+    return [
+        Client(
+            full_name=f"Cliente {i}",
+            email=f"cliente{i}@example.com",
+            phone="+52 123 456 7890",
+            product_type=product_type,
+            company=company,
+            message="Mensaje",
+            created_at=datetime.combine(day, datetime.min.time()).replace(hour=12),
+            updated_at=datetime.combine(day, datetime.min.time()).replace(hour=12),
+        )
+        for i, (day, product_type, company) in enumerate(specs)
+    ]
+
+
+JAN_1 = date(2024, 1, 1)
+JAN_2 = date(2024, 1, 2)
+
+
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_entries_expire(self, monkeypatch):
+        """Test that an entry is dropped once its time is up."""
+        now = [100.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        entries = TTLCache(ttl=10)
+        entries.set("a", 1)
+
+        now[0] = 109.0
+        assert entries.get("a") == 1
+        now[0] = 110.0
+        assert entries.get("a") is None
+
+    def test_evicts_oldest(self):
+        """Test that the cache never grows beyond maxsize."""
+        entries = TTLCache(ttl=10, maxsize=2)
+        for key in "abc":
+            entries.set(key, key)
+
+        assert [entries.get(key) for key in "abc"] == [None, "b", "c"]
+
+
+class TestStatsRepository:
+    """Test suite for the rollup and its queries."""
+
+    def test_catch_up_is_incremental(self, test_db: Session):
+        """Test counting, grouping and resuming from the watermark."""
+        test_db.add_all(
+            make_clients(
+                (JAN_1, "Textiles", "Acme"),
+                (JAN_1, "Textiles", "Acme"),
+                (JAN_1, None, None),
+                (JAN_2, "Hilos", "Acme"),
+            )
+        )
+        test_db.commit()
+        repo = StatsRepository(test_db)
+
+        assert repo.catch_up(batch_size=3) == 4
+        assert repo.catch_up() == 0
+        assert repo.submissions(JAN_1, JAN_2) == [
+            {"day": JAN_1, "submissions": 3},
+            {"day": JAN_2, "submissions": 1},
+        ]
+        assert repo.submissions(JAN_1, JAN_2, ["product_type", "company"]) == [
+            {"product_type": None, "company": None, "submissions": 1},
+            {"product_type": "Hilos", "company": "Acme", "submissions": 1},
+            {"product_type": "Textiles", "company": "Acme", "submissions": 2},
+        ]
+
+        test_db.add_all(make_clients((JAN_2, "Hilos", "Acme")))
+        test_db.commit()
+        assert repo.catch_up() == 1
+        assert repo.submissions(JAN_2, JAN_2, ["day", "product_type"]) == [
+            {"day": JAN_2, "product_type": "Hilos", "submissions": 2}
+        ]
+        assert test_db.get(RollupWatermark, "client_daily_stats").last_id == 5
+
+    def test_recent_clients_wait_to_settle(self, test_db: Session):
+        """Test that clients younger than the settle time are left for later."""
+        test_db.add(
+            Client(
+                full_name="Nuevo",
+                email="nuevo@example.com",
+                phone="1234567890",
+                message="Mensaje",
+            )
+        )
+        test_db.commit()
+        repo = StatsRepository(test_db)
+
+        assert repo.catch_up(settle_seconds=3600) == 0
+        assert repo.catch_up(settle_seconds=0) == 1
+
+    def test_concurrent_first_runs_share_the_watermark(
+        self, test_db: Session, monkeypatch
+    ):
+        """Test that a watermark created by another run is not inserted again."""
+        test_db.add(RollupWatermark(name="client_daily_stats", last_id=3))
+        test_db.commit()
+        # The other run inserts the row after this one found none
+        monkeypatch.setattr(test_db, "scalar", lambda statement: None)
+
+        assert ensure_watermark(test_db, "client_daily_stats") == 3
+
+    def test_catch_up_retries_deadlocks(self, test_db: Session, monkeypatch):
+        """Test that a deadlocked batch is rolled back and run again."""
+        test_db.add_all(make_clients((JAN_1, None, None)))
+        test_db.commit()
+        monkeypatch.setattr(settings, "db_retry_base_delay", 0.0)
+        roll_up_batch = stats_repository._roll_up_batch
+        calls = []
+
+        def deadlocking_batch(session, *args):
+            calls.append(1)
+            if len(calls) == 1:
+                raise OperationalError(
+                    "INSERT", {}, pymysql.err.OperationalError(1213, "Deadlock")
+                )
+            return roll_up_batch(session, *args)
+
+        monkeypatch.setattr(stats_repository, "_roll_up_batch", deadlocking_batch)
+
+        assert StatsRepository(test_db).catch_up() == 1
+        assert len(calls) == 2
+
+    async def test_async(self, async_test_db: AsyncSession):
+        """Test the asynchronous methods."""
+        async_test_db.add_all(make_clients((JAN_1, "Textiles", None)))
+        await async_test_db.commit()
+        repo = StatsRepository(async_test_db)
+
+        assert await repo.catch_up_async() == 1
+        assert await repo.submissions_async(JAN_1, JAN_1, ["company"]) == [
+            {"company": None, "submissions": 1}
+        ]
+
+
+class TestSubmissionStatsAPI:
+    """Test suite for GET /api/v1/stats/submissions."""
+
+    @pytest.fixture
+    async def api(self, monkeypatch, async_test_db: AsyncSession):
+        """Create an app with the stats API on the test database."""
+        monkeypatch.setattr(settings, "admin_api_key", API_KEY)
+        stats.submissions_cache.clear()
+        app = create_app()
+
+        async def override_get_async_db():
+            yield async_test_db
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            yield client
+        stats.submissions_cache.clear()
+
+    async def test_counts_and_caches(self, api: AsyncClient, async_test_db):
+        """Test the grouped counts and that repeated queries are cached."""
+        async_test_db.add_all(
+            make_clients((JAN_1, "Textiles", "Acme"), (JAN_2, "Hilos", None))
+        )
+        await async_test_db.commit()
+        url = "/api/v1/stats/submissions?from=2024-01-01&to=2024-01-31"
+
+        response = await api.get(f"{url}&group_by=product_type", headers=AUTH)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "from": "2024-01-01",
+            "to": "2024-01-31",
+            "group_by": ["product_type"],
+            "results": [
+                {"product_type": "Hilos", "submissions": 1},
+                {"product_type": "Textiles", "submissions": 1},
+            ],
+        }
+        assert response.headers["cache-control"].startswith("private, max-age=")
+
+        async_test_db.add_all(make_clients((JAN_1, "Textiles", "Acme")))
+        await async_test_db.commit()
+        cached = await api.get(f"{url}&group_by=product_type", headers=AUTH)
+        fresh = await api.get(url, headers=AUTH)
+
+        assert cached.json() == response.json()
+        assert fresh.json()["results"] == [
+            {"day": "2024-01-01", "submissions": 2},
+            {"day": "2024-01-02", "submissions": 1},
+        ]
+
+        by_company = await api.get(f"{url}&group_by=company", headers=AUTH)
+
+        assert by_company.json()["results"] == [
+            {"company": None, "submissions": 1},
+            {"company": "Acme", "submissions": 2},
+        ]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "from=2024-02-01&to=2024-01-01",
+            "from=2020-01-01&to=2024-01-01",
+            "group_by=email",
+        ],
+    )
+    async def test_invalid_queries(self, api: AsyncClient, query: str):
+        """Test that bad ranges and groupings are rejected."""
+        response = await api.get(f"/api/v1/stats/submissions?{query}", headers=AUTH)
+
+        assert response.status_code == 400
+
+    async def test_failed_rollup_answers_from_counted(
+        self, api: AsyncClient, async_test_db, monkeypatch
+    ):
+        """Test that a rollup error is logged and the counted rows are served."""
+        async_test_db.add_all(make_clients((JAN_1, None, None)))
+        await async_test_db.commit()
+        await StatsRepository(async_test_db).catch_up_async(settle_seconds=0)
+        async_test_db.add_all(make_clients((JAN_1, None, "Acme")))
+        await async_test_db.commit()
+
+        async def failing_catch_up(self, **options):
+            # Fails like a duplicate watermark insert would
+            await self.db.execute(
+                RollupWatermark.__table__.insert().values(name="client_daily_stats")
+            )
+
+        monkeypatch.setattr(StatsRepository, "catch_up_async", failing_catch_up)
+        response = await api.get(
+            "/api/v1/stats/submissions?from=2024-01-01&to=2024-01-01", headers=AUTH
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [{"day": "2024-01-01", "submissions": 1}]
+
+    async def test_requires_api_key(self, api: AsyncClient):
+        """Test that the stats share the admin API key."""
+        response = await api.get("/api/v1/stats/submissions")
+
+        assert response.status_code == 401
+
+
+class TestRollupJob:
+    """Test suite for the rollup job entry point."""
+
+    def test_main_catches_up(self, monkeypatch, test_engine, test_db: Session):
+        """Test that the job counts the backlog."""
+        test_db.add_all(make_clients((JAN_1, None, None), (JAN_2, None, None)))
+        test_db.commit()
+        monkeypatch.setattr(
+            database, "SessionLocal", sessionmaker(bind=test_engine), raising=False
+        )
+
+        assert rollup.main(["--batch-size", "1"]) == 0
+        assert StatsRepository(test_db).submissions(JAN_1, JAN_2, ["company"]) == [
+            {"company": None, "submissions": 2}
+        ]
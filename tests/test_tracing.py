@@ -0,0 +1,203 @@
+"""
+Test cases for request tracing.
+
+This module tests traceparent parsing, sampling, span nesting across
+the middleware, repository and Mailgun service, and the exporters.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from app.core import tracing
+from app.core.tracing import (
+    InMemoryExporter,
+    JsonLinesExporter,
+    Tracer,
+    parse_traceparent,
+    traced,
+)
+from app.middleware.tracing import TracingMiddleware
+from app.repositories.client_repository import ClientRepository
+from app.services.mailgun import MailgunService
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """Record every span of the global tracer in memory."""
+    exporter = InMemoryExporter()
+    monkeypatch.setattr(tracing.tracer, "exporters", [exporter])
+    monkeypatch.setattr(tracing.tracer, "sample_rate", 1.0)
+    return exporter
+
+
+class TestTraceparent:
+    """Test suite for W3C traceparent parsing."""
+
+    def test_valid_header(self):
+        """Test that trace ID, parent ID and sampled flag are read."""
+        header = f"00-{TRACE_ID}-{PARENT_ID}-01"
+
+        assert parse_traceparent(header) == (TRACE_ID, PARENT_ID, True)
+        assert parse_traceparent(header[:-1] + "0")[2] is False
+
+    def test_invalid_headers(self):
+        """Test that malformed and all-zero IDs are ignored."""
+        assert parse_traceparent(None) is None
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+
+
+class TestTracer:
+    """Test suite for Tracer."""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that without exporters every span is a no-op."""
+        tracer = Tracer(sample_rate=1.0)
+
+        with tracer.start_trace("GET /") as root, tracer.span("child") as child:
+            assert root.traceparent is None
+            assert child.traceparent is None
+
+    def test_unsampled_trace_records_nothing(self):
+        """Test that a sample rate of zero skips new traces."""
+        exporter = InMemoryExporter()
+        tracer = Tracer(sample_rate=0.0, exporters=[exporter])
+
+        with tracer.start_trace("GET /"), tracer.span("child"):
+            pass
+
+        assert exporter.spans == []
+
+    def test_children_nest_under_root(self):
+        """Test that child spans share the trace and point at their parent."""
+        exporter = InMemoryExporter()
+        tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+
+        with tracer.start_trace("GET /") as root:
+            with tracer.span("outer", {"k": "v"}) as outer:
+                with tracer.span("inner"):
+                    pass
+
+        inner_span, outer_span, root_span = exporter.spans
+        assert root_span.parent_id is None
+        assert outer_span.parent_id == root.span_id
+        assert inner_span.parent_id == outer.span_id
+        assert {s.trace_id for s in exporter.spans} == {root.trace_id}
+        assert outer_span.attributes == {"k": "v"}
+
+    def test_incoming_trace_is_continued(self):
+        """Test that a sampled traceparent wins over the sample rate."""
+        exporter = InMemoryExporter()
+        tracer = Tracer(sample_rate=0.0, exporters=[exporter])
+
+        with tracer.start_trace("GET /", f"00-{TRACE_ID}-{PARENT_ID}-01"):
+            pass
+
+        assert exporter.spans[0].trace_id == TRACE_ID
+        assert exporter.spans[0].parent_id == PARENT_ID
+
+    def test_errors_are_recorded(self):
+        """Test that a failing span records the exception type."""
+        exporter = InMemoryExporter()
+        tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+
+        with pytest.raises(ValueError):
+            with tracer.start_trace("GET /"):
+                raise ValueError("boom")
+
+        assert exporter.spans[0].error == "ValueError"
+
+    async def test_traced_decorator(self, exporter):
+        """Test that decorated sync and async functions open spans."""
+
+        @traced("job")
+        async def run_async():
+            return 1
+
+        @traced("job")
+        def run_sync():
+            return 2
+
+        with tracing.tracer.start_trace("root"):
+            assert await run_async() == 1
+            assert run_sync() == 2
+
+        assert [s.name for s in exporter.spans] == [
+            "job.run_async",
+            "job.run_sync",
+            "root",
+        ]
+
+
+class TestJsonLinesExporter:
+    """Test suite for JsonLinesExporter."""
+
+    def test_spans_are_written_as_json_lines(self, tmp_path):
+        """Test that spans end up in the file after shutdown."""
+        path = tmp_path / "spans.jsonl"
+        exporter = JsonLinesExporter(str(path))
+        tracer = Tracer(sample_rate=1.0, exporters=[exporter])
+
+        with tracer.start_trace("GET /"), tracer.span("child"):
+            pass
+        tracer.shutdown()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["child", "GET /"]
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+
+class TestTracePropagation:
+    """Test suite for spans across the app, repository and Mailgun."""
+
+    def test_request_repository_and_mailgun_spans(self, exporter, test_db):
+        """Test that one request yields one trace with nested spans."""
+        app = FastAPI()
+
+        @app.get("/clients/{email}")
+        def lookup(email: str):
+            ClientRepository(test_db).get_by_email(email)
+            service = MailgunService()
+            service.api_key, service.domain = "key", "test.mailgun.org"
+            with patch("app.services.mailgun.requests.Session.post") as post:
+                post.return_value = MagicMock(status_code=200)
+                service.send_email(to_emails=[email], subject="Hi", text="x")
+            return {"traceparent": post.call_args.kwargs["headers"]["traceparent"]}
+
+        app.add_middleware(TracingMiddleware)
+        response = TestClient(app).get(
+            "/clients/juan@example.com",
+            headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"},
+        )
+
+        spans = {span.name: span for span in exporter.spans}
+        root = spans["GET /clients/juan@example.com"]
+        assert set(spans) == {root.name, "repository.get_by_email", "mailgun.post"}
+        assert {span.trace_id for span in spans.values()} == {TRACE_ID}
+        assert root.parent_id == PARENT_ID
+        assert root.attributes["http.route"] == "/clients/{email}"
+        assert root.attributes["http.status_code"] == 200
+        assert spans["repository.get_by_email"].parent_id == root.span_id
+        mailgun = spans["mailgun.post"]
+        assert mailgun.attributes == {
+            "operation": "send_email",
+            "http.status_code": 200,
+        }
+        assert response.json()["traceparent"] == mailgun.traceparent
+
+    def test_untraced_mailgun_call_sends_no_header(self):
+        """Test that nothing is added to requests outside a trace."""
+        service = MailgunService()
+        service.api_key, service.domain = "key", "test.mailgun.org"
+
+        with patch("app.services.mailgun.requests.Session.post") as post:
+            service.send_email(to_emails=["a@example.com"], subject="Hi", text="x")
+
+        assert post.call_args.kwargs["headers"] is None
@@ -0,0 +1,113 @@
+"""
+Test cases for application warm-up.
+
+This module tests the warm-up report, each warm-up step and the
+error handling that keeps startup alive when a dependency is down.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core import warmup
+from app.core.warmup import WarmupReport, is_lambda_runtime, warm_up
+
+
+class TestWarmupReport:
+    """Test suite for WarmupReport."""
+
+    def test_summary_lists_steps(self):
+        """Test that the summary includes every step outcome."""
+        report = WarmupReport(
+            total_ms=12.5,
+            steps={"schemas": 3.25},
+            errors={"database": "refused"},
+            skipped=["mailgun"],
+        )
+
+        summary = report.summary()
+
+        assert summary.startswith("12.5ms")
+        assert "schemas=3.2ms" in summary or "schemas=3.3ms" in summary
+        assert "database=failed" in summary
+        assert "mailgun=skipped" in summary
+
+
+class TestWarmup:
+    """Test suite for the warm-up routine."""
+
+    def test_is_lambda_runtime(self, monkeypatch):
+        """Test Lambda runtime detection."""
+        monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+        assert is_lambda_runtime() is False
+
+        monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "zititex-api-prod-api")
+        assert is_lambda_runtime() is True
+
+    def test_warm_up_schemas(self):
+        """Test that schema warm-up runs without errors."""
+        warmup.warm_up_schemas()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_skips_unconfigured_services(self):
+        """Test that warm-up skips the database and unconfigured Mailgun."""
+        with patch("app.services.mailgun.mailgun_service.warm_up", return_value=False):
+            report = await warm_up(db_connections=0)
+
+        assert "schemas" in report.steps
+        assert set(report.skipped) == {"database", "mailgun"}
+        assert report.errors == {}
+        assert report.total_ms > 0
+
+    @pytest.mark.asyncio
+    async def test_warm_up_records_failures(self):
+        """Test that a failing step is reported instead of raised."""
+
+        async def failing_database(connections: int) -> int:
+            raise ConnectionError("Can't connect to MySQL server")
+
+        with patch.object(warmup, "warm_up_database", failing_database), patch(
+            "app.services.mailgun.mailgun_service.warm_up", return_value=True
+        ):
+            report = await warm_up(db_connections=2)
+
+        assert "Can't connect" in report.errors["database"]
+        assert "mailgun" in report.steps
+        assert "schemas" in report.steps
+
+    @pytest.mark.asyncio
+    async def test_warm_up_database_opens_connections(self):
+        """Test that database warm-up leaves open connections in the pool."""
+        engine = create_async_engine(
+            "sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool, pool_size=5
+        )
+        pool = engine.pool
+        try:
+            with patch("app.core.database.async_engine", engine):
+                opened = await warmup.warm_up_database(2)
+
+            assert opened == 2
+            assert pool.checkedin() == 2
+            assert pool.checkedout() == 0
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_times_out_slow_steps(self):
+        """Test that a hanging step is abandoned and reported."""
+
+        async def hanging_database(connections: int) -> int:
+            await asyncio.sleep(60)
+            return connections
+
+        with patch.object(warmup, "warm_up_database", hanging_database), patch(
+            "app.services.mailgun.mailgun_service.warm_up", return_value=True
+        ):
+            report = await warm_up(db_connections=2, timeout=0.05)
+
+        assert report.errors["database"] == "timed out after 0.05s"
+        assert "mailgun" in report.steps
+        assert report.total_ms < 1000